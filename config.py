@@ -9,6 +9,34 @@ class Config:
     LLM_API_KEY = os.getenv("LLM_API_KEY", "your-gemini-key") 
     LLM_MODEL = os.getenv("LLM_MODEL", "gemini-2.0-flash")
     SERPAPI_KEY = os.getenv("SERPAPI_KEY", None)
+
+    # LLM response cache (SQLite): on/off, file, entry TTL in seconds, size budget before LRU eviction
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE", "1") != "0"
+    LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "data/llm_cache.sqlite")
+    LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", 7 * 24 * 3600))
+    LLM_CACHE_MAX_MB = float(os.getenv("LLM_CACHE_MAX_MB", 256))
+
+    # Shared LLM rate limiter: requests per minute (0 = unlimited), burst size, simultaneous calls
+    LLM_RPM = float(os.getenv("LLM_RPM", 120))
+    LLM_BURST = int(os.getenv("LLM_BURST", 10))
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", 4))
     
     # System Settings
     DEBUG_MODE = True
+
+    # Process-wide query embedding LRU (entries)
+    EMBED_CACHE_SIZE = int(os.getenv("EMBED_CACHE_SIZE", 2048))
+
+    # Kernel block cache (LRU): entry and byte bounds (0 = unbounded), always-resident keys
+    BLOCK_CACHE_MAX_ITEMS = int(os.getenv("BLOCK_CACHE_MAX_ITEMS", 4096))
+    BLOCK_CACHE_MAX_MB = float(os.getenv("BLOCK_CACHE_MAX_MB", 256))
+    BLOCK_CACHE_PIN = [k.strip() for k in os.getenv("BLOCK_CACHE_PIN", "").split(",") if k.strip()]
+
+    # process_query: threads for the stages that only need the raw query (parse, strategy recall)
+    QUERY_STAGE_WORKERS = int(os.getenv("QUERY_STAGE_WORKERS", 4))
+
+    # Logic-engine prompt: estimated token budget for the packed memory blocks
+    CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", 1500))
+
+    # Final answers cached per (corpus version, normalized query); 0 = off
+    ANSWER_CACHE_SIZE = int(os.getenv("ANSWER_CACHE_SIZE", 1024))
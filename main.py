@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 from termcolor import colored
 from server.telemetry import telemetry
 
@@ -8,14 +9,44 @@ def tprint(text, color="white"):
     print(colored(text, color))
     telemetry.log(text, color=color)
 
-# Import Systems
-from system_a_cognitive.logic.models import ConceptBlock, ConceptID
-from system_a_cognitive.epistemic.gate import EpistemicGate
-from system_b_llm.parsers.query_parser import QueryParser
-from system_b_llm.generators.response_generator import ResponseGenerator
+from server.startup_profile import startup_profile
 
-from config import Config
-from system_b_llm.interfaces.gemini_client import GeminiClient
+# Import Systems (heavy ones -- numpy, google-genai, chromadb -- are deferred to first use)
+with startup_profile.measure("import", "concept memory"):
+    from system_a_cognitive.logic.models import ConceptBlock, ConceptID
+    from system_a_cognitive.memory.concept_corpus import concept_filename, get_concept_corpus
+    from system_a_cognitive.memory.id_index import ConceptIdIndex
+    from system_a_cognitive.memory.bm25_index import BM25Index, reciprocal_rank_fusion
+    from system_a_cognitive.memory.block_cache import BlockCache
+    from system_a_cognitive.memory.answer_cache import AnswerCache, SingleFlight, normalize_query
+    from system_a_cognitive.memory.corpus_version import get_corpus_version
+with startup_profile.measure("import", "epistemic gate"):
+    from system_a_cognitive.epistemic.gate import EpistemicGate
+with startup_profile.measure("import", "config"):
+    from config import Config
+
+class lazy_subsystem:
+    """
+    Kernel attribute built on first access instead of in __init__, so startup
+    only pays for what a request actually touches. The build is timed into
+    the startup profile; assigning the attribute overrides it.
+    """
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = factory.__name__
+        self._lock = threading.RLock() # Per attribute: a slow vector store does not block the LLM client
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        with self._lock:
+            if self.name not in obj.__dict__:
+                with startup_profile.measure("lazy", self.name):
+                    obj.__dict__[self.name] = self.factory(obj)
+            return obj.__dict__[self.name]
 
 class LazyBlockDict:
     """Proxy to handle legacy self.blocks access lazily."""
@@ -50,76 +81,209 @@ class LazyBlockDict:
             yield (key, self.kernel.get_block(key))
 
 class WMCS_Kernel:
-    def __init__(self):
-        self.block_cache = {} # Lazy Loaded Blocks (RAM)
+    def __init__(self, lazy: bool = True):
+        self.block_cache = BlockCache(
+            max_items=Config.BLOCK_CACHE_MAX_ITEMS,
+            max_bytes=int(Config.BLOCK_CACHE_MAX_MB * 1024 * 1024)
+        ) # Lazy Loaded Blocks (RAM, LRU-bounded)
+        for key in Config.BLOCK_CACHE_PIN:
+            self.pin_block(key)
         self.file_map = {}    # Name -> FilePath Map
         self.blocks = LazyBlockDict(self) # Backward Compatibility Proxy
         
-        # Initialize LLM Client
+        # LLM client, parser/generator, vector memory, ingestion and identity
+        # are lazy_subsystem attributes (see below): built on first use.
+        self.gate = EpistemicGate()
+        self.memory_path = "data"
+        self.corpus = get_concept_corpus(os.path.join(self.memory_path, "concepts")) # Shared parse cache
+        self.id_index = ConceptIdIndex(
+            os.path.join(self.memory_path, "concepts"),
+            os.path.join(self.memory_path, "id_index.json")
+        ) # "G,I" -> File Map (persistent)
+        self.lexical_index = BM25Index(
+            os.path.join(self.memory_path, "concepts"),
+            os.path.join(self.memory_path, "bm25_index.json")
+        ) # Names/definitions/claims -> BM25 (persistent)
+        self.corpus_version = get_corpus_version(os.path.join(self.memory_path, "concepts")) # Bumped by every corpus write
+        self.answer_cache = AnswerCache(max_entries=Config.ANSWER_CACHE_SIZE) # (version, query) -> answer
+        self.single_flight = SingleFlight() # Identical in-flight queries run once
+        self.status = "Idle" # UI Feedback Loop
+        self._event_sink = threading.local() # Per-request stage event callback (streaming API)
+        self.writer = None # Multi-worker mode: WriterClient that owns /teach and research ingestion
+        self.snapshot_follower = None # ... and the SnapshotFollower tracking its published version
+        if not lazy:
+            self.load_subsystems()
+
+    # --- Lazily constructed subsystems ---
+
+    @lazy_subsystem
+    def llm_client(self):
         try:
-            self.llm_client = GeminiClient(
+            from system_b_llm.interfaces.gemini_client import GeminiClient
+            client = GeminiClient(
                 api_key=Config.LLM_API_KEY,
                 model=Config.LLM_MODEL
             )
             print(colored(f"Gemini Client Connected: {Config.LLM_MODEL}", "green"))
+            return client
         except Exception as e:
             print(colored(f"Gemini Client Failed: {e}. Using Fallback.", "red"))
-            self.llm_client = None
+            return None
 
-        self.parser = QueryParser(self.llm_client)
-        self.gate = EpistemicGate()
-        self.generator = ResponseGenerator(self.llm_client)
-        
+    @lazy_subsystem
+    def parser(self):
+        from system_b_llm.parsers.query_parser import QueryParser
+        return QueryParser(self.llm_client)
+
+    @lazy_subsystem
+    def generator(self):
+        from system_b_llm.generators.response_generator import ResponseGenerator
+        return ResponseGenerator(self.llm_client)
+
+    @lazy_subsystem
+    def func_search(self):
         from system_a_cognitive.logic.functional_search import FunctionalSearcher
-        self.func_search = FunctionalSearcher()
-        
-        # VECTOR MEMORY
+        return FunctionalSearcher()
+
+    @lazy_subsystem
+    def vector_store(self):
+        # VECTOR MEMORY (one Chroma client + embedding model for both stores)
         from system_a_cognitive.memory.chroma_store import ChromaStore
-        self.vector_store = ChromaStore()
+        from system_a_cognitive.memory.chroma_registry import warm_up_embedding_function
+        store = ChromaStore()
+        warm_up_embedding_function() # Load the ONNX model in the background, not on the first query
+        return store
 
-        # INGESTION & IDENTITY
-        from system_a_cognitive.ingestion.ingestor import ContentIngestor
+    @lazy_subsystem
+    def strategy_store(self):
+        try:
+            from system_a_cognitive.memory.strategy_store import StrategyStore
+            return StrategyStore()
+        except Exception as e:
+            print(colored(f"Strategy Store unavailable: {e}", "yellow"))
+            return None
+
+    @lazy_subsystem
+    def identity_manager(self):
         from system_a_cognitive.logic.identity import IdentityManager
-        
-        self.identity_manager = IdentityManager()
-        self.ingestor = ContentIngestor(identity_manager=self.identity_manager)
-        self.memory_path = "data"
-        self.status = "Idle" # UI Feedback Loop
+        return IdentityManager()
+
+    @lazy_subsystem
+    def ingestor(self):
+        from system_a_cognitive.ingestion.ingestor import ContentIngestor
+        return ContentIngestor(identity_manager=self.identity_manager, client=self.llm_client)
 
-    def load_data(self, force=False):
+    @lazy_subsystem
+    def stage_pool(self):
+        from concurrent.futures import ThreadPoolExecutor
+        return ThreadPoolExecutor(max_workers=Config.QUERY_STAGE_WORKERS, thread_name_prefix="query-stage")
+
+    @lazy_subsystem
+    def context_packer(self):
+        from system_a_cognitive.logic.context_packer import ContextPacker
+        return ContextPacker(max_tokens=Config.CONTEXT_TOKEN_BUDGET)
+
+    LAZY_SUBSYSTEMS = ("llm_client", "parser", "generator", "vector_store", "strategy_store",
+                       "identity_manager", "ingestor", "func_search")
+
+    def load_subsystems(self, names=None):
+        """Build lazy subsystems now (eager mode / pre-warming a worker)."""
+        for name in names or self.LAZY_SUBSYSTEMS:
+            getattr(self, name)
+
+    def load_data(self, force=False, vectors=True):
+        """Map the concept files, catch the ID/lexical indexes up and (unless vectors=False) sync the vector index."""
         tprint("Step 0: Mapping Concept Blocks (Lazy Load)...", "cyan")
         
         # 1. Map Files (No content reading)
-        base_path = "data/concepts"
-        if not os.path.exists(base_path): return
-
-        count = 0
-        self.file_map = {}
-        for filename in os.listdir(base_path):
-            if not filename.endswith(".json"): continue
-            # Heuristic: filename 'cat_paw.json' -> key 'cat_paw'
-            # This matches our ingestion sanitization: name.lower().replace(' ', '_')
-            key = filename.replace(".json", "")
-            self.file_map[key] = os.path.join(base_path, filename)
-            count += 1
-        
+        if not os.path.exists("data/concepts"): return
+        count = self._map_files()
         tprint(f"  Mapped {count} Concept Files.", "green")
 
+        # 1.5 ID Index (only new/changed files are opened)
+        parsed = self.id_index.build()
+        tprint(f"  ID Index: {len(self.id_index)} IDs ({parsed} files re-read).", "green")
+        tokenized = self.lexical_index.build()
+        tprint(f"  Lexical Index: {len(self.lexical_index)} concepts ({tokenized} files re-tokenized).", "green")
+
         # 2. Vector Indexing
+        if vectors:
+            self.sync_vectors(force=force)
+
+    def sync_vectors(self, force=False):
+        """Diff data/concepts against the vector index manifest and re-embed only what changed."""
         tprint("Step 0.5: Checking Vector Index...", "cyan")
-        # Chroma is persistent. Check count.
-        db_count = self.vector_store.count()
-        file_count = count
-        
-        print(colored(f"  > DB has {db_count} vectors. Disk has {file_count} JSONs.", "white"))
-        
-        if force or db_count < file_count:
-            print(colored(f"  > Index Outdated (DB:{db_count} vs Disk:{file_count}). Syncing JSONs...", "yellow"))
-            # Optimized: ContentIngestor handles the heavy lifting
-            self.ingestor.ingest_all(self.memory_path, self.vector_store)
-            print(colored("  > Sync Complete.", "green"))
-            print(colored("  > Vector DB ready (Persistent).", "green"))
+        # Chroma is persistent. Diff the directory against the index manifest
+        # and re-embed only new/edited concepts.
+        from system_a_cognitive.memory.index_sync import sync_vector_index
+        sync = sync_vector_index(
+            self.vector_store,
+            os.path.join(self.memory_path, "concepts"),
+            os.path.join(self.memory_path, "chroma_db.manifest.json"),
+            force=force
+        )
+        if sync["adopted"]:
+            print(colored(f"  > Existing index adopted ({self.vector_store.count()} vectors); manifest recorded.", "white"))
+        elif sync["added"] or sync["updated"] or sync["removed"]:
+            print(colored(f"  > Synced: +{sync['added']} new, ~{sync['updated']} changed, -{sync['removed']} removed.", "yellow"))
+        else:
+            print(colored(f"  > Index up to date ({sync['unchanged']} concepts).", "white"))
+        print(colored("  > Vector DB ready (Persistent).", "green"))
     
+    def _map_files(self) -> int:
+        base_path = "data/concepts"
+        file_map = {}
+        for filename in self.corpus.files():
+            # Heuristic: filename 'cat_paw.json' -> key 'cat_paw'
+            # This matches our ingestion sanitization: name.lower().replace(' ', '_')
+            key = filename.replace(".json", "")
+            file_map[key] = os.path.join(base_path, filename)
+        self.file_map = file_map
+        return len(file_map)
+
+    # --- Multi-worker snapshots ---
+
+    def refresh_snapshot(self):
+        """
+        Pick up concepts written by another process (the writer): drop stale
+        parses and cached blocks, re-map files and rebuild the ID/lexical
+        indexes from their sidecars. The new indexes are built aside and
+        swapped in, so a request running meanwhile never sees a half-built
+        one. Only blocks whose file changed or vanished leave the block cache.
+        Never writes the corpus, the vector index or the sidecars.
+        """
+        stale = set(self.corpus.invalidate_stale())
+        count = self._map_files()
+        id_index = ConceptIdIndex(self.id_index.concepts_dir, self.id_index.index_path)
+        parsed = id_index.build(save=False)
+        # Cached blocks are read past the corpus cache: compare file mtimes across the two ID indexes
+        stale.update(fname for fname, entry in self.id_index.entries.items()
+                     if id_index.entries.get(fname, {}).get("mtime") != entry.get("mtime"))
+        for fname in stale:
+            self.block_cache.pop(fname[:-len(".json")])
+        lexical_index = BM25Index(self.lexical_index.concepts_dir, self.lexical_index.index_path,
+                                  k1=self.lexical_index.k1, b=self.lexical_index.b,
+                                  name_boost=self.lexical_index.name_boost)
+        tokenized = lexical_index.build(save=False)
+        self.id_index, self.lexical_index = id_index, lexical_index
+        tprint(f"  Snapshot refreshed: {count} concepts ({len(stale)} stale, {max(parsed, tokenized)} re-read).", "white")
+
+    def _follow_writer(self):
+        """After a write through the writer: refresh once, via the follower so the next request does not again."""
+        if self.snapshot_follower is not None:
+            self.snapshot_follower.sync()
+        else:
+            self.refresh_snapshot()
+
+    def reset_after_fork(self):
+        """
+        In a forked worker: forget subsystems holding connections, threads or
+        native sessions (LLM client, Chroma stores, stage pool); they are
+        rebuilt lazily in this process. Loaded indexes and the corpus stay shared.
+        """
+        for name in self.LAZY_SUBSYSTEMS + ("stage_pool",):
+            self.__dict__.pop(name, None)
+
     def get_block(self, name_or_key: str):
         """Lazy load a block by name."""
         if not name_or_key: return None
@@ -128,31 +292,113 @@ class WMCS_Kernel:
         key = name_or_key.lower().replace(" ", "_")
         
         # 1. Check RAM Cache
-        if key in self.block_cache:
-            return self.block_cache[key]
+        data = self.block_cache.get(key)
+        if data is not None:
+            return data
             
-        # 2. Check File Map
+        # 2. Check File Map (read through the corpus; only the bounded cache keeps it)
         if key in self.file_map:
-            try:
-                with open(self.file_map[key], "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.block_cache[key] = data # Cache it
-                    return data
-            except Exception as e:
-                print(colored(f"  [Error] Failed to lazy load {key}: {e}", "red"))
+            fpath = self.file_map[key]
+            data = self.corpus.read(os.path.basename(fpath))
+            if data is None:
+                print(colored(f"  [Error] Failed to lazy load {key}: {self.corpus.errors.get(os.path.basename(fpath))}", "red"))
                 return None
+            try:
+                nbytes = os.path.getsize(fpath)
+            except OSError:
+                nbytes = None
+            self.block_cache.put(key, data, nbytes) # Cache it
+            return data
         
         return None
 
+    def pin_block(self, name_or_key: str):
+        """Keep a hot concept resident in the block cache (never evicted)."""
+        self.block_cache.pin(name_or_key.lower().replace(" ", "_"))
+
+    def get_block_by_id(self, id_str: str):
+        """Lazy load a block by its 'G,I' ID string."""
+        fname = self.id_index.resolve(id_str)
+        if not fname: return None
+        block = self.get_block(fname.replace(".json", ""))
+        return block if block is not None else self.corpus.get(fname)
+
+    def _register_block(self, key: str, fpath: str, block: dict):
+        """Hot-load a freshly written block into the lazy maps and ID index."""
+        self.block_cache[key] = block
+        self.file_map[key] = fpath
+        self.id_index.add(os.path.basename(fpath), block)
+        self.lexical_index.add(os.path.basename(fpath), block)
+
+    def _save_indexes(self):
+        try:
+            self.id_index.save()
+            self.lexical_index.save()
+        except OSError as e:
+            print(colored(f"  [Warn] Could not persist ID/lexical index: {e}", "yellow"))
+
+    def _hit_key(self, hit: dict) -> str:
+        """file_map key of a vector-search hit: resolved by concept ID, else by the sanitized name."""
+        cid = hit.get('id')
+        if isinstance(cid, dict):
+            cid = cid.get('raw') or f"{cid.get('group')},{cid.get('item')}"
+        fname = self.id_index.resolve(cid) if cid else None
+        return (fname or concept_filename(hit['metadata'].get('name', '')))[:-len(".json")]
+
     def block_exists(self, name_or_key: str):
         key = name_or_key.lower().replace(" ", "_")
         return (key in self.block_cache) or (key in self.file_map)
+
+    def get_cache_stats(self):
+        return {
+            "blocks": self.block_cache.get_stats(),
+            "corpus": self.corpus.get_stats(),
+            "answers": dict(self.answer_cache.get_stats(), coalesced=self.single_flight.coalesced,
+                            corpus_version=self.corpus_version.current())
+        }
     
+    # --- Stage events (streamed by /query/stream) ---
+
+    def emit(self, event: str, **data):
+        """Send a stage event to the current request's on_event callback, if any."""
+        sink = getattr(self._event_sink, "fn", None)
+        if sink is not None:
+            try:
+                sink(event, data)
+            except Exception as e:
+                print(colored(f"  [Events] Sink failed on '{event}': {e}", "red"))
+
+    @property
+    def streaming(self) -> bool:
+        return getattr(self._event_sink, "fn", None) is not None
+
+    def _complete(self, event: str, system_prompt: str, user_prompt: str) -> str:
+        """LLM completion; while streaming, chunks are emitted as `event` as they arrive."""
+        if not (self.streaming and hasattr(self.llm_client, "stream_completion")):
+            return self.llm_client.completion(system_prompt, user_prompt)
+        return self._drain(self.llm_client.stream_completion(system_prompt, user_prompt), event)
+
+    def _drain(self, chunks, event: str) -> str:
+        parts = []
+        for chunk in chunks:
+            if chunk:
+                parts.append(chunk)
+                self.emit(event, text=chunk)
+        return "".join(parts)
+
     def _trigger_reflex(self, text):
         """Helper to run Deep Research and return new blocks."""
+        self.emit("reflex", term=text)
         tprint("\n[!] GAP DETECTED: Insufficient knowledge.", "red")
         tprint("Step 2.X (Reflex): Triggering DEEP Autonomous Research...", "magenta")
         
+        if self.writer is not None:
+            # Read-only worker: the writer researches and ingests, we re-read its snapshot
+            self.status = "Researching unknown concept (writer)..."
+            blocks = self.writer.call("research", text)
+            self._follow_writer()
+            return blocks
+
         self.status = "Researching unknown concept..."
         telemetry.log(self.status, "magenta")
         
@@ -170,12 +416,8 @@ class WMCS_Kernel:
             import time
             time.sleep(0.5) 
             for name in new_concepts:
-                # Robust sanitization
-                safe_name = name.lower().replace(' ', '_')
-                for char in ['/', '\\', ':', '*', '?', '"', '<', '>', '|']:
-                    safe_name = safe_name.replace(char, '-')
-
-                fname = f"{safe_name}.json"
+                # Same sanitization as the ingestor
+                fname = concept_filename(name)
                 fpath = os.path.join(base_path, fname)
                 msg = f"DEBUG: Reflex looking for file: {fpath}"
                 print(colored(msg, "magenta"))
@@ -185,21 +427,95 @@ class WMCS_Kernel:
                 if os.path.exists(fpath):
                     with open("server_debug.log", "a") as log: log.write(f"  > FOUND: {fname}\n")
                     try:
-                        with open(fpath, "r", encoding="utf-8") as f:
-                            block = json.load(f)
-                            # UPDATE LAZY MAPS
-                            key = block["name"].lower().replace(' ', '_')
-                            self.block_cache[key] = block
-                            self.file_map[key] = fpath
-                            # self.vector_store.add_concept_block(block) # Should be handled by Ingestor or done once
-                            new_real_blocks.append(block)
+                        block = self.corpus.get(fname)
+                        if block is None:
+                            raise ValueError(self.corpus.errors.get(fname))
+                        # UPDATE LAZY MAPS
+                        key = block["name"].lower().replace(' ', '_')
+                        self._register_block(key, fpath, block)
+                        # self.vector_store.add_concept_block(block) # Should be handled by Ingestor or done once
+                        new_real_blocks.append(block)
                     except Exception as e:
                         print(colored(f"  > Failed to ingest {fname}: {e}", "red"))
+            self._save_indexes()
                         
         print(colored("Step 2.X: Retrying Query...", "cyan"))
         return new_real_blocks
 
-    def process_query(self, text: str, allow_research: bool = True, injected_blocks: list = None):
+    # --- Query stages that depend only on the raw text ---
+
+    def _parse_intent(self, text: str):
+        return self.parser.parse(text)
+
+    def _recall_strategies(self, text: str) -> list:
+        try:
+            if self.strategy_store:
+                return self.strategy_store.recall_strategies(text, top_k=2)
+        except Exception as e:
+            print(f"Strategy Recall Failed: {e}")
+        return []
+
+    def _start_stages(self, text: str) -> dict:
+        """
+        Submit the parse (LLM call) and strategy recall (embedding) to the stage
+        pool so they overlap entry-point search, navigation and the logic-engine
+        call. Each future is only awaited where its result is consumed.
+        Strategy recall and entry-point search embed the same text; the shared
+        EmbeddingCache runs that forward pass once and the other side waits for it.
+        """
+        return {
+            "intent": self.stage_pool.submit(self._parse_intent, text),
+            "strategies": self.stage_pool.submit(self._recall_strategies, text)
+        }
+
+    def answer_query(self, text: str, allow_research: bool = True, on_event=None):
+        """
+        process_query behind the answer cache and single-flight coalescing.
+        Commands (/teach ...) always run. An answer is stored only if the corpus
+        version did not move while it was computed (no concurrent learning) and
+        it is a real conclusion: not CANNOT_CONCLUDE/UNCERTAIN, not built on an
+        LLM error. A streaming caller (on_event) runs its own pipeline on a miss.
+        """
+        if text.strip().startswith("/") or self.answer_cache.max_entries <= 0:
+            return self.process_query(text, allow_research=allow_research, on_event=on_event)
+
+        version = self.corpus_version.current() # None mid-bump: compute, do not store
+        key = (version, normalize_query(text), allow_research)
+        if version is not None:
+            answer = self.answer_cache.get(key)
+            if answer is not None:
+                return dict(answer, cached=True)
+
+        def run():
+            answer = self.process_query(text, allow_research=allow_research, on_event=on_event)
+            if version is not None and self._cacheable_answer(answer) and self.corpus_version.current() == version:
+                self.answer_cache.put(key, answer)
+            return answer
+
+        if on_event is not None:
+            return run()
+        return dict(self.single_flight.do(key, run))
+
+    @staticmethod
+    def _cacheable_answer(answer) -> bool:
+        """A graded, conclusive answer whose reasoning and wording came from a working LLM."""
+        return isinstance(answer, dict) and answer.get("grade") not in (None, "CANNOT_CONCLUDE", "UNCERTAIN") \
+            and not answer.get("degraded")
+
+    def process_query(self, text: str, allow_research: bool = True, injected_blocks: list = None, stages: dict = None,
+                      on_event=None):
+        """
+        on_event(event, data): called as stages complete (entry points, hops,
+        reasoning/answer tokens, grade, reflexes) on the calling thread.
+        """
+        if on_event is not None:
+            previous = getattr(self._event_sink, "fn", None)
+            self._event_sink.fn = on_event
+            try:
+                return self.process_query(text, allow_research, injected_blocks, stages)
+            finally:
+                self._event_sink.fn = previous
+
         self.status = "Thinking (" + text[:20] + "...)"
         telemetry.log(f"Processing: {text}", "cyan")
 
@@ -208,6 +524,10 @@ class WMCS_Kernel:
             try:
                 proposition = text.replace("/teach ", "").strip()
                 tprint(f"Teaching Mode: Learning '{proposition}'...", "magenta")
+                if self.writer is not None:
+                    result = self.writer.call("teach", proposition)
+                    self._follow_writer()
+                    return result
                 created = self.ingestor.ingest_proposition(proposition)
                 
                 # HOT LOAD
@@ -215,12 +535,11 @@ class WMCS_Kernel:
                     key = name.lower().replace(' ', '_')
                     fname = f"{key}.json"
                     fpath = os.path.join(self.memory_path, "concepts", fname)
-                    if os.path.exists(fpath):
-                        with open(fpath, "r", encoding="utf-8") as f:
-                             block = json.load(f)
-                             self.blocks.kernel.block_cache[key] = block
-                             self.blocks.kernel.file_map[key] = fpath
-                             tprint(f"  > Hot-Loaded learned concept: {name}", "green")
+                    block = self.corpus.get(fname)
+                    if block is not None:
+                        self._register_block(key, fpath, block)
+                        tprint(f"  > Hot-Loaded learned concept: {name}", "green")
+                self._save_indexes()
                 
                 return {
                     "text": f"I have learned {len(created)} new concept(s): {', '.join(created)}.",
@@ -229,8 +548,10 @@ class WMCS_Kernel:
             except Exception as e:
                 return {"text": f"Teaching Failed: {str(e)}", "visited_nodes": []}
 
-        # 1. Parse (System B)
-        intent = self.parser.parse(text)
+        # 1. Parse (System B) + strategy recall, in the background. Retries of the
+        # same query (after a research reflex) reuse them.
+        if stages is None:
+            stages = self._start_stages(text)
         
         # 2. Reasoning (System A)
         contract = None
@@ -241,22 +562,28 @@ class WMCS_Kernel:
         from system_a_cognitive.logic.navigator import ConceptNavigator
         navigator = ConceptNavigator(self)
         
-        # 1. Semantic Entry Point
+        # 1. Entry Points: semantic + lexical (BM25), fused by reciprocal rank
         start_blocks = []
-        tprint(f"  > Semantic Search for: '{text}'...", "cyan")
+        tprint(f"  > Hybrid Search for: '{text}'...", "cyan")
+        self.emit("stage", stage="search")
         hits = self.vector_store.search(text, top_k=3, threshold=0.45)
+        # Both rankings are keyed by concept filename stem (the file_map key)
+        semantic = [self._hit_key(hit) for hit in hits]
+        # Lexical hits must name the concept in full, so a shared word alone cannot mask a gap
+        lexical = [fname[:-len(".json")] for fname, _ in self.lexical_index.search(text, top_k=3, require_name=True)]
         
-        for hit in hits:
-            name = hit['metadata'].get('name', '')
+        for key, fused in reciprocal_rank_fusion([semantic, lexical], top_k=3):
             # Use Helper (auto-normalizes)
-            if self.block_exists(name):
-                block = self.get_block(name)
+            if self.block_exists(key):
+                block = self.get_block(key)
                 if block:
                     start_blocks.append(block)
-                    print(colored(f"    - Found Entry: {name} (Score: {hit['score']:.2f})", "green"))
+                    via = "+".join(src for src, ranked in (("vector", semantic), ("bm25", lexical)) if key in ranked)
+                    print(colored(f"    - Found Entry: {key} (RRF: {fused:.3f} via {via})", "green"))
         
         if not start_blocks:
             print(colored("  > No semantic entry points found.", "red"))
+        self.emit("entry_points", names=[b.get('name') or (b.get('CORE') or {}).get('name') for b in start_blocks])
 
         # INJECTION (Robustness Fix)
         if injected_blocks:
@@ -266,9 +593,10 @@ class WMCS_Kernel:
         # CURIOSITY REFLEX: If we know NOTHING (and no injection), research immediately.
         if not start_blocks and allow_research:
             injected = self._trigger_reflex(text)
-            return self.process_query(text, allow_research=False, injected_blocks=injected)
+            return self.process_query(text, allow_research=False, injected_blocks=injected, stages=stages)
 
         # 2. Agentic Traversal
+        self.emit("stage", stage="navigate")
         final_blocks = navigator.navigate(start_blocks, text, max_steps=3)
         
         # BLENDING: Ensure injected blocks are present in final context (if Navigator didn't pick them up)
@@ -283,70 +611,41 @@ class WMCS_Kernel:
         # GAP DETECTION & REFLEX (Epistemic Curiosity)
         if not final_blocks and allow_research:
             injected = self._trigger_reflex(text)
-            return self.process_query(text, allow_research=False, injected_blocks=injected)
+            return self.process_query(text, allow_research=False, injected_blocks=injected, stages=stages)
         
         found_info = []
         if final_blocks:
             print(colored(f"  > Context Path: {[b.get('name') for b in final_blocks]}", "yellow"))
-            for b in final_blocks:
-                concept_name = b.get('name', 'Unknown')
-                concept_id = b.get('id', {'group': 0, 'item': 0})
-                # INCLUDE claims AND facets (backward compatibility)
-                # EXTRACT METADATA ROBUSTLY
-                sl = b.get("surface_layer", {})
-                dl = b.get("deep_layer", {})
-                
-                definition = b.get("definition") or sl.get("definition", "")
-                mechanism = dl.get("mechanism", "")
-                origin = dl.get("origin", "")
-                
-                content_dump = {
-                    "definition": definition,
-                    "mechanism": mechanism,
-                    "origin": origin,
-                    "claims": b.get("claims", []),
-                    "facets": b.get("facets", {})
-                }
-                # Extract computed confidence from Navigator (default 1.0)
-                path_conf = b.get('_computed_confidence', 1.0)
-                
-                context_str = f"Concept: {concept_name} (ID: {concept_id}, Conf: {path_conf:.2f}). Content: {json.dumps(content_dump, default=str)}"
-                found_info.append(context_str)
-        else:
+            # Rank, dedupe and budget claims instead of dumping every block in full
+            packed = self.context_packer.pack(final_blocks, text)
+            found_info = packed["blocks"]
+            self.emit("context", concepts=packed["concepts"], tokens=packed["tokens"])
+            print(colored(f"  > Packed {packed['concepts']} concepts, {packed['kept']} lines "
+                          f"(~{packed['tokens']} tokens, {packed['dropped']} dropped).", "white"))
+        if not found_info:
             found_info = ["No specific internal concepts found."]
 
         # STEP 3: COGNITIVE PROCESSING (Synthesizing Logic)
         tprint("Step 3 (Cognitive Processing): Synthesizing Logic...", "cyan")
+        self.emit("stage", stage="reasoning")
         
         # META-LEARNING INJECTION
         reasoning_prompt_header = "SYSTEM ROLE: You are the Logic Engine (System A).\\n"
         
-        # 1. Recall relevant strategies
-        try:
-             from system_a_cognitive.memory.strategy_store import StrategyStore
-             # Dirty hack: We need a singleton or to init it in __init__
-             # Ideally validation happens in init.
-             if not hasattr(self, 'strategy_store'):
-                  try:
-                      self.strategy_store = StrategyStore()
-                  except:
-                      self.strategy_store = None
-             
-             if self.strategy_store:
-                  strategies = self.strategy_store.recall_strategies(text, top_k=2)
-                  if strategies:
-                      print(colored(f"  > [Meta-Learning] Applying Strategies: {strategies}", "magenta"))
-                      reasoning_prompt_header += f"ADAPTIVE STRATEGIES (LEARNED FROM PAST):\\n"
-                      for s in strategies:
-                           reasoning_prompt_header += f"- {s}\\n"
-                      reasoning_prompt_header += "\\n"
-        except Exception as e:
-             print(f"Strategy Injection Failed: {e}")
+        # 1. Recall relevant strategies (started with the parse)
+        strategies = stages["strategies"].result()
+        if strategies:
+            print(colored(f"  > [Meta-Learning] Applying Strategies: {strategies}", "magenta"))
+            reasoning_prompt_header += f"ADAPTIVE STRATEGIES (LEARNED FROM PAST):\\n"
+            for s in strategies:
+                reasoning_prompt_header += f"- {s}\\n"
+            reasoning_prompt_header += "\\n"
 
+        memory_text = "\n".join(found_info)
         reasoning_prompt = (
             f"{reasoning_prompt_header}"
             f"YOUR GOAL: Answer the User Query using ONLY the provided Memory Blocks.\\n\\n"
-            f"MEMORY BLOCKS:\\n{json.dumps(found_info, indent=2)}\\n\\n"
+            f"MEMORY BLOCKS:\\n{memory_text}\\n\\n"
             f"USER QUERY: \"{text}\"\\n\\n"
             "INSTRUCTIONS:\\n"
             "1. ID Identification: Extract key terms from the USER QUERY and match them to Concept IDs in Memory.\\n"
@@ -365,7 +664,8 @@ class WMCS_Kernel:
         # print(colored(f"  DEBUG: Feeding {len(found_info)} blocks to Logic Engine.", "magenta"))
 
         # We use the raw completion here to get the "Thought Process"
-        reasoning_trace = self.llm_client.completion(
+        reasoning_trace = self._complete(
+            "reasoning_token",
             "You are a Logic Engine. Output clear, step-by-step reasoning.", 
             reasoning_prompt
         )
@@ -395,7 +695,7 @@ class WMCS_Kernel:
                     print(colored(f"  > Reflex Failed: {e}", "red"))
 
                 print(colored("Step 2.X: Retrying Query with new Brain...", "cyan"))
-                return self.process_query(text, allow_research=False, injected_blocks=injected) # Recursion
+                return self.process_query(text, allow_research=False, injected_blocks=injected, stages=stages) # Recursion
 
         
         # Print the Thought Process
@@ -425,16 +725,23 @@ class WMCS_Kernel:
         # 3. Gate
         tprint("Step 3 (Epistemic Gate): Contract Generated.", "cyan")
         tprint(f"  > Grade: {contract.grade.grade}", "magenta")
+        self.emit("grade", grade=contract.grade.grade, confidence=calculated_confidence)
         
         # 4. Generate
         tprint("Step 4 (Generate): Response...", "cyan")
+        # The parse is first needed here; it has been running since the query arrived
+        intent = stages["intent"].result()
         # Ensure raw_query is available even if parser result is strictly structured
         if isinstance(intent, dict):
             intent['raw_query'] = text
         else:
             intent = {'raw_query': text} # Fallback if parser failed or returns obj
             
-        response_text = self.generator.generate(contract, intent)
+        self.emit("stage", stage="generate")
+        if self.streaming:
+            response_text = self._drain(self.generator.generate_stream(contract, intent), "answer_token")
+        else:
+            response_text = self.generator.generate(contract, intent)
         
         # Extract Visited IDs for Visualization
         visited_ids = []
@@ -449,12 +756,22 @@ class WMCS_Kernel:
             print(colored("\\n[!] LATE GATING REFLEX: Answer deemed insufficient. Triggering Research.", "magenta"))
             injected = self._trigger_reflex(text)
             # Recursively process with new info
-            return self.process_query(text, allow_research=False, injected_blocks=injected)
+            return self.process_query(text, allow_research=False, injected_blocks=injected, stages=stages)
 
         return {
             "text": response_text,
-            "visited_nodes": visited_ids
+            "visited_nodes": visited_ids,
+            "grade": contract.grade.grade,
+            # Clients report LLM failures as "Error ..." strings: an answer built on one is not reusable
+            "degraded": any(isinstance(t, str) and t.startswith("Error") for t in (reasoning_trace, response_text))
         }
 
 if __name__ == "__main__":
-    pass
+    if startup_profile.enabled: # python main.py --profile-startup
+        with startup_profile.measure("init", "WMCS_Kernel()"):
+            kernel = WMCS_Kernel()
+        with startup_profile.measure("load", "load_data()"):
+            kernel.load_data()
+        with startup_profile.measure("load", "load_subsystems()"):
+            kernel.load_subsystems()
+        startup_profile.report()
@@ -1,31 +1,50 @@
 import sys
 import os
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from termcolor import colored
 import uvicorn
 import threading
+import json
+import queue
+import asyncio
 
 # Path Hack to include root
 sys.path.append(os.path.join(os.getcwd(), '..'))
 sys.path.append(os.getcwd())
 
-from main import WMCS_Kernel
+from server.startup_profile import startup_profile
+with startup_profile.measure("import", "main (WMCS_Kernel)"):
+    from main import WMCS_Kernel
 from server.telemetry import telemetry
+from system_b_llm.interfaces.llm_provider import LLMStreamError
 
 from contextlib import asynccontextmanager
 
 # Global Kernel
 kernel = None
+snapshot_follower = None # Set in forked workers (server/workers.py)
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
+def _boot_kernel():
+    """Build and index the Kernel off the event loop; endpoints answer 'loading' until it is published."""
     global kernel
-    print(colored("[API] Initializing WMCS Kernel...", "magenta"))
-    kernel = WMCS_Kernel()
-    kernel.load_data()
+    with startup_profile.measure("init", "WMCS_Kernel()"):
+        k = WMCS_Kernel()
+    with startup_profile.measure("load", "load_data()"):
+        k.load_data()
+    kernel = k
+    startup_profile.mark("kernel ready")
     print(colored("[API] Kernel Ready.", "green"))
+    startup_profile.report()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if kernel is None: # Forked workers inherit a preloaded Kernel
+        print(colored("[API] Initializing WMCS Kernel...", "magenta"))
+        threading.Thread(target=_boot_kernel, name="kernel-boot", daemon=True).start()
+    startup_profile.mark("serving (/status ready)")
     yield
     print(colored("[API] Shutting down...", "magenta"))
 
@@ -42,6 +61,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def follow_snapshot(request, call_next):
+    """Multi-worker mode: catch up with the writer's latest snapshot before serving."""
+    if snapshot_follower is not None:
+        await asyncio.to_thread(snapshot_follower.sync)
+    return await call_next(request)
+
 class QueryRequest(BaseModel):
     text: str
     allow_research: bool = True
@@ -53,6 +79,8 @@ def status():
         "status": "online",
         "vectors": kernel.vector_store.count(),
         # "concepts": len(kernel.blocks)
+        "cache": kernel.get_cache_stats(),
+        "worker": os.getpid()
     }
 
 @app.get("/activity")
@@ -67,6 +95,82 @@ def get_logs(since: float = 0):
     """Return logs newer than timestamp."""
     return telemetry.get_logs(since)
 
+# --- Server-Sent Events ---
+
+SSE_KEEPALIVE = 15 # seconds between comment pings on an idle stream
+
+def sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+def sse_response(events: "queue.Queue", first=None) -> StreamingResponse:
+    """Stream (event, data) items from a queue until a None sentinel."""
+    def body():
+        if first:
+            yield sse_event(*first)
+        while True:
+            try:
+                item = events.get(timeout=SSE_KEEPALIVE)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            if item is None:
+                return
+            yield sse_event(*item)
+    return StreamingResponse(body(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.get("/logs/stream")
+def stream_logs(since: float = 0):
+    """Telemetry pushed as it is logged (replaces polling /logs)."""
+    subscription = telemetry.subscribe()
+    backlog = telemetry.get_logs(since)
+    def body():
+        try:
+            for entry in backlog:
+                yield sse_event("log", entry)
+            while True:
+                try:
+                    yield sse_event("log", subscription.get(timeout=SSE_KEEPALIVE))
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+        finally:
+            telemetry.unsubscribe(subscription)
+    return StreamingResponse(body(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.get("/query/stream")
+def stream_query(text: str, allow_research: bool = True):
+    """
+    /query as SSE: stage, entry_points, hop, context, reasoning_token, grade,
+    answer_token and reflex events as they happen, then 'done' with the
+    /query payload (or 'error'). A 'reflex' means the answer will be redone.
+    A cached answer arrives as 'done' (with cached: true) right after 'start'.
+    An 'error' after tokens (e.g. the LLM stream broke) voids them: it is the
+    terminal event and no 'done' follows.
+    """
+    if not kernel: raise HTTPException(500, "Kernel loading")
+    print(colored(f"[API] Streaming Query: '{text}' (Research={allow_research})", "cyan"))
+    events = queue.Queue()
+
+    def run():
+        try:
+            response = kernel.answer_query(text, allow_research=allow_research,
+                                           on_event=lambda event, data: events.put((event, data)))
+            if isinstance(response, str):
+                response = {"text": response, "visited_nodes": []}
+            events.put(("done", response))
+        except LLMStreamError as e:
+            print(colored(f"[API] {e}", "red"))
+            events.put(("error", {"detail": str(e), "partial": True}))
+        except Exception as e:
+            print(colored(f"[API CRASH] {str(e)}", "red"))
+            events.put(("error", {"detail": f"Kernel Crash: {str(e)}"}))
+        finally:
+            events.put(None)
+
+    threading.Thread(target=run, name="query-stream", daemon=True).start()
+    return sse_response(events, first=("start", {"text": text}))
+
 @app.post("/query")
 def run_query(req: QueryRequest):
     if not kernel: raise HTTPException(500, "Kernel loading")
@@ -77,7 +181,7 @@ def run_query(req: QueryRequest):
     
     try:
         # Returns {text: "...", visited_nodes: [...]}
-        response = kernel.process_query(req.text, allow_research=req.allow_research)
+        response = kernel.answer_query(req.text, allow_research=req.allow_research)
         
         elapsed = time.time() - start
         print(colored(f"[API] Query Complete in {elapsed:.2f}s", "green"))
@@ -212,4 +316,14 @@ def get_graph(limit: int = 500, focus: str = None):
     return {"nodes": nodes, "links": links}
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # python server/api.py [--workers N] [--profile-startup]
+    import argparse
+    from server.workers import serve
+    cli = argparse.ArgumentParser(description="WMCS API server")
+    cli.add_argument("--host", default="0.0.0.0")
+    cli.add_argument("--port", type=int, default=8000)
+    cli.add_argument("--workers", type=int, default=int(os.getenv("WMCS_WORKERS", 1)),
+                     help="Forked query workers sharing one preloaded Kernel (POSIX); 1 = single process")
+    cli.add_argument("--profile-startup", action="store_true", help="Print the startup timing breakdown")
+    args = cli.parse_args()
+    serve(args.host, args.port, args.workers)
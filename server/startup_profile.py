@@ -0,0 +1,66 @@
+"""
+Startup Profile (WMCS v1.0)
+Wall-clock breakdown of Kernel startup: module imports, subsystem
+construction and deferred (lazy) subsystem loads.
+
+Timings are always recorded (a perf_counter pair per step); report() prints
+them when the process was started with --profile-startup.
+"""
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+PROFILE_FLAG = "--profile-startup"
+
+
+class StartupProfile:
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.enabled = PROFILE_FLAG in sys.argv
+        self.records = [] # [{"phase", "name", "ms", "at_ms"}]
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, phase: str, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.records.append({
+                    "phase": phase,
+                    "name": name,
+                    "ms": round((end - start) * 1000, 2),
+                    "at_ms": round((end - self.origin) * 1000, 2)
+                })
+
+    def mark(self, name: str):
+        """Zero-length record: a milestone (e.g. 'status ready') relative to process start."""
+        with self.measure("mark", name):
+            pass
+
+    def get_stats(self) -> List[Dict]:
+        with self._lock:
+            return list(self.records)
+
+    def report(self, force: bool = False):
+        if not (self.enabled or force):
+            return
+        records = self.get_stats()
+        print("\n=== STARTUP PROFILE ===")
+        for phase in ("import", "init", "load", "lazy", "mark"):
+            rows = [r for r in records if r["phase"] == phase]
+            if not rows:
+                continue
+            print(f"[{phase}]")
+            for r in rows:
+                print(f"  {r['name']:<36} {r['ms']:>9.1f} ms   (t+{r['at_ms']:.0f} ms)")
+        total = sum(r["ms"] for r in records if r["phase"] in ("import", "init"))
+        print(f"Imports + construction: {total:.1f} ms")
+
+
+# Global Instance
+startup_profile = StartupProfile()
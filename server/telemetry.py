@@ -1,4 +1,5 @@
 import time
+import queue
 from collections import deque
 import threading
 
@@ -12,6 +13,7 @@ class TelemetryBuffer:
                 if cls._instance is None:
                     cls._instance = super(TelemetryBuffer, cls).__new__(cls)
                     cls._instance.logs = deque(maxlen=1000) # Keep last 1000 lines
+                    cls._instance.subscribers = set() # Live /logs/stream listeners
         return cls._instance
 
     def log(self, message: str, level: str = "INFO", color: str = "white"):
@@ -28,6 +30,20 @@ class TelemetryBuffer:
             "color": color
         }
         self.logs.append(entry)
+        for q in list(self.subscribers):
+            try:
+                q.put_nowait(entry)
+            except queue.Full:
+                pass # Slow consumer: drop rather than block the Kernel
+
+    def subscribe(self, maxsize: int = 1000) -> "queue.Queue":
+        """Queue receiving every new entry until unsubscribe()."""
+        q = queue.Queue(maxsize=maxsize)
+        self.subscribers.add(q)
+        return q
+
+    def unsubscribe(self, q):
+        self.subscribers.discard(q)
 
     def get_logs(self, since: float = 0):
         """Return logs newer than timestamp 'since'."""
@@ -0,0 +1,279 @@
+"""
+Multi-Worker Serving (WMCS v1.0)
+Pre-fork API serving: the parent loads the Kernel once (concept map, ID and
+lexical indexes), then forks N query workers that share those pages
+copy-on-write. Each worker runs its own uvicorn server on one shared
+listening socket, so /query scales with cores.
+
+Nothing that opens a Chroma client, an ONNX session or a thread is built
+before the fork. Chroma's persistent client is not multi-process safe, so
+the parent is the only process that opens it: the vector index sync is its
+first writer operation, and workers send concept searches and strategy
+recall to it (RemoteVectorStore / RemoteStrategyStore), outside the write
+lock. Searches always see the live index, including one still catching up.
+
+The parent stays behind as the single writer. /teach and research ingestion
+from any worker are sent to it over a local authenticated connection
+(multiprocessing.connection) and applied one at a time. Each write bumps a
+shared snapshot version; workers check it before every request and re-read
+only what changed (Kernel.refresh_snapshot).
+
+Needs os.fork (POSIX). Elsewhere, or with --workers 1, serve() runs the
+usual single-process server.
+"""
+import gc
+import os
+import signal
+import socket
+import threading
+import time
+import multiprocessing
+from multiprocessing.connection import Client, Listener, arbitrary_address
+
+from termcolor import colored
+
+from server.startup_profile import startup_profile
+
+
+class WriterClient:
+    """Worker-side handle on the writer process (one connection per call, thread-safe)."""
+
+    def __init__(self, address, authkey: bytes):
+        self.address = address
+        self.authkey = authkey
+
+    def _connect(self, timeout: float = 5.0):
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return Client(self.address, family="AF_UNIX", authkey=self.authkey)
+            except (FileNotFoundError, ConnectionRefusedError):
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05) # Writer starts listening right after the workers are forked
+
+    def call(self, op: str, *args):
+        with self._connect() as conn:
+            conn.send((op, args))
+            status, value = conn.recv()
+        if status != "ok":
+            raise RuntimeError(f"Writer failed on '{op}': {value}")
+        return value
+
+
+class RemoteVectorStore:
+    """Worker-side vector store: searches run on the writer's Chroma collection."""
+
+    def __init__(self, writer: WriterClient):
+        self.writer = writer
+
+    def search(self, query, top_k=3, threshold=0.0, **filters):
+        return self.search_many([query], top_k, threshold, **filters)[0]
+
+    def search_many(self, queries, top_k=3, threshold=0.0, **filters):
+        return self.writer.call("vector_search", list(queries), top_k, threshold, filters)
+
+    def count(self):
+        return self.writer.call("vector_count")
+
+
+class RemoteStrategyStore:
+    """Worker-side strategy store: recall runs on the writer's Chroma collection."""
+
+    def __init__(self, writer: WriterClient):
+        self.writer = writer
+
+    def recall_strategies(self, context_query: str, top_k=3):
+        return self.writer.call("recall_strategies", context_query, top_k)
+
+
+class WriterService:
+    """Applies write operations on the parent's Kernel, in order, and publishes a new snapshot version."""
+
+    READ_OPS = ("vector_search", "vector_count", "recall_strategies")
+
+    def __init__(self, kernel, version=None):
+        self.kernel = kernel
+        self.version = version if version is not None else multiprocessing.Value("q", 0)
+        self.authkey = os.urandom(32)
+        self.address = arbitrary_address("AF_UNIX") # Known before fork; listened on after
+        self.listener = None
+        self._lock = threading.Lock() # Single writer (reads in READ_OPS skip it)
+        self.writes = 0
+
+    def client(self) -> WriterClient:
+        return WriterClient(self.address, self.authkey)
+
+    def read(self, op: str, args):
+        """Read-only vector operations for workers: concurrent, never bump the snapshot version."""
+        if op == "vector_search":
+            queries, top_k, threshold, filters = args
+            return self.kernel.vector_store.search_many(queries, top_k, threshold, **filters)
+        if op == "vector_count":
+            return self.kernel.vector_store.count()
+        if op == "recall_strategies":
+            store = self.kernel.strategy_store
+            return store.recall_strategies(*args) if store else []
+        raise ValueError(f"Unknown writer op: {op}")
+
+    def apply(self, op: str, args):
+        if op in self.READ_OPS:
+            return self.read(op, args)
+        with self._lock:
+            if op == "teach":
+                result = self.kernel.process_query("/teach " + args[0])
+            elif op == "research":
+                result = self.kernel._trigger_reflex(args[0])
+            elif op == "sync_vectors":
+                result = self.kernel.sync_vectors()
+            else:
+                raise ValueError(f"Unknown writer op: {op}")
+            self.writes += 1
+            with self.version.get_lock():
+                self.version.value += 1
+            return result
+
+    def _handle(self, conn):
+        with conn:
+            try:
+                op, args = conn.recv()
+                conn.send(("ok", self.apply(op, args)))
+            except Exception as e:
+                print(colored(f"[Writer] {e}", "red"))
+                try:
+                    conn.send(("error", str(e)))
+                except (OSError, EOFError):
+                    pass
+
+    def start(self) -> threading.Thread:
+        """Listen on self.address and serve requests on a daemon thread."""
+        self.listener = Listener(self.address, family="AF_UNIX", authkey=self.authkey)
+
+        def serve():
+            while True:
+                try:
+                    conn = self.listener.accept()
+                except multiprocessing.AuthenticationError:
+                    continue
+                except OSError:
+                    break # Listener closed
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+        thread = threading.Thread(target=serve, name="kernel-writer", daemon=True)
+        thread.start()
+        return thread
+
+    def close(self):
+        if self.listener is not None:
+            self.listener.close()
+
+
+class SnapshotFollower:
+    """Worker-side: refresh the local Kernel when the writer has published a newer version."""
+
+    def __init__(self, kernel, version):
+        self.kernel = kernel
+        self.version = version
+        self.seen = version.value
+        self._lock = threading.Lock()
+
+    def sync(self) -> bool:
+        if self.version.value == self.seen:
+            return False
+        with self._lock:
+            current = self.version.value
+            if current == self.seen:
+                return False
+            self.kernel.refresh_snapshot()
+            self.seen = current
+            return True
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(index: int, kernel, writer: WriterClient, version, sock, host: str, port: int):
+    import uvicorn
+    import server.api as api
+
+    kernel.reset_after_fork()
+    kernel.writer = writer
+    kernel.vector_store = RemoteVectorStore(writer) # No Chroma client or embedding model in workers
+    kernel.strategy_store = RemoteStrategyStore(writer)
+    api.kernel = kernel
+    api.snapshot_follower = kernel.snapshot_follower = SnapshotFollower(kernel, version)
+    print(colored(f"[API] Worker {index} (pid {os.getpid()}) serving.", "green"))
+    uvicorn.Server(uvicorn.Config(api.app, host=host, port=port)).run(sockets=[sock])
+
+
+def serve(host: str = "0.0.0.0", port: int = 8000, workers: int = 1):
+    """Run the API: single process, or a preloaded parent (writer) plus `workers` forked query workers."""
+    import uvicorn
+    import server.api as api
+
+    if workers <= 1 or not hasattr(os, "fork"):
+        if workers > 1:
+            print(colored("[API] os.fork unavailable: serving with a single process.", "yellow"))
+        uvicorn.run(api.app, host=host, port=port)
+        return
+
+    from main import WMCS_Kernel
+    print(colored(f"[API] Preloading Kernel for {workers} workers...", "magenta"))
+    with startup_profile.measure("init", "WMCS_Kernel()"):
+        kernel = WMCS_Kernel()
+    with startup_profile.measure("load", "load_data(vectors=False)"):
+        kernel.load_data(vectors=False) # No Chroma client or warm-up thread before the fork
+
+    # The LLM request budget is per account: split it across the workers and the writer (teach, research)
+    from config import Config
+    Config.LLM_RPM = Config.LLM_RPM / (workers + 1)
+
+    writer = WriterService(kernel)
+    sock = _bind(host, port)
+    gc.freeze() # Loaded objects move to a permanent generation: GC passes in workers do not dirty shared pages
+
+    children = []
+    for index in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                _run_worker(index, kernel, writer.client(), writer.version, sock, host, port)
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    # Parent: single writer + supervisor (threads only after every fork)
+    writer.start()
+    with startup_profile.measure("load", "sync_vectors()"):
+        writer.apply("sync_vectors", ()) # Serialized with /teach; worker searches meanwhile hit the live index
+    startup_profile.mark(f"{workers} workers forked")
+    startup_profile.report()
+    print(colored(f"[API] Writer ready; workers {children} on {host}:{port}.", "green"))
+
+    def stop(signum, frame):
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        if pid in children:
+            children.remove(pid)
+            print(colored(f"[API] Worker {pid} exited ({status}).", "yellow"))
+    writer.close()
+    sock.close()
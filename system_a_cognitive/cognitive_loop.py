@@ -16,6 +16,7 @@ from system_a_cognitive.logic.spatial import SpatialEngine
 from system_a_cognitive.logic.composition import CompositionEngine
 from system_a_cognitive.logic.grounding import GroundingEngine
 from system_a_cognitive.epistemic_gate import get_epistemic_gate
+from system_a_cognitive.logic.concept_mentions import ConceptMentionDetector
 from system_a_cognitive.meta.reflective_reasoner import get_reflective_reasoner
 
 
@@ -47,6 +48,8 @@ class CognitiveLoop:
         self.grounding = GroundingEngine()
         self.epistemic = get_epistemic_gate()
         self.reflective = get_reflective_reasoner(llm_client)  # Meta-cognitive layer
+        # Graph names, not the registry: unregistered and short concepts ("io") are still retrieved
+        self.mentions = ConceptMentionDetector(self.graph._concept_cache.keys(), min_length=1)
         
         # Logging
         self.trace = []
@@ -184,9 +187,7 @@ class CognitiveLoop:
         retrieved = set()
         
         # Extract concept names from query
-        for name in self.graph._concept_cache.keys():
-            if name in query.lower():
-                retrieved.add(name)
+        retrieved.update(self.mentions.find_known(query, self.graph._concept_cache))
         
         # Also get related concepts
         for name in list(retrieved):
@@ -282,11 +283,7 @@ class CognitiveLoop:
     def _retrieve_for_gap(self, gap: str, context: Dict) -> List[str]:
         """Retrieve additional concepts to fill a gap."""
         # Extract concept name from gap
-        for name in self.graph._concept_cache.keys():
-            if name in gap.lower():
-                return [name]
-        
-        return []
+        return self.mentions.find_known(gap, self.graph._concept_cache)[:1]
     
     def _trigger_research(self, query: str) -> List[str]:
         """
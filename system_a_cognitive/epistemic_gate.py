@@ -4,8 +4,10 @@ The critical component that prevents LLM hallucination.
 Verifies all claims against System A before passing to output.
 """
 import re
+from collections import Counter
 from typing import Dict, List, Optional, Set, Tuple
 from system_a_cognitive.logic.graph_engine import get_graph_engine
+from system_a_cognitive.logic.concept_mentions import ConceptMentionDetector
 
 
 class EpistemicGate:
@@ -29,12 +31,19 @@ class EpistemicGate:
         
         # Known facts cache
         self._known_names = set(self.graph._concept_cache.keys())
+        self._claims = []        # claim id -> (concept_name, claim string, word set)
+        self._postings = {}      # token -> {concept_name: [claim ids]}
         self._known_claims = self._build_claims_index()
+        # Built from the graph's own names, not the registry: concepts missing
+        # from registry.json and short names ("io") must still be recognized
+        self.mentions = ConceptMentionDetector(self._known_names, min_length=1)
     
     def _build_claims_index(self) -> Dict[str, Set[str]]:
         """
         Build index of known facts from concepts.
         Returns {concept_name: set of claim strings}
+        Also fills the inverted index (token -> claim ids, bucketed by concept)
+        so verification only touches claims sharing a word with the sentence.
         """
         index = {}
         
@@ -77,6 +86,13 @@ class EpistemicGate:
                                 claims.add(f"{name} {rel_str} {t.lower()}")
             
             index[name] = claims
+            
+            for claim in claims:
+                words = set(claim.split())
+                claim_id = len(self._claims)
+                self._claims.append((name, claim, words))
+                for word in words:
+                    self._postings.setdefault(word, {}).setdefault(name, []).append(claim_id)
         
         return index
     
@@ -126,11 +142,8 @@ class EpistemicGate:
         """
         claim_lower = claim.lower()
         
-        # 1. Check if claim mentions known concepts
-        mentioned = []
-        for name in self._known_names:
-            if name in claim_lower:
-                mentioned.append(name)
+        # 1. Check if claim mentions known concepts (one pass over the claim)
+        mentioned = self.mentions.find_known(claim_lower, self._known_names)
         
         if not mentioned:
             return {
@@ -140,13 +153,21 @@ class EpistemicGate:
                 "reason": "No recognized concepts mentioned"
             }
         
-        # 2. Check if claim matches known facts
+        # 2. Check if claim matches known facts.
+        # Only claims sharing at least one word can match or overlap, so count
+        # shared words per candidate claim via the inverted index.
+        words = set(claim_lower.split())
         for name in mentioned:
-            known = self._known_claims.get(name, set())
+            overlaps = Counter()
+            for word in words:
+                ids = self._postings.get(word, {}).get(name)
+                if ids:
+                    overlaps.update(ids)
             
             # Direct match
-            for known_claim in known:
-                if self._claims_match(claim_lower, known_claim):
+            for claim_id, overlap in overlaps.items():
+                known_words = self._claims[claim_id][2]
+                if overlap / max(min(len(words), len(known_words)), 1) > 0.7:
                     return {
                         "verified": True,
                         "confidence": 0.9,
@@ -155,14 +176,13 @@ class EpistemicGate:
                     }
             
             # Partial match
-            for known_claim in known:
-                if self._claims_overlap(claim_lower, known_claim):
-                    return {
-                        "verified": True,
-                        "confidence": 0.6,
-                        "source": name,
-                        "reason": f"Partially matches facts about {name}"
-                    }
+            if any(overlap >= 3 for overlap in overlaps.values()):
+                return {
+                    "verified": True,
+                    "confidence": 0.6,
+                    "source": name,
+                    "reason": f"Partially matches facts about {name}"
+                }
         
         # 3. Claim mentions concepts but doesn't match any known facts
         return {
@@ -252,8 +272,9 @@ class EpistemicGate:
         Enforce epistemic standards on LLM output.
         Returns (filtered_output, passed_gate).
         """
-        trust = self.get_trust_score(llm_output)
         filtered = self.filter_response(llm_output)
+        total = filtered["verified_count"] + filtered["unverified_count"]
+        trust = filtered["verified_count"] / total if total else 1.0
         
         if trust < min_trust:
             # Add warning
@@ -1,19 +1,29 @@
-import json
+import asyncio
 import os
+import threading
 from typing import List, Dict, Any
 from system_b_llm.interfaces.gemini_client import GeminiClient
 from config import Config
+from system_a_cognitive.memory.concept_corpus import concept_filename, get_concept_corpus
 from .prompts import INGESTION_SYSTEM_PROMPT, INGESTION_USER_PROMPT_TEMPLATE
 
 class ContentIngestor:
-    def __init__(self, identity_manager=None):
-        self.client = GeminiClient(Config.LLM_API_KEY, Config.LLM_MODEL)
+    def __init__(self, identity_manager=None, client=None):
+        self.client = client or GeminiClient(Config.LLM_API_KEY, Config.LLM_MODEL) # Reuse the Kernel's client when given
         self.output_dir = os.path.join("data", "concepts")
         os.makedirs(self.output_dir, exist_ok=True)
+        self.corpus = get_concept_corpus(self.output_dir)
         self.identity_manager = identity_manager
-        
-        from system_a_cognitive.subsystems.visual_cortex import VisualCortex
-        self.visual_cortex = VisualCortex(self.client)
+        self._save_lock = threading.Lock()  # Parallel extractions, one writer
+        self._visual_cortex = None
+
+    @property
+    def visual_cortex(self):
+        """Only image ingestion needs it; built on first use."""
+        if self._visual_cortex is None:
+            from system_a_cognitive.subsystems.visual_cortex import VisualCortex
+            self._visual_cortex = VisualCortex(self.client)
+        return self._visual_cortex
 
     def ingest_file(self, filepath: str) -> List[str]:
         """
@@ -67,10 +77,7 @@ class ContentIngestor:
              
         return self._process_and_save_blocks(blocks)
 
-    def ingest_text(self, content: str, source_name: str = "interactive") -> List[str]:
-        """
-        Ingests raw text string.
-        """
+    def _text_prompt(self, content: str, source_name: str) -> str:
         # Limit to ~30k chars for safety
         truncated_content = content[:30000]
         prompt = INGESTION_USER_PROMPT_TEMPLATE.format(text=truncated_content) 
@@ -79,8 +86,9 @@ class ContentIngestor:
             log.write(f"\n--- Ingesting {source_name} ---\n")
 
         print(f"DEBUG: Sending ingestion request for {source_name}...")
-        response_json = self.client.json_completion(INGESTION_SYSTEM_PROMPT, prompt)
-        
+        return prompt
+
+    def _blocks_from_response(self, response_json: Dict) -> List[Dict]:
         with open("ingestion_debug.log", "a", encoding='utf-8') as log:
             log.write(f"LLM Response: {response_json}\n")
 
@@ -88,8 +96,25 @@ class ContentIngestor:
             print(f"Error from LLM: {response_json}")
             return []
 
-        blocks = response_json.get("blocks", [])
-        return self._process_and_save_blocks(blocks)
+        return response_json.get("blocks", [])
+
+    def ingest_text(self, content: str, source_name: str = "interactive") -> List[str]:
+        """
+        Ingests raw text string.
+        """
+        prompt = self._text_prompt(content, source_name)
+        response_json = self.client.json_completion(INGESTION_SYSTEM_PROMPT, prompt)
+        return self._process_and_save_blocks(self._blocks_from_response(response_json))
+
+    async def aingest_text(self, content: str, source_name: str = "interactive") -> List[str]:
+        """
+        Async ingest_text: the extraction call runs concurrently with other
+        ingestions; saving/merging blocks is serialized.
+        """
+        prompt = self._text_prompt(content, source_name)
+        response_json = await self.client.ajson_completion(INGESTION_SYSTEM_PROMPT, prompt)
+        blocks = self._blocks_from_response(response_json)
+        return await asyncio.to_thread(self._process_and_save_blocks, blocks)
 
     def ingest_image(self, filepath: str) -> List[str]:
         """
@@ -101,6 +126,10 @@ class ContentIngestor:
         return self._process_and_save_blocks(blocks)
 
     def _process_and_save_blocks(self, blocks: List[Dict]) -> List[str]:
+        with self._save_lock:
+            return self._save_blocks(blocks)
+
+    def _save_blocks(self, blocks: List[Dict]) -> List[str]:
         created_concepts = []
         for block_data in blocks:
             name = block_data.get("name")
@@ -109,20 +138,10 @@ class ContentIngestor:
             if not name: continue
             
             # Robust sanitization for Windows/Linux
-            safe_name = name.lower().replace(' ', '_')
-            for char in ['/', '\\', ':', '*', '?', '"', '<', '>', '|']:
-                safe_name = safe_name.replace(char, '-')
-            
-            filename = f"{safe_name}.json"
-            save_path = os.path.join(self.output_dir, filename)
-            
+            filename = concept_filename(name)
+
             # Load existing if present to merging claims
-            existing_data = {}
-            if os.path.exists(save_path):
-                try:
-                    with open(save_path, 'r', encoding='utf-8') as f:
-                        existing_data = json.load(f)
-                except: pass
+            existing_data = self.corpus.get_for_update(filename) or {}
 
             # MERGE LOGIC
             if existing_data:
@@ -169,23 +188,19 @@ class ContentIngestor:
                         "item": 9000 + hash(name) % 1000 # Semi-stable hash
                     }
             
-            # Save
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(block_data, f, indent=2)
-            
-            # AUTO-ADD ID RELATIONS
+            # AUTO-ADD ID RELATIONS (before the single save below)
             try:
                 from system_a_cognitive.logic.relation_builder import get_builder
                 builder = get_builder()
                 relations_added = builder.auto_add_relations(block_data)
                 if relations_added > 0:
-                    # Re-save with new relations
-                    with open(save_path, 'w', encoding='utf-8') as f:
-                        json.dump(block_data, f, indent=2)
                     print(f"  + Added {relations_added} ID-based relations")
             except Exception as e:
                 print(f"  [!] RelationBuilder error: {e}")
             
+            # Save atomically; the shared corpus is updated once the file is in place
+            self.corpus.save(filename, block_data)
+            
             created_concepts.append(name)
             print(f"  Saved Concept: {name} -> {filename}")
 
@@ -199,37 +214,15 @@ class ContentIngestor:
         concept_dir = os.path.join(memory_path, "concepts")
         if not os.path.exists(concept_dir): return
         
-        files = [f for f in os.listdir(concept_dir) if f.endswith('.json')]
+        corpus = get_concept_corpus(concept_dir)
+        corpus.refresh()
+        files = corpus.files()
         print(f"[Ingestor] Found {len(files)} concept files.")
-        
-        # Optimization: Get existing names from VectorStore if passed
-        existing_names = set()
-        if vector_store:
-            # This assumes vector_store has a way to list all source files or names
-            # If not, we can just rely on the count check in main.py, 
-            # BUT for 'force=True' we want to be smart.
-            pass
 
         count = 0
-        for f in files:
-            path = os.path.join(concept_dir, f)
-            # We don't need to 'ingest' (LLM Process) JSON files that are already JSON.
-            # We just need to LOAD them into the Vector Database.
-            # This method seems to have been missing or defined elsewhere?
-            # We will implement the loading logic here or assume Main does it.
-            
-            # WAIT: The Main.py expects 'ingest_all' to load data into Vector Store.
-            # But ContentIngestor usually *creates* JSON from Text.
-            # Who puts JSON into Chroma? 
-            # It's 'VectorStore.add_concept_block'.
-            
-            if vector_store:
-                with open(path, 'r', encoding='utf-8') as jf:
-                     try:
-                        data = json.load(jf)
-                        vector_store.add_concept_block(data)
-                        count += 1
-                     except: pass
+        if vector_store:
+            # Batched: one embedding pass + one write per batch, not per file
+            count = vector_store.add_concept_blocks(data for _, data in corpus.items())
         
         if vector_store:
              print(f"[Ingestor] Loaded {count} concepts into Vector Store.")
@@ -0,0 +1,119 @@
+"""
+Aho-Corasick Matcher (WMCS v1.0)
+Multi-pattern string search: finds every occurrence of every pattern in a
+single pass over the text, independent of how many patterns are loaded.
+"""
+from collections import deque
+from typing import Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """
+    Keyword automaton over lowercase patterns.
+
+    - add(pattern) inserts into the trie; failure links are (re)built lazily
+      on the next search, so a burst of adds costs one rebuild.
+    - word_boundary=True only reports matches not embedded in a longer word
+      ("sun" in "the sun rose", not in "sunday").
+    """
+
+    def __init__(self, patterns=(), word_boundary: bool = False):
+        self.word_boundary = word_boundary
+        self._goto = [{}]       # state -> {char: state}
+        self._fail = [0]        # state -> failure state
+        self._out = [None]      # state -> pattern ending exactly here
+        self._dict_link = [0]   # state -> nearest failure state with an output (0 = none)
+        self._patterns = []     # pattern id -> pattern string
+        self._ids = {}          # pattern string -> pattern id
+        self._dirty = False
+        for p in patterns:
+            self.add(p)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def __contains__(self, pattern: str) -> bool:
+        return pattern in self._ids
+
+    def __iter__(self):
+        return iter(self._patterns)
+
+    def add(self, pattern: str) -> bool:
+        """Insert a pattern. Returns False if empty or already present."""
+        if not pattern or pattern in self._ids:
+            return False
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(None)
+                self._dict_link.append(0)
+            state = nxt
+        self._ids[pattern] = len(self._patterns)
+        self._patterns.append(pattern)
+        self._out[state] = pattern
+        self._dirty = True
+        return True
+
+    def build(self):
+        """Compute failure and output links (BFS over the trie)."""
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            self._dict_link[child] = 0
+            queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                fc = self._fail[child]
+                self._dict_link[child] = fc if self._out[fc] is not None else self._dict_link[fc]
+                queue.append(child)
+
+        self._dirty = False
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, pattern) for every match, ordered by end position."""
+        if self._dirty:
+            self.build()
+        goto, fail, out, link = self._goto, self._fail, self._out, self._dict_link
+        check = self.word_boundary
+        state = 0
+        n = len(text)
+
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            s = state if out[state] is not None else link[state]
+            while s:
+                pattern = out[s]
+                start = i - len(pattern) + 1
+                if not check or (
+                    (start == 0 or not _is_word(text[start - 1])) and
+                    (i + 1 == n or not _is_word(text[i + 1]))
+                ):
+                    yield start, i + 1, pattern
+                s = link[s]
+
+    def findall(self, text: str) -> List[str]:
+        """Distinct patterns found in text, in the order they are first matched."""
+        seen = {}
+        for _, _, pattern in self.finditer(text):
+            if pattern not in seen:
+                seen[pattern] = True
+        return list(seen)
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
@@ -0,0 +1,130 @@
+"""
+Concept Mention Detector (WMCS v1.0)
+Finds which registered concepts a piece of text mentions, in one pass.
+Shared by RelationBuilder, CognitiveLoop and EpistemicGate; kept current by
+IdentityManager.mint_id so newly learned names are detected immediately.
+"""
+import json
+import os
+import threading
+from typing import Container, Iterable, List, Set
+
+from system_a_cognitive.logic.aho_corasick import AhoCorasick
+
+
+class ConceptMentionDetector:
+    """
+    Word-boundary-aware Aho-Corasick automaton over concept names.
+
+    Every name is registered under its canonical registry key ("black_hole")
+    and its spaced/underscored alias ("black hole"). New names go into a small pending
+    automaton which is folded into the main one once it grows past a fraction
+    of the main size, so a stream of mint_id() calls never forces a full
+    rebuild per name.
+    """
+
+    def __init__(self, names: Iterable[str] = (), min_length: int = 3):
+        self.min_length = min_length  # Shorter names give too many false positives
+        self._canonical = {}          # surface form -> canonical name
+        self._main = AhoCorasick(word_boundary=True)
+        self._pending = AhoCorasick(word_boundary=True)
+        self._lock = threading.RLock()
+        self.merges = 0
+        for name in names:
+            self._insert(name, self._main)
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._canonical
+
+    def _insert(self, name: str, matcher: AhoCorasick) -> bool:
+        key = name.lower()
+        added = False
+        for form in (key, key.replace('_', ' '), key.replace(' ', '_')):
+            if len(form) < self.min_length:
+                continue
+            if form not in self._canonical:
+                matcher.add(form)
+                added = True
+            elif form != key or self._canonical[form] == key:
+                continue
+            # An exact registry key wins over another name's alias
+            self._canonical[form] = key
+        return added
+
+    def add(self, name: str) -> bool:
+        """Register a new name (and alias). Returns False if already known."""
+        with self._lock:
+            added = self._insert(name, self._pending)
+            if len(self._pending) > max(64, len(self._main) // 8):
+                self._merge()
+            return added
+
+    def _merge(self):
+        for form in self._pending:
+            self._main.add(form)
+        self._pending = AhoCorasick(word_boundary=True)
+        self.merges += 1
+
+    def _matches(self, text: str) -> List[str]:
+        """Matched surface forms in text order (by end position), deduplicated."""
+        text_lower = text.lower()
+        with self._lock:
+            hits = list(self._main.finditer(text_lower))
+            if len(self._pending):
+                hits.extend(self._pending.finditer(text_lower))
+                hits.sort(key=lambda m: (m[1], m[0]))
+        seen = {}
+        for _, _, form in hits:
+            seen.setdefault(form, True)
+        return list(seen)
+
+    def find(self, text: str, exclude: Set[str] = None) -> List[str]:
+        """Canonical names mentioned in text, in order of appearance."""
+        exclude = exclude or set()
+        found = {}
+        for form in self._matches(text):
+            name = self._canonical[form]
+            if name not in exclude and form not in exclude:
+                found.setdefault(name, True)
+        return list(found)
+
+    def find_known(self, text: str, known: Container) -> List[str]:
+        """
+        Mentioned names restricted to `known` (e.g. GraphEngine concept keys),
+        returned in whichever spelling `known` uses.
+        """
+        found = {}
+        for form in self._matches(text):
+            for candidate in (form, form.replace('_', ' '), self._canonical[form]):
+                if candidate in known:
+                    found.setdefault(candidate, True)
+                    break
+        return list(found)
+
+
+# Registry: one detector per registry file
+_detectors = {}
+_detectors_lock = threading.Lock()
+
+def get_mention_detector(registry_path: str = "data/registry.json") -> ConceptMentionDetector:
+    key = os.path.abspath(registry_path)
+    with _detectors_lock:
+        if key not in _detectors:
+            names = []
+            try:
+                with open(registry_path, 'r') as f:
+                    names = list(json.load(f).keys())
+            except Exception as e:
+                if os.path.exists(registry_path):
+                    print(f"[MentionDetector] Error loading registry: {e}")
+            _detectors[key] = ConceptMentionDetector(names)
+        return _detectors[key]
+
+def notify_new_name(registry_path: str, name: str):
+    """Called by IdentityManager.mint_id. No-op until a detector has been built."""
+    detector = _detectors.get(os.path.abspath(registry_path))
+    if detector is not None:
+        detector.add(name)
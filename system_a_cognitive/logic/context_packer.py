@@ -0,0 +1,123 @@
+"""
+Context Packer (WMCS v1.0)
+Fits the Navigator's final blocks into a token budget for the logic-engine
+prompt.
+
+Every concept gets a one-line header (name, ID, path confidence, clipped
+definition). Its claims, facets and deep-layer notes become candidate lines,
+deduplicated per concept (merged concepts repeat claims) and ranked by
+query-term overlap x path confidence (_computed_confidence) x claim
+confidence. The best lines are taken until the budget is spent. Tokens are
+estimated as characters / 4, so no tokenizer is needed.
+"""
+import json
+import math
+from typing import Dict, List
+
+from system_a_cognitive.memory.bm25_index import tokenize
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _clip(text, limit: int) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= limit else text[:limit - 3].rstrip() + "..."
+
+
+class ContextPacker:
+    def __init__(self, max_tokens: int = 1500, definition_chars: int = 300, line_chars: int = 200):
+        self.max_tokens = max_tokens
+        self.definition_chars = definition_chars
+        self.line_chars = line_chars
+
+    def _header(self, block: Dict) -> str:
+        core = block.get("CORE") if isinstance(block.get("CORE"), dict) else block
+        name = core.get("name") or block.get("name") or "Unknown"
+        cid = core.get("id") or block.get("id") or {}
+        gid = f"{cid.get('group', 0)},{cid.get('item', 0)}" if isinstance(cid, dict) else str(cid)
+        definition = core.get("definition") or block.get("definition") or \
+            (block.get("surface_layer") or {}).get("definition", "")
+        line = f"Concept: {name} (ID: {gid}, Conf: {block.get('_computed_confidence', 1.0):.2f})"
+        return f"{line} - {_clip(definition, self.definition_chars)}" if definition else line
+
+    def _items(self, block: Dict) -> List[Dict]:
+        """Deduplicated candidate lines of one concept: {"text", "confidence"}."""
+        items = {}
+
+        def add(key, text, confidence=1.0):
+            text = _clip(text, self.line_chars)
+            if not text.strip(" -:"):
+                return
+            seen = items.get(key)
+            if seen is None or confidence > seen["confidence"]:
+                items[key] = {"text": text, "confidence": confidence}
+
+        for claim in block.get("claims") or []:
+            if not isinstance(claim, dict):
+                continue
+            predicate = str(claim.get("predicate", "rel"))
+            obj = claim.get("object", "")
+            obj = obj if isinstance(obj, str) else json.dumps(obj, default=str)
+            try:
+                confidence = float((claim.get("epistemic") or {}).get("confidence", 1.0))
+            except (TypeError, ValueError):
+                confidence = 1.0
+            add(("claim", predicate.lower(), " ".join(obj.lower().split())), f"{predicate}: {obj}", confidence)
+
+        for facet, content in (block.get("facets") or {}).items():
+            content = content if isinstance(content, str) else json.dumps(content, default=str)
+            add(("facet", facet.lower()), f"{facet}: {content}")
+
+        deep = block.get("deep_layer") or {}
+        for field in ("mechanism", "origin"):
+            if deep.get(field):
+                add((field,), f"{field}: {deep[field]}")
+        return list(items.values())
+
+    def pack(self, blocks: List[Dict], query: str) -> Dict:
+        """
+        Returns {"blocks": [one "header\\n - line..." string per concept],
+                 "concepts": n, "tokens": estimated, "kept": lines, "dropped": lines}.
+        """
+        query_terms = set(tokenize(query))
+        ordered = sorted(enumerate(blocks), key=lambda ib: -float(ib[1].get("_computed_confidence", 1.0)))
+
+        budget = self.max_tokens
+        headers = {}
+        candidates = []
+        for idx, block in ordered:
+            header = self._header(block)
+            cost = estimate_tokens(header) + 1
+            if cost > budget:
+                continue
+            budget -= cost
+            headers[idx] = header
+            path_conf = float(block.get("_computed_confidence", 1.0))
+            for item in self._items(block):
+                terms = set(tokenize(item["text"]))
+                relevance = len(terms & query_terms) / len(query_terms) if query_terms else 0.0
+                score = (1.0 + relevance) * path_conf * item["confidence"]
+                candidates.append((score, idx, item["text"]))
+
+        lines = {idx: [] for idx in headers}
+        kept = 0
+        for score, idx, text in sorted(candidates, key=lambda c: -c[0]):
+            line = f" - {text}"
+            cost = estimate_tokens(line) + 1
+            if cost <= budget:
+                budget -= cost
+                lines[idx].append(line)
+                kept += 1
+
+        packed = ["\n".join([headers[idx]] + lines[idx]) for idx, _ in ordered if idx in headers]
+        return {
+            "blocks": packed,
+            "concepts": len(packed),
+            "tokens": self.max_tokens - budget,
+            "kept": kept,
+            "dropped": len(candidates) - kept
+        }
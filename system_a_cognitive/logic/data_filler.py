@@ -9,6 +9,7 @@ from typing import Dict, List, Optional, Tuple
 from termcolor import colored
 
 from system_a_cognitive.logic.type_engine import get_type_engine
+from system_a_cognitive.memory.concept_corpus import get_concept_corpus
 
 
 class DataFiller:
@@ -178,16 +179,16 @@ class DataFiller:
     def batch_audit(self, directory: str) -> List[Dict]:
         """Audit all concepts in a directory."""
         reports = []
+        corpus = get_concept_corpus(directory)
         
-        for fname in os.listdir(directory):
-            if fname.endswith(".json"):
-                path = os.path.join(directory, fname)
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        concept = json.load(f)
-                    reports.append(self.audit_concept(concept))
-                except Exception as e:
-                    reports.append({"name": fname, "error": str(e)})
+        for fname, concept in corpus.items():
+            try:
+                reports.append(self.audit_concept(concept))
+            except Exception as e:
+                reports.append({"name": fname, "error": str(e)})
+        
+        for fname, error in corpus.errors.items():
+            reports.append({"name": fname, "error": error})
         
         return reports
 
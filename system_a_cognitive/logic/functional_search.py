@@ -1,6 +1,4 @@
-import json
-import os
-from termcolor import colored
+from system_a_cognitive.memory.concept_corpus import get_concept_corpus
 
 class FunctionalSearcher:
     def __init__(self, concepts_dir="data/concepts"):
@@ -15,17 +13,9 @@ class FunctionalSearcher:
         self.graph = {}
         self.role_index = {}
         
-        if not os.path.exists(self.concepts_dir):
-            return
-
-        for filename in os.listdir(self.concepts_dir):
-            if not filename.endswith(".json"): continue
-            
+        corpus = get_concept_corpus(self.concepts_dir)
+        for filename, data in corpus.items():
             try:
-                path = os.path.join(self.concepts_dir, filename)
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                    
                 # Store by ID string "Group,Item"
                 if "id" in data:
                     grp = data["id"].get("group")
@@ -54,6 +44,9 @@ class FunctionalSearcher:
 
             except Exception as e:
                 print(f"[FuncSearch] Error loading {filename}: {e}")
+
+        for filename, error in list(corpus.errors.items()):
+            print(f"[FuncSearch] Error loading {filename}: {error}")
         
         print(f"[FuncSearch] Indexed {len(self.graph)} concepts and {len(self.role_index)} functional roles.")
 
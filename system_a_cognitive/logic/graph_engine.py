@@ -2,37 +2,84 @@
 Graph Navigation Engine (WMCS v1.0)
 Multi-hop traversal over concept relationships.
 Finds paths, implications, and dependencies.
+
+Edges live in a CompiledGraph (CSR arrays over interned IDs) that is loaded
+by mmap from data/concepts_graph/ and recompiled only when concepts change.
 """
+import heapq
 import json
 import os
 from collections import deque
+from collections.abc import Mapping
 from typing import Dict, List, Optional, Set, Tuple
 
+import numpy as np
+
+from system_a_cognitive.memory.concept_corpus import get_concept_corpus
+from system_a_cognitive.logic.graph_snapshot import CompiledGraph, concepts_fingerprint
+
+
+class _LazyConceptMap(Mapping):
+    """Read-only {name: concept} view that parses concept files on first access."""
+    
+    def __init__(self, concepts_dir: str, files: Dict[str, str]):
+        self._corpus = get_concept_corpus(concepts_dir)
+        self._files = files  # {name_lower: filename}
+    
+    def __getitem__(self, name):
+        fname = self._files[name]
+        concept = self._corpus.get(fname)
+        if concept is None:
+            self._files.pop(name, None)  # Deleted or corrupt since the snapshot: stop listing it
+            raise KeyError(name)
+        return concept
+    
+    def __iter__(self):
+        return iter(list(self._files))  # Copy: a failed load drops its name mid-iteration
+    
+    def items(self):
+        """(name, concept) pairs, skipping files deleted or corrupt since the snapshot."""
+        for name in self:
+            try:
+                yield name, self[name]
+            except KeyError:
+                continue
+    
+    def values(self):
+        for _, concept in self.items():
+            yield concept
+    
+    def __len__(self):
+        return len(self._files)
+    
+    def __contains__(self, name):
+        return name in self._files
+
 
 class GraphEngine:
-    def __init__(self, concepts_dir: str = "data/concepts"):
+    def __init__(self, concepts_dir: str = "data/concepts", snapshot_dir: str = None):
         self.concepts_dir = concepts_dir
-        self._concept_cache = {}
-        self._relation_index = {}  # {source_id: [(relation, target_id), ...]}
-        self._reverse_index = {}   # {target_id: [(relation, source_id), ...]}
+        self.snapshot_dir = snapshot_dir or os.path.normpath(concepts_dir) + "_graph"
+        self._edges = []  # Staging list of (source, relation, target) while compiling
+        self._files = {}  # {name_lower: filename} while compiling
+        self._graph = None
         self._build_index()
+        self._concept_cache = _LazyConceptMap(concepts_dir, self._graph.concept_files())
     
     def _build_index(self):
-        """Build relationship index from all concepts."""
-        if not os.path.exists(self.concepts_dir):
+        """Load the compiled snapshot, or rebuild it from the concept files if stale."""
+        fingerprint = concepts_fingerprint(self.concepts_dir)
+        self._graph = CompiledGraph.load(self.snapshot_dir, fingerprint)
+        if self._graph is not None:
             return
         
-        for fname in os.listdir(self.concepts_dir):
-            if not fname.endswith(".json"):
-                continue
-            
-            path = os.path.join(self.concepts_dir, fname)
+        corpus = get_concept_corpus(self.concepts_dir)
+        corpus.refresh()
+        
+        for fname, concept in corpus.items():
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    concept = json.load(f)
-                
                 name = concept.get("CORE", {}).get("name", fname.replace(".json", ""))
-                self._concept_cache[name.lower()] = concept
+                self._files[name.lower()] = fname
                 
                 # Index CONNECTIONS
                 if "CONNECTIONS" in concept:
@@ -77,34 +124,47 @@ class GraphEngine:
                 
             except Exception as e:
                 pass  # Skip invalid files
+        
+        self._graph = CompiledGraph.compile(self._edges, self._files, fingerprint)
+        self._edges, self._files = [], {}
+        
+        if os.path.exists(self.concepts_dir):
+            try:
+                self._graph.save(self.snapshot_dir)
+            except OSError as e:
+                print(f"[GraphEngine] Could not write snapshot: {e}")
     
     def _add_edge(self, source: str, relation: str, target: str):
-        """Add edge to indices."""
+        """Stage an edge for compilation."""
         source_key = source.lower()
         target_key = target.lower() if isinstance(target, str) else str(target).lower()
-        
-        if source_key not in self._relation_index:
-            self._relation_index[source_key] = []
-        self._relation_index[source_key].append((relation, target_key))
-        
-        if target_key not in self._reverse_index:
-            self._reverse_index[target_key] = []
-        self._reverse_index[target_key].append((relation, source_key))
+        self._edges.append((source_key, relation if isinstance(relation, str) else str(relation), target_key))
     
     def get_concept(self, name: str) -> Optional[Dict]:
         """Load concept by name."""
         return self._concept_cache.get(name.lower())
     
+    def _relation_filter(self, relation_type: Optional[str]) -> Optional[int]:
+        """None = any relation; -1 = relation never seen (matches nothing)."""
+        if relation_type is None:
+            return None
+        return self._graph.relation_id(relation_type)
+    
     def walk(self, start: str, relation_type: str = None, depth: int = 2, direction: str = "forward") -> List[Dict]:
         """
         BFS walk from start concept following relations.
         direction: "forward" = follow outgoing, "backward" = follow incoming
         Returns list of {name, relation, depth}
         """
-        start_key = start.lower()
-        visited = set([start_key])
+        g = self._graph
+        start_id = g.node_id(start.lower())
+        if start_id < 0:
+            return []
+        rel_filter = self._relation_filter(relation_type)
+        
+        visited = {start_id}
         results = []
-        queue = deque([(start_key, 0)])
+        queue = deque([(start_id, 0)])
         
         while queue:
             current, current_depth = queue.popleft()
@@ -112,32 +172,147 @@ class GraphEngine:
             if current_depth >= depth:
                 continue
             
-            # Get edges
-            if direction == "forward":
-                edges = self._relation_index.get(current, [])
-            else:
-                edges = self._reverse_index.get(current, [])
+            targets, rels = g.neighbors(current, "forward" if direction == "forward" else "backward")
+            current_name = None
             
-            for relation, target in edges:
-                if relation_type and relation != relation_type:
+            for target, rel in zip(targets.tolist(), rels.tolist()):
+                if rel_filter is not None and rel != rel_filter:
                     continue
                 
                 if target not in visited:
                     visited.add(target)
+                    if current_name is None:
+                        current_name = g.name(current)
                     results.append({
-                        "name": target,
-                        "relation": relation,
+                        "name": g.name(target),
+                        "relation": g.relations[rel],
                         "depth": current_depth + 1,
-                        "from": current
+                        "from": current_name
                     })
                     queue.append((target, current_depth + 1))
         
         return results
     
-    def find_path(self, from_name: str, to_name: str, max_depth: int = 5) -> Optional[List[Dict]]:
+    def _relation_ids(self, relation_type) -> Optional[np.ndarray]:
+        """Relation filter (str or list of str) -> array of relation IDs; None = any."""
+        if relation_type is None:
+            return None
+        names = [relation_type] if isinstance(relation_type, str) else list(relation_type)
+        return np.array([self._graph.relation_id(r) for r in names if self._graph.relation_id(r) >= 0], dtype=np.int64)
+    
+    def _bidirectional_bfs(self, start_id: int, end_id: int, max_depth: int, rel_ids=None,
+                           direction: str = "forward", banned_nodes=(), banned_edges=()) -> Optional[List[Tuple[int, int, bool]]]:
+        """
+        Level-synchronous bidirectional BFS over the CSR arrays.
+        Each round expands the smaller of the two frontiers by one full level.
+        Returns [(node, relation_id, reversed), ...] from start to end, or None.
+        `reversed` marks steps that walk an edge against its stored direction.
+        """
+        g = self._graph
+        n = g.num_nodes
+        if start_id == end_id:
+            return [(start_id, -1, False)]
+        
+        # Adjacency used by each side; "backward" follows incoming edges.
+        if direction == "forward":
+            s_dirs, t_dirs = ("forward",), ("backward",)
+        elif direction == "backward":
+            s_dirs, t_dirs = ("backward",), ("forward",)
+        else:
+            s_dirs = t_dirs = ("forward", "backward")
+        
+        # Per side: distance (-1 unseen), parent, relation, adjacency used
+        dist = [np.full(n, -1, dtype=np.int32), np.full(n, -1, dtype=np.int32)]
+        parent = [np.full(n, -1, dtype=np.int64), np.full(n, -1, dtype=np.int64)]
+        prel = [np.full(n, -1, dtype=np.int64), np.full(n, -1, dtype=np.int64)]
+        pdir = [np.zeros(n, dtype=np.int8), np.zeros(n, dtype=np.int8)]  # 0 forward adj, 1 backward adj
+        banned = np.zeros(n, dtype=bool)
+        if banned_nodes:
+            banned[list(banned_nodes)] = True
+        
+        dist[0][start_id] = 0
+        dist[1][end_id] = 0
+        frontiers = [np.array([start_id], dtype=np.int64), np.array([end_id], dtype=np.int64)]
+        levels = [0, 0]
+        side_dirs = [s_dirs, t_dirs]
+        
+        while levels[0] + levels[1] < max_depth:
+            if len(frontiers[0]) == 0 or len(frontiers[1]) == 0:
+                return None
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            found = []
+            
+            for d in side_dirs[side]:
+                srcs, nbrs, rels = g.expand(frontiers[side], d)
+                if len(nbrs) == 0:
+                    continue
+                mask = (dist[side][nbrs] < 0) & ~banned[nbrs]
+                if rel_ids is not None:
+                    mask &= np.isin(rels, rel_ids)
+                if banned_edges:
+                    # Edges are banned in path order (start -> end)
+                    pairs = zip(srcs.tolist(), nbrs.tolist()) if side == 0 else zip(nbrs.tolist(), srcs.tolist())
+                    mask &= np.array([p not in banned_edges for p in pairs], dtype=bool)
+                srcs, nbrs, rels = srcs[mask], nbrs[mask], rels[mask]
+                if len(nbrs) == 0:
+                    continue
+                nbrs, first = np.unique(nbrs, return_index=True)
+                dist[side][nbrs] = levels[side] + 1
+                parent[side][nbrs] = srcs[first]
+                prel[side][nbrs] = rels[first]
+                pdir[side][nbrs] = 0 if d == "forward" else 1
+                found.append(nbrs)
+            
+            levels[side] += 1
+            frontiers[side] = np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+            
+            # Meeting check: any newly reached node already seen by the other side
+            other = 1 - side
+            hits = frontiers[side][dist[other][frontiers[side]] >= 0]
+            if len(hits):
+                totals = dist[side][hits] + dist[other][hits]
+                meet = int(hits[np.argmin(totals)])
+                return self._join_path(meet, parent, prel, pdir, start_id, end_id)
+        
+        return None
+    
+    def _join_path(self, meet, parent, prel, pdir, start_id, end_id) -> List[Tuple[int, int, bool]]:
+        # Start side: walk parents back to start, then flip
+        head = []
+        node = meet
+        while node != start_id:
+            head.append((node, int(prel[0][node]), bool(pdir[0][node] == 1)))
+            node = int(parent[0][node])
+        head.append((start_id, -1, False))
+        head.reverse()
+        
+        # End side: each parent is the next node towards end
+        path = head
+        node = meet
+        while node != end_id:
+            nxt = int(parent[1][node])
+            # Found via backward adjacency => stored edge node -> nxt (same direction as the path)
+            path.append((nxt, int(prel[1][node]), bool(pdir[1][node] == 0)))
+            node = nxt
+        return path
+    
+    def _format_path(self, steps: List[Tuple[int, int, bool]]) -> List[Dict]:
+        g = self._graph
+        path = []
+        for i, (node, rel, rev) in enumerate(steps):
+            step = {"name": g.name(node), "relation": "start" if i == 0 else g.relations[rel]}
+            if rev:
+                step["reversed"] = True
+            path.append(step)
+        return path
+    
+    def find_path(self, from_name: str, to_name: str, max_depth: int = 5,
+                  relation_type=None, direction: str = "forward") -> Optional[List[Dict]]:
         """
-        Find shortest path between two concepts.
-        Returns list of {name, relation} or None if no path.
+        Find shortest path between two concepts (bidirectional BFS).
+        relation_type: optional relation name or list of names to follow.
+        direction: "forward" (outgoing edges), "backward" (incoming) or "both".
+        Returns list of {name, relation[, reversed]} or None if no path.
         """
         start_key = from_name.lower()
         end_key = to_name.lower()
@@ -145,43 +320,68 @@ class GraphEngine:
         if start_key == end_key:
             return [{"name": start_key, "relation": "self"}]
         
-        visited = {start_key: None}  # {node: (parent, relation)}
-        queue = deque([start_key])
+        g = self._graph
+        start_id = g.node_id(start_key)
+        end_id = g.node_id(end_key)
+        if start_id < 0 or end_id < 0:
+            return None
         
-        while queue:
-            current = queue.popleft()
-            
-            # Check depth
-            depth = 0
-            node = current
-            while visited.get(node):
-                depth += 1
-                node = visited[node][0]
-            if depth >= max_depth:
-                continue
+        steps = self._bidirectional_bfs(start_id, end_id, max_depth, self._relation_ids(relation_type), direction)
+        return self._format_path(steps) if steps else None
+    
+    def k_shortest_paths(self, from_name: str, to_name: str, k: int = 3, max_depth: int = 5,
+                         relation_type=None, direction: str = "forward") -> List[List[Dict]]:
+        """
+        Up to k loopless shortest paths, shortest first (Yen's algorithm on top
+        of the bidirectional BFS). Same arguments and step format as find_path.
+        """
+        g = self._graph
+        start_id = g.node_id(from_name.lower())
+        end_id = g.node_id(to_name.lower())
+        if start_id < 0 or end_id < 0 or start_id == end_id or k <= 0:
+            return []
+        
+        rel_ids = self._relation_ids(relation_type)
+        first = self._bidirectional_bfs(start_id, end_id, max_depth, rel_ids, direction)
+        if not first:
+            return []
+        
+        accepted = [first]
+        seen = {tuple(s[0] for s in first)}
+        candidates = []  # heap of (length, counter, steps)
+        counter = 0
+        
+        while len(accepted) < k:
+            prev = accepted[-1]
+            for i in range(len(prev) - 1):
+                spur = prev[i][0]
+                root = prev[:i + 1]
+                root_nodes = [s[0] for s in root]
+                
+                banned_edges = set()
+                for p in accepted:
+                    if len(p) > i + 1 and [s[0] for s in p[:i + 1]] == root_nodes:
+                        banned_edges.add((p[i][0], p[i + 1][0]))
+                
+                spur_path = self._bidirectional_bfs(
+                    spur, end_id, max_depth - i, rel_ids, direction,
+                    banned_nodes=set(root_nodes[:-1]), banned_edges=banned_edges
+                )
+                if not spur_path:
+                    continue
+                
+                steps = root + spur_path[1:]
+                key = tuple(s[0] for s in steps)
+                if key not in seen:
+                    seen.add(key)
+                    heapq.heappush(candidates, (len(steps), counter, steps))
+                    counter += 1
             
-            # Get neighbors
-            for relation, target in self._relation_index.get(current, []):
-                if target not in visited:
-                    visited[target] = (current, relation)
-                    
-                    if target == end_key:
-                        # Reconstruct path
-                        path = []
-                        node = target
-                        while node:
-                            if visited[node]:
-                                parent, rel = visited[node]
-                                path.append({"name": node, "relation": rel})
-                                node = parent
-                            else:
-                                path.append({"name": node, "relation": "start"})
-                                break
-                        return list(reversed(path))
-                    
-                    queue.append(target)
+            if not candidates:
+                break
+            accepted.append(heapq.heappop(candidates)[2])
         
-        return None
+        return [self._format_path(p) for p in accepted]
     
     def get_implications(self, concept_name: str, depth: int = 3) -> List[str]:
         """What does this concept causally lead to?"""
@@ -208,14 +408,12 @@ class GraphEngine:
     
     def get_stats(self) -> Dict:
         """Return index statistics."""
+        g = self._graph
         return {
             "concepts": len(self._concept_cache),
-            "forward_edges": sum(len(v) for v in self._relation_index.values()),
-            "reverse_edges": sum(len(v) for v in self._reverse_index.values()),
-            "relation_types": list(set(
-                rel for edges in self._relation_index.values() 
-                for rel, _ in edges
-            ))
+            "forward_edges": int(len(g.fwd_indices)),
+            "reverse_edges": int(len(g.rev_indices)),
+            "relation_types": [g.relations[r] for r in sorted(set(g.fwd_rel.tolist()))]
         }
 
 
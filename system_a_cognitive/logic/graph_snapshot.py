@@ -0,0 +1,248 @@
+"""
+Compiled Graph Snapshot (WMCS v1.0)
+Binary, mmap-able form of the concept relation graph.
+
+Node names and relation types are interned to integer IDs; edges are stored
+as CSR adjacency (indptr / indices / relation-id arrays) in both directions.
+The snapshot lives next to the concept directory (data/concepts_graph/) and
+is rebuilt only when the concept files change.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+SNAPSHOT_VERSION = 1
+
+_ARRAYS = [
+    "names_blob", "name_offsets", "files_blob", "file_offsets",
+    "fwd_indptr", "fwd_indices", "fwd_rel",
+    "rev_indptr", "rev_indices", "rev_rel",
+]
+
+
+def concepts_fingerprint(concepts_dir: str) -> str:
+    """Cheap change detector: hash of (filename, mtime, size) for every concept file."""
+    h = hashlib.sha1()
+    if os.path.exists(concepts_dir):
+        entries = []
+        with os.scandir(concepts_dir) as it:
+            for e in it:
+                if e.name.endswith(".json"):
+                    st = e.stat()
+                    entries.append((e.name, st.st_mtime_ns, st.st_size))
+        for name, mtime, size in sorted(entries):
+            h.update(f"{name}|{mtime}|{size}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _pack_strings(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        offsets[1:] = np.cumsum([len(b) for b in encoded])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+
+def _csr(keys: np.ndarray, others: np.ndarray, rels: np.ndarray, n: int):
+    order = np.argsort(keys, kind="stable")  # Stable: keeps per-node insertion order
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    if len(keys):
+        indptr[1:] = np.cumsum(np.bincount(keys, minlength=n))
+    return indptr, others[order].astype(np.int32), rels[order].astype(np.int32)
+
+
+class CompiledGraph:
+    """Read-only CSR graph over interned node and relation IDs."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], relations: List[str], fingerprint: str = ""):
+        for key in _ARRAYS:
+            setattr(self, key, arrays[key])
+        self.relations = list(relations)
+        self.fingerprint = fingerprint
+        self._rel_ids = {r: i for i, r in enumerate(self.relations)}
+        self._node_ids = None  # name -> id, built on first lookup
+
+    # --- Construction ---
+
+    @classmethod
+    def compile(cls, edges: Iterable[Tuple[str, str, str]], concept_files: Dict[str, str],
+                fingerprint: str = "") -> "CompiledGraph":
+        """
+        edges: (source_key, relation, target_key) in insertion order.
+        concept_files: {node_key: filename} for nodes backed by a concept file.
+        """
+        node_ids = {}
+        names = []
+
+        def intern(name):
+            nid = node_ids.get(name)
+            if nid is None:
+                nid = node_ids[name] = len(names)
+                names.append(name)
+            return nid
+
+        for name in concept_files:
+            intern(name)
+
+        rel_ids = {}
+        relations = []
+        src, dst, rel = [], [], []
+        for s, r, t in edges:
+            rid = rel_ids.get(r)
+            if rid is None:
+                rid = rel_ids[r] = len(relations)
+                relations.append(r)
+            src.append(intern(s))
+            dst.append(intern(t))
+            rel.append(rid)
+
+        n = len(names)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        rel = np.asarray(rel, dtype=np.int64)
+
+        arrays = {}
+        arrays["names_blob"], arrays["name_offsets"] = _pack_strings(names)
+        arrays["files_blob"], arrays["file_offsets"] = _pack_strings([concept_files.get(nm, "") for nm in names])
+        arrays["fwd_indptr"], arrays["fwd_indices"], arrays["fwd_rel"] = _csr(src, dst, rel, n)
+        arrays["rev_indptr"], arrays["rev_indices"], arrays["rev_rel"] = _csr(dst, src, rel, n)
+
+        graph = cls(arrays, relations, fingerprint)
+        graph._node_ids = node_ids
+        return graph
+
+    # --- Persistence ---
+
+    def save(self, snapshot_dir: str):
+        """
+        Write the snapshot into a sibling temp dir, then swap it into place.
+        Readers that mmapped the previous snapshot keep its (now unlinked)
+        files intact; they are never truncated or rewritten.
+        """
+        snapshot_dir = os.path.normpath(snapshot_dir)
+        parent = os.path.dirname(snapshot_dir) or "."
+        os.makedirs(parent, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=os.path.basename(snapshot_dir) + ".tmp-", dir=parent)
+        try:
+            for key in _ARRAYS:
+                np.save(os.path.join(tmp_dir, f"{key}.npy"), np.asarray(getattr(self, key)))
+            meta = {
+                "version": SNAPSHOT_VERSION,
+                "fingerprint": self.fingerprint,
+                "relations": self.relations,
+                "nodes": self.num_nodes,
+                "edges": self.num_edges
+            }
+            with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+
+            # A directory cannot be replaced while it has entries: move the old one aside first
+            old_dir = None
+            if os.path.exists(snapshot_dir):
+                old_dir = tempfile.mkdtemp(prefix=os.path.basename(snapshot_dir) + ".old-", dir=parent)
+                os.replace(snapshot_dir, os.path.join(old_dir, "snapshot"))
+            os.replace(tmp_dir, snapshot_dir)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        if old_dir:
+            shutil.rmtree(old_dir, ignore_errors=True)  # Unlinks; mmapped inodes live on until unmapped
+
+    @classmethod
+    def load(cls, snapshot_dir: str, fingerprint: str = None) -> Optional["CompiledGraph"]:
+        """mmap a snapshot. Returns None if missing, corrupt or stale."""
+        try:
+            with open(os.path.join(snapshot_dir, "meta.json"), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("version") != SNAPSHOT_VERSION:
+            return None
+        if fingerprint is not None and meta.get("fingerprint") != fingerprint:
+            return None
+
+        arrays = {}
+        try:
+            for key in _ARRAYS:
+                path = os.path.join(snapshot_dir, f"{key}.npy")
+                try:
+                    arrays[key] = np.load(path, mmap_mode="r")
+                except ValueError:
+                    arrays[key] = np.load(path)  # Zero-length arrays cannot be mmapped
+        except OSError:
+            return None
+
+        return cls(arrays, meta.get("relations", []), meta.get("fingerprint", ""))
+
+    # --- Lookups ---
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.name_offsets) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.fwd_indices)
+
+    def _string(self, blob, offsets, i: int) -> str:
+        return bytes(blob[offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+    def name(self, node_id: int) -> str:
+        return self._string(self.names_blob, self.name_offsets, node_id)
+
+    def file_of(self, node_id: int) -> str:
+        """Concept filename for a node ("" for nodes only seen as edge targets)."""
+        return self._string(self.files_blob, self.file_offsets, node_id)
+
+    def node_id(self, name: str) -> int:
+        """Interned ID for a node key, or -1."""
+        if self._node_ids is None:
+            self._node_ids = {self.name(i): i for i in range(self.num_nodes)}
+        return self._node_ids.get(name, -1)
+
+    def relation_id(self, relation: str) -> int:
+        return self._rel_ids.get(relation, -1)
+
+    def concept_files(self) -> Dict[str, str]:
+        """{node_key: filename} for every concept-backed node."""
+        result = {}
+        lengths = np.diff(self.file_offsets)
+        for i in np.flatnonzero(lengths):
+            result[self.name(int(i))] = self.file_of(int(i))
+        return result
+
+    def neighbors(self, node_id: int, direction: str = "forward") -> Tuple[np.ndarray, np.ndarray]:
+        """(neighbor_ids, relation_ids) slices for one node."""
+        if direction == "forward":
+            indptr, indices, rel = self.fwd_indptr, self.fwd_indices, self.fwd_rel
+        else:
+            indptr, indices, rel = self.rev_indptr, self.rev_indices, self.rev_rel
+        a, b = indptr[node_id], indptr[node_id + 1]
+        return indices[a:b], rel[a:b]
+
+    def expand(self, frontier: np.ndarray, direction: str = "forward") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        All edges leaving a whole frontier at once.
+        Returns parallel arrays (source_ids, neighbor_ids, relation_ids).
+        """
+        if direction == "forward":
+            indptr, indices, rel = self.fwd_indptr, self.fwd_indices, self.fwd_rel
+        else:
+            indptr, indices, rel = self.rev_indptr, self.rev_indices, self.rev_rel
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty
+        # Edge positions: for each frontier node, starts[i] .. starts[i] + counts[i]
+        shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        pos = shift + np.arange(total)
+        return np.repeat(frontier, counts), indices[pos].astype(np.int64), rel[pos].astype(np.int64)
@@ -1,11 +1,14 @@
 import json
 import os
+import threading
+from system_a_cognitive.logic.concept_mentions import notify_new_name
 
 class IdentityManager:
     def __init__(self, registry_path="data/registry.json"):
         self.registry_path = registry_path
         self.registry = {} # name -> {"group": G, "item": I}
         self.next_ids = {} # group_int -> next_item_int
+        self._lock = threading.RLock() # mint_id may be called from parallel research branches
         self.load_registry()
 
     def load_registry(self):
@@ -49,19 +52,21 @@ class IdentityManager:
         If name already exists, returns existing ID.
         """
         name_key = name.lower()
-        if name_key in self.registry:
-            return self.registry[name_key]
+        with self._lock:
+            if name_key in self.registry:
+                return self.registry[name_key]
 
-        # Get next item ID
-        group_id = int(group_id)
-        next_item = self.next_ids.get(group_id, 1)
-        
-        new_id = {"group": group_id, "item": next_item}
-        self.registry[name_key] = new_id
-        
-        # Update state
-        self.next_ids[group_id] = next_item + 1
-        self._save_registry()
+            # Get next item ID
+            group_id = int(group_id)
+            next_item = self.next_ids.get(group_id, 1)
+            
+            new_id = {"group": group_id, "item": next_item}
+            self.registry[name_key] = new_id
+            
+            # Update state
+            self.next_ids[group_id] = next_item + 1
+            self._save_registry()
+        notify_new_name(self.registry_path, name_key)
         
         return new_id
 
@@ -189,9 +189,14 @@ class InferenceEngine:
         
         return result
     
-    def explain_causation(self, from_concept: str, to_concept: str) -> str:
-        """Find and explain the causal chain between two concepts."""
-        path = self.graph.find_path(from_concept, to_concept)
+    def explain_causation(self, from_concept: str, to_concept: str,
+                          relation_type=None, direction: str = "forward") -> str:
+        """
+        Find and explain the causal chain between two concepts.
+        relation_type / direction are passed through to GraphEngine.find_path.
+        """
+        path = self.graph.find_path(from_concept, to_concept,
+                                    relation_type=relation_type, direction=direction)
         
         if not path:
             return f"No causal chain found between {from_concept} and {to_concept}"
@@ -201,6 +206,8 @@ class InferenceEngine:
         for i, step in enumerate(path):
             if i == 0:
                 lines.append(f"1. Start: {step['name']}")
+            elif step.get("reversed"):
+                lines.append(f"{i+1}. <--({step['relation']})-- {step['name']}")
             else:
                 lines.append(f"{i+1}. --({step['relation']})--> {step['name']}")
         
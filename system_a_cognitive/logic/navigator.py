@@ -4,18 +4,35 @@ import re
 
 class ConceptNavigator:
     def __init__(self, kernel):
+        self.kernel = kernel
         self.blocks = kernel.blocks
         self.client = kernel.llm_client
         self.id_map = {}
-        self._build_id_map()
+        # Kernel-owned persistent index: O(1) resolution, blocks loaded only when visited
+        self.id_index = getattr(kernel, 'id_index', None)
+        if self.id_index is None:
+            self._build_id_map()
 
     def _build_id_map(self):
-        """Map 'G,I' strings to Block objects for fast lookup."""
+        """Map 'G,I' strings to Block objects (fallback for kernels without an ID index)."""
         for b in self.blocks.values():
             if "id" in b:
                 key = f"{b['id']['group']},{b['id']['item']}"
                 self.id_map[key] = b
 
+    def _target_name(self, target_key):
+        """Name of the concept behind a 'G,I' key, or None if unknown."""
+        if self.id_index is not None:
+            return self.id_index.name_of(target_key)
+        if target_key in self.id_map:
+            return self.id_map[target_key].get('name', 'Unknown')
+        return None
+
+    def _load_target(self, target_key):
+        if self.id_index is not None:
+            return self.kernel.get_block_by_id(target_key)
+        return self.id_map.get(target_key)
+
     def get_exits(self, block):
         """
         Finds all outbound links from the block.
@@ -41,8 +58,8 @@ class ConceptNavigator:
             
             for g, i in matches:
                 target_key = f"{g},{i}"
-                if target_key in self.id_map:
-                    target_name = self.id_map[target_key].get('name', 'Unknown')
+                target_name = self._target_name(target_key)
+                if target_name is not None:
                     exits.append({
                         'dimension': f"CLAIM:{claim.get('predicate','rel')}", 
                         'target_id': target_key,
@@ -58,8 +75,8 @@ class ConceptNavigator:
             matches = re.findall(r'\((\d+),\s*(\d+)\)', content_str)
             for g, i in matches:
                 target_key = f"{g},{i}"
-                if target_key in self.id_map:
-                    target_name = self.id_map[target_key].get('name', 'Unknown')
+                target_name = self._target_name(target_key)
+                if target_name is not None:
                     exits.append({
                         'dimension': facet_name,
                         'target_id': target_key,
@@ -130,7 +147,9 @@ class ConceptNavigator:
                 t_id = selected['target_id']
                 
                 if t_id not in visited_ids:
-                    new_block = self.id_map[t_id]
+                    new_block = self._load_target(t_id)
+                    if new_block is None:
+                        break
                     
                     # MATH: Propagate Confidence
                     new_conf = current_path_confidence * selected['link_confidence']
@@ -141,6 +160,10 @@ class ConceptNavigator:
                     
                     current_context.append(new_block)
                     visited_ids.add(t_id)
+                    emit = getattr(self.kernel, "emit", None) # Streamed to /query/stream
+                    if emit:
+                        emit("hop", source=focus_block.get('name'), target=new_block.get('name'),
+                             dimension=selected['dimension'], confidence=round(new_conf, 3))
                     
                     focus_block = new_block
                     current_path_confidence = new_conf
@@ -7,6 +7,7 @@ import os
 import re
 from typing import List, Dict, Optional, Set
 from system_a_cognitive.logic.identity import IdentityManager
+from system_a_cognitive.logic.concept_mentions import get_mention_detector
 
 
 class RelationBuilder:
@@ -20,6 +21,7 @@ class RelationBuilder:
         self.concepts_dir = concepts_dir
         self._name_cache = {}  # Cache of lowercased names for fast lookup
         self._build_name_cache()
+        self.mentions = get_mention_detector(self.identity_manager.registry_path)
     
     def _build_name_cache(self):
         """Build cache of all concept names for matching."""
@@ -29,7 +31,7 @@ class RelationBuilder:
     def get_id_str(self, name: str) -> Optional[str]:
         """Get (group, item) string for a concept name."""
         key = name.lower().replace(' ', '_')
-        id_data = self._name_cache.get(key)
+        id_data = self._name_cache.get(key) or self.identity_manager.get_id(key) or self.identity_manager.get_id(name)
         if id_data:
             return f"({id_data['group']}, {id_data['item']})"
         return None
@@ -39,24 +41,9 @@ class RelationBuilder:
         Find concept names mentioned in text.
         Returns list of names that exist in the registry.
         """
-        exclude_names = exclude_names or set()
-        found = []
-        
-        # Simple approach: check each registered name against text
-        text_lower = text.lower()
-        
-        for name in self._name_cache.keys():
-            # Skip very short names (too many false positives)
-            if len(name) < 3:
-                continue
-            # Skip excluded names (e.g., the concept itself)
-            if name in exclude_names:
-                continue
-            # Check if name appears in text (word boundary)
-            if re.search(rf'\b{re.escape(name)}\b', text_lower):
-                found.append(name)
-        
-        return found
+        # Single pass over the text with the shared automaton
+        # (names shorter than 3 chars are not registered: too many false positives)
+        return self.mentions.find(text, exclude=exclude_names)
     
     def add_relation(self, block: Dict, predicate: str, target_name: str) -> bool:
         """
@@ -0,0 +1,261 @@
+"""
+ANN Index (WMCS v1.0)
+Self-contained IVF-Flat approximate nearest-neighbour index on NumPy.
+
+Vectors (L2-normalized, cosine = dot product) are clustered by spherical
+k-means into `nlist` inverted lists, each stored as one contiguous float32
+block. A query scores the centroids, then scans only the `nprobe` closest
+lists exactly. Inserts go to the nearest list (the index trains itself once
+`train_threshold` vectors are present); deletes are tombstones that are
+compacted away once they exceed a fraction of the index.
+"""
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+INDEX_VERSION = 1
+TRAIN_PER_LIST = 16 # k-means sample size per inverted list
+
+
+class IVFIndex:
+    def __init__(self, dim: int, nlist: Optional[int] = None, nprobe: int = 8,
+                 train_threshold: int = 4096, compact_ratio: float = 0.3):
+        self.dim = dim
+        self.nlist = nlist # None = 4 * sqrt(N) at training time
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.compact_ratio = compact_ratio
+        self._reset(None)
+
+    def _reset(self, centroids: Optional[np.ndarray]):
+        self.centroids = centroids # (nlist, dim) or None (untrained: one list, exact scan)
+        n = 1 if centroids is None else len(centroids)
+        self._vecs = [np.zeros((0, self.dim), dtype=np.float32) for _ in range(n)]
+        self._sizes = np.zeros(n, dtype=np.int64)
+        self._labels = [[] for _ in range(n)]
+        self._alive = [np.zeros(0, dtype=bool) for _ in range(n)]
+        self._where = {} # label -> (list, slot)
+        self.tombstones = 0
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, label):
+        return label in self._where
+
+    # --- Build ---
+
+    @staticmethod
+    def _normalize(vectors) -> np.ndarray:
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _live(self) -> Tuple[List, np.ndarray]:
+        labels, blocks = [], []
+        for lst in range(len(self._vecs)):
+            alive = self._alive[lst][:self._sizes[lst]]
+            labels.extend(l for l, a in zip(self._labels[lst], alive) if a)
+            blocks.append(self._vecs[lst][:self._sizes[lst]][alive])
+        return labels, (np.concatenate(blocks) if blocks else np.zeros((0, self.dim), dtype=np.float32))
+
+    def train(self, vectors: np.ndarray, iters: int = 8, seed: int = 0):
+        """Spherical k-means on (a sample of) `vectors`, then re-file every live vector."""
+        vectors = self._normalize(vectors)
+        nlist = self.nlist or int(4 * np.sqrt(len(vectors)))
+        nlist = max(1, min(nlist, len(vectors)))
+        rng = np.random.default_rng(seed)
+        sample = vectors[rng.choice(len(vectors), min(len(vectors), nlist * TRAIN_PER_LIST), replace=False)]
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(iters):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(assign, kind="stable")
+            lists, starts = np.unique(assign[order], return_index=True)
+            sums = centroids.copy() # Empty lists keep their centroid
+            sums[lists] = np.add.reduceat(sample[order], starts, axis=0)
+            centroids = self._normalize(sums)
+
+        labels, live = self._live()
+        self._reset(centroids)
+        if labels:
+            self._insert(labels, live)
+
+    def build(self, labels: List, vectors: np.ndarray):
+        """Train on `vectors` and index them (replaces the current contents)."""
+        self._reset(None)
+        vectors = self._normalize(vectors)
+        if len(vectors):
+            self.train(vectors) # Empty: only computes centroids
+            self._insert(list(labels), vectors)
+
+    # --- Mutation ---
+
+    def _insert(self, labels: List, vectors: np.ndarray):
+        assign = np.zeros(len(vectors), dtype=np.int64) if not self.trained else \
+            np.argmax(vectors @ self.centroids.T, axis=1)
+        order = np.argsort(assign, kind="stable")
+        lists, starts, counts = np.unique(assign[order], return_index=True, return_counts=True)
+        for lst, start, count in zip(lists, starts, counts):
+            rows = order[start:start + count]
+            size, cap = self._sizes[lst], len(self._vecs[lst])
+            if size + count > cap:
+                new_cap = max(size + count, 2 * cap, 16)
+                grown = np.zeros((new_cap, self.dim), dtype=np.float32)
+                grown[:size] = self._vecs[lst][:size]
+                alive = np.zeros(new_cap, dtype=bool)
+                alive[:size] = self._alive[lst][:size]
+                self._vecs[lst], self._alive[lst] = grown, alive
+            self._vecs[lst][size:size + count] = vectors[rows]
+            self._alive[lst][size:size + count] = True
+            lst = int(lst)
+            for slot, i in enumerate(rows, start=size):
+                self._labels[lst].append(labels[i])
+                self._where[labels[i]] = (lst, slot)
+            self._sizes[lst] += count
+
+    def add(self, labels: List, vectors: np.ndarray):
+        """Insert (upsert) vectors under `labels`. Trains automatically at `train_threshold` vectors."""
+        labels = list(labels)
+        vectors = self._normalize(vectors)
+        last = {label: i for i, label in enumerate(labels)} # A label repeated in the batch keeps its last vector
+        if len(last) < len(labels):
+            labels, vectors = list(last), vectors[list(last.values())]
+        self.remove([l for l in labels if l in self._where])
+        self._insert(labels, vectors)
+        if not self.trained and len(self) >= self.train_threshold:
+            self.train(self._live()[1])
+
+    def remove(self, labels: List) -> int:
+        """Tombstone `labels`. Returns how many were present."""
+        removed = 0
+        for label in labels:
+            where = self._where.pop(label, None)
+            if where is None:
+                continue
+            lst, slot = where
+            self._alive[lst][slot] = False
+            self.tombstones += 1
+            removed += 1
+        if self.tombstones > self.compact_ratio * max(1, len(self) + self.tombstones):
+            self.compact()
+        return removed
+
+    def compact(self):
+        """Drop tombstoned slots (centroids are kept)."""
+        labels, live = self._live()
+        self._reset(self.centroids)
+        if labels:
+            self._insert(labels, live)
+
+    # --- Search ---
+
+    def search(self, queries: np.ndarray, k: int = 10, nprobe: int = None):
+        """Returns one (labels, scores) pair per query, best first."""
+        queries = self._normalize(queries)
+        if not len(self):
+            return [([], np.zeros(0, dtype=np.float32)) for _ in queries]
+        nprobe = min(nprobe or self.nprobe, len(self._vecs))
+        if self.trained:
+            coarse = queries @ self.centroids.T
+            probes = np.argpartition(-coarse, nprobe - 1, axis=1)[:, :nprobe]
+        else:
+            probes = np.zeros((len(queries), 1), dtype=np.int64)
+
+        results = []
+        for q, lists in zip(queries, probes):
+            spans, scores = [], [] # (list, size) per scanned block
+            for lst in lists:
+                size = self._sizes[lst]
+                if not size:
+                    continue
+                s = self._vecs[lst][:size] @ q
+                alive = self._alive[lst][:size]
+                if not alive.all():
+                    s = np.where(alive, s, -np.inf)
+                scores.append(s)
+                spans.append((lst, size))
+            if not scores:
+                results.append(([], np.zeros(0, dtype=np.float32)))
+                continue
+            scores = np.concatenate(scores)
+            top = min(k, len(scores))
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best], kind="stable")]
+            best = best[np.isfinite(scores[best])]
+            offsets = np.cumsum([0] + [size for _, size in spans])
+            owner = np.searchsorted(offsets, best, side="right") - 1
+            results.append((
+                [self._labels[spans[o][0]][b - offsets[o]] for o, b in zip(owner, best)],
+                scores[best]
+            ))
+        return results
+
+    def recall_at_k(self, queries: np.ndarray, k: int = 10, nprobe: int = None) -> float:
+        """Mean fraction of the exact top-k (brute force over live vectors) that search() returns."""
+        labels, live = self._live()
+        if not labels:
+            return 1.0
+        queries = self._normalize(queries)
+        exact = queries @ live.T
+        top = min(k, len(labels))
+        truth = np.argpartition(-exact, top - 1, axis=1)[:, :top]
+        found = self.search(queries, k, nprobe)
+        hits = [len(set(labels[i] for i in t) & set(f[0])) / top for t, f in zip(truth, found)]
+        return float(np.mean(hits))
+
+    def get_stats(self) -> Dict:
+        return {
+            "vectors": len(self),
+            "tombstones": self.tombstones,
+            "trained": self.trained,
+            "nlist": len(self._vecs),
+            "nprobe": self.nprobe
+        }
+
+    # --- Persistence ---
+
+    def save(self, path: str):
+        """One .npz: centroids + list-ordered vectors and offsets; labels in a JSON string. Tombstones are dropped."""
+        labels, vecs, offsets = [], [], [0]
+        for lst in range(len(self._vecs)):
+            alive = self._alive[lst][:self._sizes[lst]]
+            labels.extend(l for l, a in zip(self._labels[lst], alive) if a)
+            vecs.append(self._vecs[lst][:self._sizes[lst]][alive])
+            offsets.append(offsets[-1] + int(alive.sum()))
+        header = {"version": INDEX_VERSION, "dim": self.dim, "nprobe": self.nprobe, "labels": labels}
+        tmp = path + ".tmp.npz"
+        np.savez(
+            tmp,
+            header=np.array(json.dumps(header)),
+            centroids=self.centroids if self.trained else np.zeros((0, self.dim), dtype=np.float32),
+            vectors=np.concatenate(vecs) if vecs else np.zeros((0, self.dim), dtype=np.float32),
+            offsets=np.asarray(offsets, dtype=np.int64)
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "IVFIndex":
+        with np.load(path, allow_pickle=False) as data:
+            header = json.loads(str(data["header"]))
+            if header.get("version") != INDEX_VERSION:
+                raise ValueError(f"Unsupported ANN index version {header.get('version')}")
+            index = cls(header["dim"], **dict({"nprobe": header["nprobe"]}, **kwargs))
+            centroids, vectors, offsets = data["centroids"], data["vectors"], data["offsets"]
+        index._reset(centroids if len(centroids) else None)
+        labels = header["labels"]
+        for lst in range(len(offsets) - 1):
+            a, b = offsets[lst], offsets[lst + 1]
+            index._vecs[lst] = np.array(vectors[a:b], dtype=np.float32)
+            index._alive[lst] = np.ones(b - a, dtype=bool)
+            index._labels[lst] = labels[a:b]
+            index._sizes[lst] = b - a
+            for slot, label in enumerate(labels[a:b]):
+                index._where[label] = (lst, slot)
+        return index
@@ -0,0 +1,134 @@
+"""
+Block Cache (WMCS v1.0)
+Memory-bounded LRU cache for lazily loaded concept blocks.
+
+Bounded by entry count and/or approximate bytes (the block's on-disk JSON
+size when known). Pinned keys are never evicted. Hits, misses, evictions
+and resident bytes are counted for /status.
+"""
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+def block_nbytes(block) -> int:
+    """Approximate footprint of a block: its compact JSON size."""
+    try:
+        return len(json.dumps(block, default=str, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return 0
+
+
+class BlockCache:
+    def __init__(self, max_items: Optional[int] = 4096, max_bytes: Optional[int] = 256 * 1024 * 1024):
+        self.max_items = max_items # None/0 = unbounded
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict() # key -> (block, nbytes); least recent first
+        self._pinned = set()
+        self._lock = threading.RLock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # --- Core ---
+
+    def get(self, key, default=None):
+        """Lookup that counts a hit or miss and refreshes recency."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, block, nbytes: Optional[int] = None):
+        with self._lock:
+            if nbytes is None:
+                nbytes = block_nbytes(block)
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (block, nbytes)
+            self.bytes += nbytes
+            self._evict()
+
+    def _evict(self):
+        def over():
+            return (self.max_items and len(self._entries) > self.max_items) or \
+                   (self.max_bytes and self.bytes > self.max_bytes)
+        if not over():
+            return
+        for key in list(self._entries):
+            if not over():
+                break
+            if key in self._pinned:
+                continue
+            _, nbytes = self._entries.pop(key)
+            self.bytes -= nbytes
+            self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self.bytes -= entry[1]
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    # --- Pinning (hot concepts stay resident) ---
+
+    def pin(self, key):
+        with self._lock:
+            self._pinned.add(key)
+
+    def unpin(self, key):
+        with self._lock:
+            self._pinned.discard(key)
+            self._evict()
+
+    # --- dict compatibility (no stats, no recency change) ---
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __getitem__(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry[0]
+
+    def __setitem__(self, key, block):
+        self.put(key, block)
+
+    def __delitem__(self, key):
+        if self.pop(key, self) is self:
+            raise KeyError(key)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def keys(self):
+        return list(self._entries)
+
+    def get_stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "items": len(self._entries),
+            "bytes": self.bytes,
+            "max_items": self.max_items,
+            "max_bytes": self.max_bytes,
+            "pinned": len(self._pinned),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
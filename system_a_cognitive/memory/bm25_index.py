@@ -0,0 +1,212 @@
+"""
+Lexical Concept Index (WMCS v1.0)
+Persistent BM25 inverted index over concept names, aliases, definitions and
+claims, complementing the embedding search for exact-name queries
+("What is a Zorkmid?").
+
+Built like the ID index: at Kernel start only files whose mtime changed since
+the last run are re-tokenized (term counts live in data/bm25_index.json), and
+hot-loaded concepts are added incrementally. Results from several rankers
+are merged with reciprocal_rank_fusion.
+"""
+import json
+import math
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from system_a_cognitive.memory.concept_corpus import get_concept_corpus
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset("""
+a an and are as at be by can do does for from how i in is it its of on or that the this to
+was what when where which who why will with about into than then there these those
+""".split())
+
+
+INDEX_VERSION = 2 # 2: "phrases" for names without any indexable term
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(str(text).lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def _phrase(text: str) -> str:
+    """Every word, lowercased and single-spaced: exact-name comparison for names tokenize() drops."""
+    return " ".join(_TOKEN.findall(str(text).lower()))
+
+
+def concept_fields(block: Dict) -> Tuple[List[str], str]:
+    """([name, *aliases], body text) for a flat or CORE-nested block."""
+    core = block.get("CORE") if isinstance(block.get("CORE"), dict) else block
+    name = core.get("name") or block.get("name") or ""
+    aliases = list(block.get("aliases") or []) + list(core.get("aliases") or [])
+    body = [
+        core.get("definition") or block.get("definition") or "",
+        (block.get("surface_layer") or {}).get("definition", "")
+    ]
+    for k, v in (block.get("facets") or {}).items():
+        body.append(f"{k} {v}")
+    for c in block.get("claims") or []:
+        if isinstance(c, dict):
+            body.append(f"{c.get('predicate', '')} {c.get('object', '')}")
+    return [str(n) for n in [name] + aliases if n], " ".join(str(b) for b in body)
+
+
+def reciprocal_rank_fusion(rankings: List[List[str]], k: int = 60, top_k: Optional[int] = None) -> List[Tuple[str, float]]:
+    """Fuse ranked key lists: score(key) = sum 1 / (k + rank). Best first."""
+    scores = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    fused = sorted(scores.items(), key=lambda kv: -kv[1])
+    return fused[:top_k] if top_k else fused
+
+
+class BM25Index:
+    def __init__(self, concepts_dir: str = "data/concepts", index_path: str = "data/bm25_index.json",
+                 k1: float = 1.2, b: float = 0.75, name_boost: int = 3):
+        self.concepts_dir = concepts_dir
+        self.index_path = index_path
+        self.k1 = k1
+        self.b = b
+        self.name_boost = name_boost # Name/alias terms count this many times
+        self.entries = {}   # {filename: {"mtime", "names": [[terms] per name/alias], "tf": {term: n}, "len": n}}
+        self.postings = {}  # {term: {filename: tf}}
+        self.phrases = {}   # {filename: [phrase]} for names made only of stopwords / 1-char words
+        self._total_len = 0
+
+    def _document(self, block: Dict, mtime) -> Dict:
+        raw_names, body = concept_fields(block)
+        names = [tokenize(n) for n in raw_names]
+        tf = {}
+        for term in [t for n in names for t in n] * self.name_boost + tokenize(body):
+            tf[term] = tf.get(term, 0) + 1
+        entry = {"mtime": mtime, "names": [sorted(set(n)) for n in names if n], "tf": tf, "len": sum(tf.values())}
+        phrases = [_phrase(raw) for raw, terms in zip(raw_names, names) if not terms and _phrase(raw)]
+        if phrases:
+            entry["phrases"] = phrases
+        return entry
+
+    # --- Maintenance ---
+
+    def _post(self, fname: str, entry: Dict):
+        self.entries[fname] = entry
+        self._total_len += entry["len"]
+        if entry.get("phrases"):
+            self.phrases[fname] = entry["phrases"]
+        for term, n in entry["tf"].items():
+            self.postings.setdefault(term, {})[fname] = n
+
+    def remove(self, fname: str):
+        entry = self.entries.pop(fname, None)
+        if not entry:
+            return
+        self._total_len -= entry["len"]
+        self.phrases.pop(fname, None)
+        for term in entry["tf"]:
+            docs = self.postings.get(term)
+            if docs is not None:
+                docs.pop(fname, None)
+                if not docs:
+                    del self.postings[term]
+
+    def add(self, fname: str, block: Dict):
+        """Index a newly written/updated concept file (no directory scan)."""
+        try:
+            mtime = os.path.getmtime(os.path.join(self.concepts_dir, fname))
+        except OSError:
+            mtime = None
+        self.remove(fname)
+        self._post(fname, self._document(block, mtime))
+
+    def _load_sidecar(self) -> Dict:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION and data.get("name_boost") == self.name_boost:
+                return data.get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {}
+
+    def save(self):
+        tmp = self.index_path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"version": INDEX_VERSION, "name_boost": self.name_boost, "entries": self.entries}, f)
+        os.replace(tmp, self.index_path)
+
+    def build(self, save: bool = True) -> int:
+        """
+        Sync with the concept directory; unchanged files come from the sidecar
+        without being opened; save=False leaves the sidecar to its writer.
+        Returns number of files tokenized.
+        """
+        corpus = get_concept_corpus(self.concepts_dir)
+        previous = self._load_sidecar()
+        self.entries, self.postings, self.phrases, self._total_len = {}, {}, {}, 0
+        dirty = []
+
+        for fname in corpus.files():
+            try:
+                mtime = os.path.getmtime(os.path.join(self.concepts_dir, fname))
+            except OSError:
+                continue
+            cached = previous.get(fname)
+            if cached and cached.get("mtime") == mtime:
+                self._post(fname, cached)
+            else:
+                dirty.append((fname, mtime))
+
+        if dirty:
+            corpus.invalidate_stale() # Edited files are re-parsed below, nothing else
+        parsed = 0
+        for fname, mtime in dirty:
+            block = corpus.read(fname) # Not kept in the corpus cache: a cold build must not pin the corpus
+            if not isinstance(block, dict):
+                continue
+            parsed += 1
+            self._post(fname, self._document(block, mtime))
+
+        if save and (parsed or len(previous) != len(self.entries)):
+            try:
+                self.save()
+            except OSError as e:
+                print(f"[BM25] Could not persist index: {e}")
+        return parsed
+
+    # --- Search ---
+
+    def search(self, query: str, top_k: int = 10, require_name: bool = False) -> List[Tuple[str, float]]:
+        """
+        BM25 ranking: [(filename, score)], best first.
+        require_name: only concepts whose whole name (or alias) appears in the query,
+        e.g. entry points for "What is a Zorkmid?" but not every doc sharing a word.
+        Names with no indexable term ("The Who", "X") must appear word for word.
+        """
+        terms = tokenize(query)
+        n_docs = len(self.entries)
+        if not n_docs or not (terms or require_name):
+            return []
+        avgdl = self._total_len / n_docs
+        scores = {}
+        for term in set(terms):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1.0 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for fname, tf in docs.items():
+                dl = self.entries[fname]["len"]
+                scores[fname] = scores.get(fname, 0.0) + idf * tf * (self.k1 + 1) / (
+                    tf + self.k1 * (1 - self.b + self.b * dl / avgdl))
+
+        if require_name:
+            query_terms = set(terms)
+            matched = {f for f in scores if any(query_terms.issuperset(n) for n in self.entries[f]["names"])}
+            query_phrase = f" {_phrase(query)} "
+            matched.update(f for f, phrases in self.phrases.items() if any(f" {p} " in query_phrase for p in phrases))
+            scores = {f: scores.get(f, 0.0) for f in matched}
+        return sorted(scores.items(), key=lambda kv: -kv[1])[:top_k]
+
+    def __len__(self) -> int:
+        return len(self.entries)
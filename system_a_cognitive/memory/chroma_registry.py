@@ -0,0 +1,72 @@
+"""
+Chroma Registry (WMCS v1.0)
+One chromadb client per persistence path and one embedding function per
+model, shared by every store in the process (ChromaStore, StrategyStore, ...).
+
+The default embedding function loads its ONNX model lazily on the first
+embed; sharing the instance means it is loaded once, not once per store.
+warm_up_embedding_function() triggers that load on a background thread at
+startup so the first query does not pay for it.
+
+A forked worker starts with empty registries: clients (SQLite handles) and
+ONNX sessions are not fork-safe and are rebuilt in the child on first use.
+"""
+import os
+import threading
+
+_clients = {}
+_embedding_functions = {}
+_lock = threading.Lock()
+
+
+def _forget_after_fork():
+    global _clients, _embedding_functions, _lock
+    _clients, _embedding_functions, _lock = {}, {}, threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_after_fork)
+
+
+def get_chroma_client(persistence_path: str = "data/chroma_db"):
+    """Process-wide PersistentClient for `persistence_path`."""
+    key = os.path.abspath(persistence_path)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            import chromadb
+            client = chromadb.PersistentClient(path=persistence_path)
+            _clients[key] = client
+        return client
+
+
+def get_embedding_function(name: str = "default"):
+    """Shared embedding function (None if it cannot be created). The model itself loads on first call."""
+    with _lock:
+        if name not in _embedding_functions:
+            try:
+                from chromadb.utils import embedding_functions
+                # using the default SentenceTransformer (all-MiniLM-L6-v2)
+                _embedding_functions[name] = embedding_functions.DefaultEmbeddingFunction()
+            except Exception:
+                # Fallback if libraries missing, but usually included in chromadb[full]
+                _embedding_functions[name] = None
+        return _embedding_functions[name]
+
+
+def warm_up_embedding_function(name: str = "default", background: bool = True):
+    """Load the embedding model now (optionally on a daemon thread). Returns the thread, or None."""
+    def run():
+        ef = get_embedding_function(name)
+        if ef is not None:
+            try:
+                ef(["warm up"])
+            except Exception:
+                pass
+
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(target=run, name="embedding-warmup", daemon=True)
+    thread.start()
+    return thread
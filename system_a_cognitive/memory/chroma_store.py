@@ -1,27 +1,56 @@
-import chromadb
-from chromadb.utils import embedding_functions
 from termcolor import colored
 import os
+from system_a_cognitive.memory.vector_store import concept_document
+from system_a_cognitive.memory.embedding_cache import get_embedding_cache
+from system_a_cognitive.memory.chroma_registry import get_chroma_client, get_embedding_function
+
+def build_where(where=None, groups=None, types=None, status=None, exclude_status=None):
+    """
+    Chroma `where` filter over the flat concept metadata (see concept_metadata).
+        groups:         (lo, hi) inclusive range, a group int, or a list of either
+        types:          'type' values to keep
+        status:         '_STATUS' values to keep
+        exclude_status: '_STATUS' values to drop (e.g. ["HYPOTHETICAL"])
+        where:          raw Chroma clause, ANDed with the rest
+    Returns None when nothing is filtered.
+    """
+    clauses = [where] if where else []
+    if groups is not None:
+        ranges = []
+        for g in (groups if isinstance(groups, list) else [groups]):
+            if isinstance(g, (tuple, list)):
+                ranges.append({"$and": [{"group": {"$gte": g[0]}}, {"group": {"$lte": g[1]}}]})
+            else:
+                ranges.append({"group": g})
+        clauses.append(ranges[0] if len(ranges) == 1 else {"$or": ranges})
+    if types:
+        clauses.append({"type": {"$in": list(types)}})
+    if status:
+        clauses.append({"_STATUS": {"$in": list(status)}})
+    if exclude_status:
+        clauses.append({"_STATUS": {"$nin": list(exclude_status)}})
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
 
 class ChromaStore:
     """
     Industrial-Grade Vector Memory using ChromaDB.
     Replaces the list-based VectorStore.
     """
-    def __init__(self, persistence_path="data/chroma_db"):
+    def __init__(self, persistence_path="data/chroma_db", batch_size=128):
         print(colored("Initializing ChromaDB (The Scale Engine)...", "magenta"))
+        self.batch_size = batch_size # Documents per embedding pass + upsert
         
-        # 1. Setup Client
-        self.client = chromadb.PersistentClient(path=persistence_path)
+        # 1. Setup Client (shared with every other store on this path)
+        self.client = get_chroma_client(persistence_path)
         
         # 2. Setup Embedding (Local, Free, High Performance)
-        # using the default SentenceTransformer (all-MiniLM-L6-v2)
-        try:
-            self.ef = embedding_functions.DefaultEmbeddingFunction()
-        except:
-             # Fallback if libraries missing, but usually included in chromadb[full]
+        # Shared instance; the model loads on the first embed
+        self.ef = get_embedding_function()
+        if self.ef is None:
              print(colored("Warning: Default embedding function failed. Using dummy.", "red"))
-             self.ef = None
 
         # 3. Get/Create Collection
         self.collection = self.client.get_or_create_collection(
@@ -31,80 +60,131 @@ class ChromaStore:
         )
         print(colored(f"  > Chroma Collection Ready. Items: {self.collection.count()}", "green"))
 
-    def add(self, doc_id, text, metadata=None):
-        """
-        Add or Update a document.
-        doc_id: Expected to be "group,item" string (e.g. "20,55")
-        """
-        if metadata is None: metadata = {}
-        
+    @staticmethod
+    def _flat_metadata(metadata):
         # Ensure metadata is flat (Chroma doesn't like nested dicts)
         clean_meta = {}
-        for k,v in metadata.items():
+        for k,v in (metadata or {}).items():
             if isinstance(v, (str, int, float, bool)):
                 clean_meta[k] = v
             else:
                 clean_meta[k] = str(v) # Stringify complex objects
+        return clean_meta
 
-        self.collection.upsert(
-            documents=[text],
-            metadatas=[clean_meta],
-            ids=[doc_id]
-        )
+    def add(self, doc_id, text, metadata=None):
+        """
+        Add or Update a document.
+        doc_id: Expected to be "group,item" string (e.g. "20,55")
+        """
+        self.add_many([(doc_id, text, metadata)])
 
-    def search(self, query, top_k=3, threshold=0.0):
+    def add_many(self, docs, batch_size=None):
         """
-        Semantic Search.
-        Returns list of blocks (mocked as dicts with ID/Metadata) to match Kernel expectation.
+        Batched add/update. docs: iterable of (doc_id, text, metadata).
+        Each batch is one embedding pass and one upsert.
+        Returns number of documents written.
         """
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=top_k
-        )
+        batch_size = batch_size or self.batch_size
+        written = 0
+        batch = {}  # doc_id -> (text, metadata); a repeated ID keeps the last version
         
-        # Parse Chroma result format -> WMCS format
-        # results['ids'] = [['id1', 'id2']]
-        # results['metadatas'] = [[meta1, meta2]]
-        # results['distances'] = [[0.1, 0.2]]
+        def flush():
+            nonlocal written
+            if not batch:
+                return
+            ids = list(batch.keys())
+            self.collection.upsert(
+                documents=[batch[i][0] for i in ids],
+                metadatas=[self._flat_metadata(batch[i][1]) for i in ids],
+                ids=ids
+            )
+            written += len(ids)
+            batch.clear()
         
-        parsed_results = []
-        if results['ids']:
-            ids = results['ids'][0]
-            metas = results['metadatas'][0]
-            if 'distances' in results and results['distances']:
-                dists = results['distances'][0]
+        for doc_id, text, metadata in docs:
+            batch[doc_id] = (text, metadata)
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+        return written
+
+    def search(self, query, top_k=3, threshold=0.0, **filters):
+        """
+        Semantic Search. Hits below `threshold` (cosine similarity) are dropped.
+        filters: where / groups / types / status / exclude_status (see build_where),
+        applied inside Chroma so filtered queries still return up to top_k hits.
+        Returns list of blocks (mocked as dicts with ID/Metadata) to match Kernel expectation.
+        """
+        return self.search_many([query], top_k, threshold, **filters)[0]
+
+    def search_many(self, queries, top_k=3, threshold=0.0, **filters):
+        """
+        Batched search: one result list per query.
+        Query embeddings come from the shared LRU (misses in one forward pass);
+        each batch of `batch_size` queries is a single collection.query.
+        """
+        where = build_where(**filters)
+        query_args = {"n_results": top_k}
+        if where:
+            query_args["where"] = where
+        queries = list(queries)
+        if not queries:
+            return []
+        if self.ef is None:
+            embeddings = None # Chroma embeds query_texts itself
+        else:
+            embeddings = get_embedding_cache().embed(self.ef, queries)
+
+        found = []
+        for start in range(0, len(queries), self.batch_size):
+            if embeddings is None:
+                results = self.collection.query(query_texts=queries[start:start + self.batch_size], **query_args)
             else:
-                dists = [0.0] * len(ids)
+                results = self.collection.query(query_embeddings=embeddings[start:start + self.batch_size], **query_args)
+            
+            # Parse Chroma result format -> WMCS format
+            # results['ids'] = [['id1', 'id2'], ...]  (one row per query)
+            # results['metadatas'] = [[meta1, meta2], ...]
+            # results['distances'] = [[0.1, 0.2], ...]
+            ids = results.get('ids') or []
+            metas = results.get('metadatas') or [[{}] * len(row) for row in ids]
+            dists = results.get('distances') or [[0.0] * len(row) for row in ids]
+            for row in range(len(ids)):
+                found.append(self._parse_hits(ids[row], metas[row], dists[row], threshold))
+        found.extend([] for _ in range(len(queries) - len(found)))
+        return found
 
-            for i, uid in enumerate(ids):
-                # Filter by threshold (Cosine Distance: 0=Same, 1=Diff)
-                # If threshold is similarity (0-1), we need to invert.
-                # Assuming threshold=0.0 means "Accept all" for now.
-                dist = dists[i]
-                
-                # Reconstruct a partial block from metadata
-                # The Kernel expects 'id': {'group': X, 'item': Y} logic
-                # We parse uid "20,55"
-                try:
-                    g, it = uid.split(',')
-                    id_obj = {'group': int(g), 'item': int(it)}
-                except:
-                    id_obj = {'group': 0, 'item': 0, 'raw': uid}
-                
-                # Fetch Name
-                name = metas[i].get('name', 'Unknown')
-                
-                # We return the format expected by Main.py
-                # hit['metadata'].get('name') and hit['score']
-                score = 1.0 - dist # Convert Distance to Similarity approximation
-                
-                res_obj = {
-                    'id': id_obj,
-                    'name': name, # Top level for convenience
-                    'metadata': {'name': name}, # Nested for compatibility
-                    'score': score
-                }
-                parsed_results.append(res_obj)
+    @staticmethod
+    def _parse_hits(ids, metas, dists, threshold):
+        parsed_results = []
+        for i, uid in enumerate(ids):
+            # Filter by threshold (Cosine Distance: 0=Same, 1=Diff; threshold is a similarity)
+            score = 1.0 - dists[i] # Convert Distance to Similarity
+            if score < threshold:
+                continue
+            
+            # Reconstruct a partial block from metadata
+            # The Kernel expects 'id': {'group': X, 'item': Y} logic
+            # We parse uid "20,55"
+            try:
+                g, it = uid.split(',')
+                id_obj = {'group': int(g), 'item': int(it)}
+            except:
+                id_obj = {'group': 0, 'item': 0, 'raw': uid}
+            
+            # Fetch Name
+            meta = metas[i] or {}
+            name = meta.get('name', 'Unknown')
+            
+            # We return the format expected by Main.py
+            # hit['metadata'].get('name') and hit['score']
+            res_obj = {
+                'id': id_obj,
+                'name': name, # Top level for convenience
+                'metadata': dict(meta, name=name), # Nested for compatibility
+                'score': score
+            }
+            parsed_results.append(res_obj)
                 
         return parsed_results
     
@@ -112,30 +192,40 @@ class ChromaStore:
         """
         Helper: Serializes a Concept Block and adds it to the DB.
         """
-        text_rep = f"Concept: {block.get('name', 'Unknown')}. "
-        for k, v in block.get('facets', {}).items():
-            text_rep += f"{k}: {v}. "
-        for c in block.get('claims', []):
-                pred = c.get('predicate', '')
-                obj = c.get('object', '')
-                text_rep += f"{pred}: {obj}. "
-        
-        # ID Construction
-        gid = block.get('id',{}).get('group', 0)
-        iid = block.get('id',{}).get('item', 0)
-        doc_id = f"{gid},{iid}"
-        
-        self.add(doc_id, text_rep, metadata={'name': block.get('name', 'Unknown'), 'group': gid})
+        self.add(*concept_document(block))
+
+    def add_concept_blocks(self, blocks, batch_size=None):
+        """Batched add_concept_block. Malformed blocks are skipped. Returns count written."""
+        def docs():
+            for block in blocks:
+                try:
+                    yield concept_document(block)
+                except Exception:
+                    continue
+        return self.add_many(docs(), batch_size)
+
     def load_index(self): pass
     def save_index(self): pass
 
     def count(self):
         return self.collection.count()
 
+    def all_ids(self):
+        return self.collection.get(include=[])["ids"]
+
+    def sample_metadata(self, limit: int = 64):
+        return self.collection.get(limit=limit, include=["metadatas"])["metadatas"] or []
+
+    def delete(self, doc_ids):
+        doc_ids = list(doc_ids)
+        for start in range(0, len(doc_ids), self.batch_size):
+            self.collection.delete(ids=doc_ids[start:start + self.batch_size])
+
     def reset(self):
         """Wipes the database. Use with caution."""
         self.client.delete_collection("wmcs_concepts")
         self.collection = self.client.get_or_create_collection(
             name="wmcs_concepts", 
-            embedding_function=self.ef
+            embedding_function=self.ef,
+            metadata={"hnsw:space": "cosine"}
         )
@@ -0,0 +1,250 @@
+"""
+Concept Corpus (WMCS v1.0)
+Process-wide, single-pass reader for a concept block directory.
+Engines that need the whole corpus read it through here, so each JSON
+file is parsed at most once per process instead of once per engine.
+"""
+import copy
+import json
+import os
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from system_a_cognitive.memory.corpus_version import get_corpus_version
+
+UNSAFE_FILENAME_CHARS = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
+
+
+def concept_filename(name: str) -> str:
+    """File a concept named `name` is stored in: 'Cat Paw' -> 'cat_paw.json' (Windows/Linux safe)."""
+    safe_name = str(name).lower().replace(' ', '_')
+    for char in UNSAFE_FILENAME_CHARS:
+        safe_name = safe_name.replace(char, '-')
+    return f"{safe_name}.json"
+
+
+class ConceptCorpus:
+    """
+    Shared cache of parsed concept blocks, keyed by filename ("cat.json").
+
+    - get(fname) parses a single file on demand and caches it.
+    - read(fname) parses without caching (lazy path used by the Kernel's bounded cache).
+    - items() parses everything not yet seen, once (bulk path used by engines).
+    - get_for_update(fname) returns a fresh, private copy for read-modify-write.
+    - update()/save() keep the cache in step with writers in this process.
+    - refresh() picks up files added, edited or removed by other processes.
+    """
+
+    def __init__(self, concepts_dir: str = "data/concepts"):
+        self.concepts_dir = concepts_dir
+        self._blocks = {}      # {filename: parsed block}
+        self._mtimes = {}      # {filename: mtime at parse time}
+        self.errors = {}       # {filename: parse error message}
+        self._complete = False # True once every file on disk has been visited
+        self._lock = threading.RLock()
+        self.parse_count = 0
+
+    def path(self, fname: str) -> str:
+        return os.path.join(self.concepts_dir, fname)
+
+    def files(self) -> List[str]:
+        """Concept filenames currently on disk."""
+        if not os.path.exists(self.concepts_dir):
+            return []
+        return [f for f in os.listdir(self.concepts_dir) if f.endswith(".json")]
+
+    def _read(self, fname: str) -> Optional[Dict]:
+        path = self.path(fname)
+        try:
+            mtime = os.path.getmtime(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            self._blocks.pop(fname, None)
+            self._mtimes.pop(fname, None)
+            self.errors[fname] = str(e)
+            return None
+
+        self.parse_count += 1
+        self.errors.pop(fname, None)
+        self._blocks[fname] = data
+        self._mtimes[fname] = mtime
+        return data
+
+    def load(self):
+        """Parse every file not parsed yet. No-op after the first full pass."""
+        with self._lock:
+            if self._complete:
+                return
+            for fname in self.files():
+                if fname not in self._blocks and fname not in self.errors:
+                    self._read(fname)
+            self._complete = True
+
+    def refresh(self) -> int:
+        """
+        Re-sync with disk: parse new or modified files, drop deleted ones.
+        Returns number of files (re)parsed.
+        """
+        with self._lock:
+            files = self.files()
+            on_disk = set(files)
+            for fname in list(self._blocks.keys()) + list(self.errors.keys()):
+                if fname not in on_disk:
+                    self._blocks.pop(fname, None)
+                    self._mtimes.pop(fname, None)
+                    self.errors.pop(fname, None)
+
+            reparsed = 0
+            for fname in files:
+                try:
+                    mtime = os.path.getmtime(self.path(fname))
+                except OSError:
+                    continue
+                if fname in self._blocks and self._mtimes.get(fname) == mtime:
+                    continue
+                self._read(fname)
+                reparsed += 1
+
+            self._complete = True
+            return reparsed
+
+    def invalidate_stale(self) -> List[str]:
+        """
+        Drop cached parses whose file changed or vanished on disk (e.g. written by
+        another process) without parsing anything. Returns the filenames dropped.
+        """
+        with self._lock:
+            dropped = []
+            for fname in list(self._blocks.keys()) + list(self.errors.keys()):
+                try:
+                    mtime = os.path.getmtime(self.path(fname))
+                except OSError:
+                    mtime = None
+                if mtime is None or self._mtimes.get(fname) != mtime:
+                    self._blocks.pop(fname, None)
+                    self._mtimes.pop(fname, None)
+                    self.errors.pop(fname, None)
+                    dropped.append(fname)
+            if dropped or len(self._blocks) + len(self.errors) != len(self.files()):
+                self._complete = False
+            return dropped
+
+    def get(self, fname: str) -> Optional[Dict]:
+        """Return the parsed block for one file, parsing it on first access."""
+        with self._lock:
+            if fname in self._blocks:
+                return self._blocks[fname]
+            if fname in self.errors:
+                return None
+            if not os.path.exists(self.path(fname)):
+                return None
+            return self._read(fname)
+
+    def get_for_update(self, fname: str) -> Optional[Dict]:
+        """
+        Private copy of one block for read-modify-write: re-parsed if the file
+        changed on disk since it was cached (e.g. written by another process), and
+        deep-copied so edits never reach the shared cache before save() succeeds.
+        """
+        with self._lock:
+            try:
+                mtime = os.path.getmtime(self.path(fname))
+            except OSError:
+                return None
+            if fname in self._blocks and self._mtimes.get(fname) == mtime:
+                data = self._blocks[fname]
+            else:
+                data = self._read(fname)
+            return copy.deepcopy(data) if data is not None else None
+
+    def read(self, fname: str) -> Optional[Dict]:
+        """
+        Like get(), but a file not cached yet is parsed without being added to the
+        cache (for callers that bound their own memory, e.g. the Kernel's BlockCache).
+        """
+        with self._lock:
+            if fname in self._blocks:
+                return self._blocks[fname]
+        try:
+            with open(self.path(fname), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            if os.path.exists(self.path(fname)):
+                self.errors[fname] = str(e)
+            return None
+        self.parse_count += 1
+        self.errors.pop(fname, None)
+        return data
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        """Iterate (filename, block) over the whole corpus."""
+        self.load()
+        with self._lock:
+            snapshot = list(self._blocks.items())
+        return iter(snapshot)
+
+    def blocks(self) -> List[Dict]:
+        return [data for _, data in self.items()]
+
+    def find_by_name(self, name: str) -> Optional[Tuple[str, Dict]]:
+        """Return (filename, block) for the block whose 'name' matches exactly."""
+        for fname, data in self.items():
+            if data.get("name") == name:
+                return fname, data
+        return None
+
+    def update(self, fname: str, data: Optional[Dict]):
+        """
+        Record that `fname` was written (or deleted, if data is None) by someone
+        else in this process, so the cache never serves a stale copy. Every
+        write bumps the shared corpus version.
+        """
+        get_corpus_version(self.concepts_dir).bump()
+        with self._lock:
+            if data is None:
+                self._blocks.pop(fname, None)
+                self._mtimes.pop(fname, None)
+                self.errors.pop(fname, None)
+                return
+            self._blocks[fname] = data
+            self.errors.pop(fname, None)
+            try:
+                self._mtimes[fname] = os.path.getmtime(self.path(fname))
+            except OSError:
+                self._mtimes.pop(fname, None)
+
+    def save(self, fname: str, data: Dict):
+        """Write a block to disk and keep the cache in sync (only once the write has succeeded)."""
+        with self._lock:
+            tmp = self.path(fname) + ".tmp"
+            try:
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp, self.path(fname))
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                raise
+            self.update(fname, data)
+
+    def get_stats(self) -> Dict:
+        return {
+            "concepts_dir": self.concepts_dir,
+            "cached": len(self._blocks),
+            "errors": len(self.errors),
+            "parses": self.parse_count,
+            "complete": self._complete
+        }
+
+
+# Registry: one corpus per directory
+_corpora = {}
+_corpora_lock = threading.Lock()
+
+def get_concept_corpus(concepts_dir: str = "data/concepts") -> ConceptCorpus:
+    key = os.path.abspath(concepts_dir)
+    with _corpora_lock:
+        if key not in _corpora:
+            _corpora[key] = ConceptCorpus(concepts_dir)
+        return _corpora[key]
@@ -0,0 +1,74 @@
+"""
+Corpus Version (WMCS v1.0)
+Monotonic counter of concept-corpus writes, shared by every process that
+touches the corpus (API workers, writer, gardener, ingestion scripts).
+
+ConceptCorpus.update() bumps it on every write (/teach, reflex ingestion,
+gardener/auditor patches). Anything derived from the corpus, such as the
+Kernel's answer cache, keys on it so it never serves a pre-learning answer.
+
+Stored as a plain integer in a small file next to the concepts directory.
+current() re-reads it on every call (one small read). bump() takes an
+exclusive flock where available, so concurrent writers never lose an
+increment.
+"""
+import os
+import threading
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError: # Windows: best-effort increments
+    fcntl = None
+
+
+class CorpusVersion:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def current(self) -> Optional[int]:
+        """Latest version (0 before the first write); None if caught mid-bump (treat as unknown)."""
+        try:
+            with open(self.path, 'rb') as f:
+                return int(f.read())
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError):
+            return None
+
+    def bump(self) -> int:
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, 'a+b') as f:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        value = int(f.read() or 0) + 1
+                    except ValueError:
+                        value = 1
+                    f.seek(0)
+                    f.truncate()
+                    f.write(str(value).encode())
+                    f.flush()
+                finally:
+                    if fcntl:
+                        fcntl.flock(f, fcntl.LOCK_UN)
+            return value
+
+
+# Registry: one version per concepts directory
+_versions = {}
+_versions_lock = threading.Lock()
+
+
+def get_corpus_version(concepts_dir: str = "data/concepts") -> CorpusVersion:
+    concepts_dir = os.path.abspath(concepts_dir)
+    with _versions_lock:
+        version = _versions.get(concepts_dir)
+        if version is None:
+            path = os.path.join(os.path.dirname(concepts_dir), "corpus_version")
+            version = _versions[concepts_dir] = CorpusVersion(path)
+        return version
@@ -0,0 +1,116 @@
+"""
+Query Embedding Cache (WMCS v1.0)
+Bounded, process-wide LRU of text -> embedding in front of the Chroma
+embedding functions.
+
+ChromaStore and StrategyStore embed query text through here, so the same
+user text is run through the embedding model once per process (not once
+per store per call). Misses in a batch are embedded in a single forward pass,
+and a text already being embedded by another thread (e.g. concept search and
+strategy recall for the same query, running in parallel) is waited for
+instead of embedded again.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, List
+
+from config import Config
+
+
+def embedding_function_key(ef) -> str:
+    """Identity of the embedding model behind `ef` (vectors from different models never mix)."""
+    return f"{type(ef).__module__}.{type(ef).__qualname__}:{getattr(ef, 'model_name', '')}"
+
+
+class _InFlight:
+    """An embedding one thread is computing; others wait on `done`."""
+    __slots__ = ("done", "vector")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.vector = None # Stays None if the embedding call failed
+
+
+class EmbeddingCache:
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries = OrderedDict() # (model key, text) -> embedding
+        self._inflight = {}           # (model key, text) -> _InFlight
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0 # Waited for another thread's embedding instead of computing it
+
+    def embed(self, ef, texts: List[str]) -> List:
+        """Embeddings for `texts` (order kept). Uncached texts go to `ef` in one call."""
+        model = embedding_function_key(ef)
+        out = [None] * len(texts)
+        missing = {} # text -> [positions]; embedded by this call
+        waiting = {} # text -> (_InFlight, [positions]); embedded by another thread
+        with self._lock:
+            for i, text in enumerate(texts):
+                key = (model, text)
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    out[i] = self._entries[key]
+                    self.hits += 1
+                elif text in missing:
+                    missing[text].append(i)
+                elif key in self._inflight:
+                    waiting.setdefault(text, (self._inflight[key], []))[1].append(i)
+                    self.coalesced += 1
+                else:
+                    self._inflight[key] = _InFlight()
+                    missing[text] = [i]
+                    self.misses += 1
+
+        if missing:
+            pending = list(missing)
+            try:
+                vectors = ef(pending) # One forward pass for every miss
+            except BaseException:
+                with self._lock:
+                    for text in pending:
+                        self._inflight.pop((model, text)).done.set() # Waiters retry on their own
+                raise
+            with self._lock:
+                for text, vector in zip(pending, vectors):
+                    for i in missing[text]:
+                        out[i] = vector
+                    self._entries[(model, text)] = vector
+                    self._entries.move_to_end((model, text))
+                    flight = self._inflight.pop((model, text))
+                    flight.vector = vector
+                    flight.done.set()
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        for text, (flight, positions) in waiting.items():
+            flight.done.wait()
+            vector = flight.vector if flight.vector is not None else self.embed(ef, [text])[0]
+            for i in positions:
+                out[i] = vector
+        return out
+
+    def embed_one(self, ef, text: str):
+        return self.embed(ef, [text])[0]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        return {"entries": len(self._entries), "max_entries": self.max_entries, "hits": self.hits,
+                "misses": self.misses, "coalesced": self.coalesced}
+
+
+# Singleton
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_embedding_cache() -> EmbeddingCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EmbeddingCache(max_entries=Config.EMBED_CACHE_SIZE)
+        return _cache
@@ -0,0 +1,115 @@
+"""
+Concept ID Index (WMCS v1.0)
+Persistent "group,item" -> file map for the concept directory.
+Built once at Kernel start (re-parsing only files whose mtime changed since
+the last run) and updated incrementally as new concepts are learned.
+"""
+import json
+import os
+from typing import Dict, Optional
+
+from system_a_cognitive.memory.concept_corpus import get_concept_corpus
+
+
+class ConceptIdIndex:
+    def __init__(self, concepts_dir: str = "data/concepts", index_path: str = "data/id_index.json"):
+        self.concepts_dir = concepts_dir
+        self.index_path = index_path
+        self.entries = {}  # {filename: {"mtime": float, "id": "G,I", "name": str}}
+        self._by_id = {}   # {"G,I": filename}
+
+    @staticmethod
+    def id_str(block: Dict) -> Optional[str]:
+        """'G,I' key for a block, or None if it has no usable ID."""
+        bid = block.get("id") if isinstance(block, dict) else None
+        if not isinstance(bid, dict) or "group" not in bid or "item" not in bid:
+            return None
+        return f"{bid['group']},{bid['item']}"
+
+    def _load_sidecar(self) -> Dict:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def save(self):
+        tmp = self.index_path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"version": 1, "entries": self.entries}, f)
+        os.replace(tmp, self.index_path)
+
+    def build(self, save: bool = True) -> int:
+        """
+        Sync the index with the concept directory.
+        Unchanged files are taken from the on-disk sidecar without opening them;
+        save=False leaves the sidecar to its writer (read-only workers).
+        Returns number of files parsed.
+        """
+        corpus = get_concept_corpus(self.concepts_dir)
+        previous = self._load_sidecar()
+        self.entries = {}
+        parsed = 0
+
+        for fname in corpus.files():
+            try:
+                mtime = os.path.getmtime(os.path.join(self.concepts_dir, fname))
+            except OSError:
+                continue
+
+            cached = previous.get(fname)
+            if cached and cached.get("mtime") == mtime:
+                self.entries[fname] = cached
+                continue
+
+            block = corpus.read(fname) # Not kept in the corpus cache: the index needs ID and name only
+            parsed += 1
+            self.entries[fname] = {
+                "mtime": mtime,
+                "id": self.id_str(block) if block else None,
+                "name": block.get("name", "Unknown") if isinstance(block, dict) else "Unknown"
+            }
+
+        self._reindex()
+        if save and (parsed or len(previous) != len(self.entries)):
+            try:
+                self.save()
+            except OSError as e:
+                print(f"[IdIndex] Could not persist index: {e}")
+        return parsed
+
+    def _reindex(self):
+        self._by_id = {}
+        for fname, entry in self.entries.items():
+            if entry.get("id"):
+                self._by_id[entry["id"]] = fname
+
+    def add(self, fname: str, block: Dict):
+        """Record a newly written/updated concept file (no directory scan)."""
+        old = self.entries.get(fname)
+        if old and old.get("id") and self._by_id.get(old["id"]) == fname:
+            del self._by_id[old["id"]]
+
+        try:
+            mtime = os.path.getmtime(os.path.join(self.concepts_dir, fname))
+        except OSError:
+            mtime = None
+
+        key = self.id_str(block)
+        self.entries[fname] = {"mtime": mtime, "id": key, "name": block.get("name", "Unknown")}
+        if key:
+            self._by_id[key] = fname
+
+    def resolve(self, id_str: str) -> Optional[str]:
+        """Filename holding concept 'G,I', or None."""
+        return self._by_id.get(id_str)
+
+    def name_of(self, id_str: str) -> Optional[str]:
+        fname = self._by_id.get(id_str)
+        return self.entries[fname].get("name") if fname else None
+
+    def __contains__(self, id_str: str) -> bool:
+        return id_str in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
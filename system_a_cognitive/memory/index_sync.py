@@ -0,0 +1,154 @@
+"""
+Vector Index Sync (WMCS v1.0)
+Keeps the vector store in step with the concept directory incrementally.
+
+A manifest of {file: {mtime, size, sha256, doc_id}} lives next to the vector
+DB (data/chroma_db.manifest.json). At startup the directory is diffed
+against it: only new or changed concepts are re-embedded, vectors of
+removed files are deleted, and unchanged files are never opened
+(mtime + size match) or re-embedded (content hash match).
+"""
+import hashlib
+import json
+import os
+from typing import Dict
+
+from system_a_cognitive.memory.concept_corpus import get_concept_corpus
+from system_a_cognitive.memory.vector_store import concept_document
+
+MANIFEST_VERSION = 2 # 2: filterable metadata (type, _STATUS, item) in every document
+SCHEMA_KEYS = ("type", "_STATUS", "item") # Metadata every document carries since version 2
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class VectorIndexManifest:
+    def __init__(self, concepts_dir: str = "data/concepts", manifest_path: str = "data/chroma_db.manifest.json"):
+        self.concepts_dir = concepts_dir
+        self.manifest_path = manifest_path
+        self.entries = {}  # {filename: {"mtime", "size", "sha256", "doc_id"}}
+        self.exists = False  # A manifest file was found (any version)
+        self.outdated = False  # ... written by an older MANIFEST_VERSION: every document must be re-embedded
+
+    def load(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.entries = data.get("entries", {})
+            self.exists = True
+            self.outdated = data.get("version") != MANIFEST_VERSION
+        except FileNotFoundError:
+            self.entries = {}
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+            self.exists = self.outdated = True # Unreadable: rebuild rather than trust the store
+        return self
+
+    def save(self):
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"version": MANIFEST_VERSION, "entries": self.entries}, f)
+        os.replace(tmp, self.manifest_path)
+        self.exists = True
+        self.outdated = False
+
+    def doc_ids(self) -> Dict[str, int]:
+        """{doc_id: number of files mapped to it}"""
+        counts = {}
+        for entry in self.entries.values():
+            doc_id = entry.get("doc_id")
+            if doc_id:
+                counts[doc_id] = counts.get(doc_id, 0) + 1
+        return counts
+
+
+def has_current_schema(vector_store, sample: int = 64) -> bool:
+    """True if the store's documents carry the SCHEMA_KEYS metadata (checked on a sample)."""
+    metadatas = vector_store.sample_metadata(sample)
+    return bool(metadatas) and all(m and all(k in m for k in SCHEMA_KEYS) for m in metadatas)
+
+
+def sync_vector_index(vector_store, concepts_dir: str = "data/concepts",
+                      manifest_path: str = "data/chroma_db.manifest.json", force: bool = False) -> Dict:
+    """
+    Bring `vector_store` in line with `concepts_dir`.
+    Returns {"added", "updated", "removed", "unchanged", "adopted"}.
+
+    First run without a manifest: if the store already holds at least as many
+    vectors as there are files and its documents carry the current metadata
+    schema, the existing index is adopted as-is (the manifest is just
+    recorded). Otherwise, and whenever the manifest is from an older
+    MANIFEST_VERSION, every concept is re-embedded and vectors that no file
+    backs any more are deleted.
+    """
+    manifest = VectorIndexManifest(concepts_dir, manifest_path).load()
+    corpus = get_concept_corpus(concepts_dir)
+    files = corpus.files()
+    stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0, "adopted": False}
+
+    rebuild = force or manifest.outdated
+    adopt = not rebuild and not manifest.exists and vector_store.count() >= len(files) > 0 \
+        and has_current_schema(vector_store)
+    previous = {} if rebuild else manifest.entries
+    current = {}
+    dirty = []  # Files whose content must be (re)embedded
+
+    for fname in files:
+        path = os.path.join(concepts_dir, fname)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        old = previous.get(fname)
+        if old and old.get("mtime") == st.st_mtime and old.get("size") == st.st_size:
+            current[fname] = old
+            stats["unchanged"] += 1
+            continue
+
+        digest = file_sha256(path)
+        if old and old.get("sha256") == digest:
+            current[fname] = dict(old, mtime=st.st_mtime, size=st.st_size)  # Touched, not edited
+            stats["unchanged"] += 1
+            continue
+
+        current[fname] = {"mtime": st.st_mtime, "size": st.st_size, "sha256": digest, "doc_id": None}
+        dirty.append(fname)
+
+    if dirty:
+        corpus.refresh()  # Re-parses only files whose mtime moved
+
+    docs = []
+    for fname in dirty:
+        block = corpus.get(fname)
+        try:
+            doc_id, text, metadata = concept_document(block)
+        except Exception:
+            current.pop(fname)  # Unparseable: not recorded, so retried next start
+            continue
+        current[fname]["doc_id"] = doc_id
+        if adopt:
+            continue
+        docs.append((doc_id, text, metadata))
+        stats["updated" if fname in previous else "added"] += 1
+
+    # Vectors no longer backed by any file (deleted files, or files whose ID changed)
+    still_used = set(e.get("doc_id") for e in current.values())
+    known = manifest.doc_ids() if manifest.exists and not rebuild else vector_store.all_ids()
+    stale = [doc_id for doc_id in known if doc_id not in still_used]
+    if stale:
+        vector_store.delete(stale)
+        stats["removed"] = len(stale)
+
+    if docs:
+        vector_store.add_many(docs)
+
+    manifest.entries = current
+    manifest.save()
+    stats["adopted"] = adopt
+    return stats
@@ -1,7 +1,7 @@
-import chromadb
-from chromadb.utils import embedding_functions
 from termcolor import colored
 from ..logic.models import MetaLesson
+from .embedding_cache import get_embedding_cache
+from .chroma_registry import get_chroma_client, get_embedding_function
 
 class StrategyStore:
     """
@@ -10,12 +10,8 @@ class StrategyStore:
     """
     def __init__(self, persistence_path="data/chroma_db"):
         print(colored("Initializing Strategy Store (Wisdom Engine)...", "magenta"))
-        self.client = chromadb.PersistentClient(path=persistence_path)
-        
-        try:
-            self.ef = embedding_functions.DefaultEmbeddingFunction()
-        except:
-            self.ef = None
+        self.client = get_chroma_client(persistence_path) # Shared with ChromaStore
+        self.ef = get_embedding_function()
 
         self.collection = self.client.get_or_create_collection(
             name="wmcs_strategies",
@@ -50,10 +46,17 @@ class StrategyStore:
         """
         Retrieves relevant strategies for the current context.
         """
-        results = self.collection.query(
-            query_texts=[context_query],
-            n_results=top_k
-        )
+        if self.ef is not None:
+            # Shared with ChromaStore.search: the same user text is embedded once
+            results = self.collection.query(
+                query_embeddings=[get_embedding_cache().embed_one(self.ef, context_query)],
+                n_results=top_k
+            )
+        else:
+            results = self.collection.query(
+                query_texts=[context_query],
+                n_results=top_k
+            )
         
         strategies = []
         if results['ids'] and results['ids'][0]:
@@ -1,19 +1,375 @@
 import numpy as np
 from termcolor import colored
 import json
+import mmap
+import os
+import tempfile
+
+from system_a_cognitive.memory.ann_index import IVFIndex
+
+
+DEFAULT_STATUS = "ACTIVE" # _STATUS for blocks that carry none (filters need the key present)
+
+
+def concept_metadata(block: dict) -> dict:
+    """
+    Flat, filterable metadata for a Concept Block (flat or CORE-nested schema):
+    {'name', 'group', 'item', 'type', '_STATUS'}.
+    """
+    core = block.get('CORE') if isinstance(block.get('CORE'), dict) else block
+    bid = core.get('id') or block.get('id') or {}
+    return {
+        'name': core.get('name') or block.get('name', 'Unknown'),
+        'group': bid.get('group', 0),
+        'item': bid.get('item', 0),
+        'type': str(core.get('type') or block.get('type') or 'UNKNOWN'),
+        '_STATUS': block.get('_STATUS', DEFAULT_STATUS)
+    }
+
+
+def concept_document(block: dict):
+    """
+    Serialize a Concept Block for embedding.
+    Returns (doc_id "group,item", text, metadata).
+    """
+    metadata = concept_metadata(block)
+    text_rep = f"Concept: {metadata['name']}. "
+    for k, v in block.get('facets', {}).items():
+        text_rep += f"{k}: {v}. "
+    for c in block.get('claims', []):
+            pred = c.get('predicate', '')
+            obj = c.get('object', '')
+            text_rep += f"{pred}: {obj}. "
+    
+    # ID Construction
+    doc_id = f"{metadata['group']},{metadata['item']}"
+    return doc_id, text_rep, metadata
+
+
+def embed_texts(client, texts):
+    """Batch-embed through client.embed_batch when available, else one call per text."""
+    if hasattr(client, "embed_batch"):
+        return client.embed_batch(list(texts))
+    return [client.embed_content(t) for t in texts]
+
+
+SCORE_BLOCK = 1 << 24 # Max float32 scores held at once in search_vectors (Q * N)
+ROW_BLOCK = 1 << 16 # Rows cast to float32 at a time when scanning a float16 / memmapped matrix
+CODE_BLOCK = 1 << 12 # int8 code rows cast per step in the quantized coarse scan (stays in cache)
+INDEX_VERSION = 1
+
+
+def index_paths(path: str):
+    """
+    Binary index layout for base path 'data/vector_index':
+        vector_index.npy        (N, dim) float16/float32 matrix, rows normalized (np.memmap'd)
+        vector_index.text       UTF-8 texts, concatenated
+        vector_index.meta.json  {version, count, dim, dtype, ids, metadata, text_offsets[, quantization]}
+        vector_index.codes.npy  (N, dim) int8 codes   } quantized stores only
+        vector_index.scales.npy (N,) float32 scales   }
+        vector_index.ivf.npz    IVF-Flat index          backend="ivf" only
+    A legacy '.json' / '.npy' suffix on `path` is ignored.
+    """
+    base, ext = os.path.splitext(path)
+    if ext not in (".json", ".npy"):
+        base = path
+    return {
+        "matrix": base + ".npy", "text": base + ".text", "meta": base + ".meta.json", "json": base + ".json",
+        "codes": base + ".codes.npy", "scales": base + ".scales.npy", "ann": base + ".ivf.npz"
+    }
+
+
+def quantize_int8(rows: np.ndarray):
+    """Symmetric per-row scalar quantization: row ~= codes * scale. Returns (codes int8, scales float32)."""
+    rows = np.asarray(rows, dtype=np.float32)
+    scales = np.abs(rows).max(axis=1) / 127.0 if rows.size else np.zeros(len(rows), dtype=np.float32)
+    scales[scales == 0] = 1.0
+    codes = np.rint(rows / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def _replace_atomic(path: str, write):
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def _write_matrix(path: str, matrix, dtype: str):
+    """np.save equivalent that copies `matrix` (array or row view) ROW_BLOCK rows at a time."""
+    n, dim = matrix.shape
+    tmp = path + ".tmp"
+    if not n:
+        _replace_atomic(path, lambda f: np.save(f, np.zeros((0, dim), dtype=dtype)))
+        return
+    out = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=(n, dim))
+    for start in range(0, n, ROW_BLOCK):
+        out[start:start + ROW_BLOCK] = matrix[start:min(start + ROW_BLOCK, n)]
+    out.flush()
+    del out
+    os.replace(tmp, path)
+
+
+def write_index(path: str, ids, matrix, texts, metadata, dtype: str = "float16", codes=None, scales=None) -> dict:
+    """Write the binary index (matrix, text blob, [codes], sidecar last). Returns its paths."""
+    paths = index_paths(path)
+    if not hasattr(matrix, "shape"):
+        matrix = np.asarray(matrix, dtype=np.float32)
+    blobs = [(t or "").encode("utf-8") for t in texts]
+    offsets = np.zeros(len(blobs) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in blobs], out=offsets[1:])
+
+    _write_matrix(paths["matrix"], matrix, dtype)
+    _replace_atomic(paths["text"], lambda f: f.write(b"".join(blobs)))
+    if codes is not None:
+        _replace_atomic(paths["codes"], lambda f: np.save(f, np.ascontiguousarray(codes, dtype=np.int8)))
+        _replace_atomic(paths["scales"], lambda f: np.save(f, np.ascontiguousarray(scales, dtype=np.float32)))
+    sidecar = {
+        "version": INDEX_VERSION, "count": len(ids), "dim": int(matrix.shape[1]) if len(matrix.shape) == 2 else 0,
+        "dtype": np.dtype(dtype).name, "ids": list(ids), "metadata": list(metadata),
+        "text_offsets": offsets.tolist()
+    }
+    if codes is not None:
+        sidecar["quantization"] = "int8"
+    _replace_atomic(paths["meta"], lambda f: f.write(json.dumps(sidecar, separators=(",", ":")).encode("utf-8")))
+    return paths
+
+
+def convert_json_index(json_path: str = "data/vector_index.json", path: str = None, dtype: str = "float16") -> int:
+    """One-shot converter: legacy JSON index -> binary index. Returns number of vectors written."""
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    ids = [item['id'] for item in data]
+    dim = len(data[0]['vector']) if data else 0
+    matrix = VectorStore._normalize(np.asarray([item['vector'] for item in data], dtype=np.float32).reshape(len(data), dim))
+    write_index(path or json_path, ids, matrix,
+                [item.get('text', '') for item in data], [item.get('metadata', {}) for item in data], dtype)
+    return len(ids)
+
+
+class MappedTexts:
+    """Read-only text column decoded on demand from a memory-mapped UTF-8 blob."""
+
+    def __init__(self, path: str, offsets):
+        self.offsets = offsets
+        self._mm = None
+        if offsets[-1] > 0:
+            with open(path, 'rb') as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self._mm[start:end].decode("utf-8") if end > start else ""
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class FullRows:
+    """
+    Read-only (N, dim) float32 view of a quantized store's full-precision rows.
+    Rows are read on demand from the mapped matrix or the pending append file.
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    @property
+    def shape(self):
+        return (self.store._size, self.store.dim)
+
+    dtype = np.dtype(np.float32)
+
+    def __len__(self):
+        return self.store._size
+
+    def __getitem__(self, key):
+        positions = np.arange(self.store._size)[key]
+        if np.ndim(positions) == 0:
+            return self.store._full_rows(np.asarray([positions]))[0]
+        return self.store._full_rows(positions)
+
+    def __array__(self, dtype=None, copy=None):
+        rows = self.store._full_rows(np.arange(self.store._size))
+        return rows if dtype is None else rows.astype(dtype)
+
 
 class VectorStore:
     """
     A lightweight, in-memory Vector Database.
     Storage Format:
-    [
-        {'id': str, 'vector': np.array, 'text': str, 'metadata': dict}
-    ]
+        matrix:   (N, dim) float32, rows L2-normalized, contiguous
+        ids:      [str]   row -> doc id
+        texts:    [str]   row -> source text
+        metadata: [dict]  row -> metadata
+    Cosine similarity is a single matrix-vector product over `matrix`.
+    A loaded index stays memory-mapped (read-only) until the first write.
+
+    quantization="int8": only per-row int8 codes and scales are held in RAM (4x
+    less than float32). Full-precision rows stay on disk: the saved matrix,
+    memory-mapped, plus a pending append file for rows written since, folded
+    into the matrix by save_index. Search scans the codes and re-ranks the best
+    top_k * rerank candidates exactly, reading only those rows from disk.
+
+    backend="ivf": search goes through an approximate IVF-Flat index (ann_index.IVFIndex)
+    kept in step with every add/delete; only the `nprobe` closest lists are scanned.
     """
-    def __init__(self, client):
-        self.vectors = []
+    def __init__(self, client, batch_size: int = 64, quantization: str = None, rerank: int = 4,
+                 backend: str = "flat", nprobe: int = 8):
+        if quantization not in (None, "int8"):
+            raise ValueError(f"Unsupported quantization: {quantization}")
+        if backend not in ("flat", "ivf"):
+            raise ValueError(f"Unsupported backend: {backend}")
         self.client = client
-        self.dim = 768 # Standard for text-embedding-004
+        self.dim = 768 # Standard for text-embedding-004 (reset by the first vector stored)
+        self.batch_size = batch_size # Texts per embedding request in add_many
+        self._matrix = np.zeros((0, self.dim), dtype=np.float32) # Capacity grows geometrically
+        self._size = 0
+        self.ids = []
+        self.texts = []
+        self.metadata = []
+        self._pos = {} # doc_id -> row
+        self.quantization = quantization
+        self.rerank = max(1, rerank) # Exact re-rank pool = top_k * rerank
+        self._codes = np.zeros((0, self.dim), dtype=np.int8) # Row -> int8 codes when quantized
+        self._scales = np.zeros(0, dtype=np.float32)
+        # Quantized: _matrix is only the mapped on-disk matrix; row -> physical row in
+        # _matrix, or len(_matrix) + n for row n of the pending append file
+        self._where = np.zeros(0, dtype=np.int64)
+        self._pending = None
+        self._pending_rows = 0
+        self._pending_map = None
+        self.backend = backend
+        self.nprobe = nprobe
+        self.ann = IVFIndex(self.dim, nprobe=nprobe) if backend == "ivf" else None
+
+    # --- Storage ---
+
+    @property
+    def matrix(self):
+        """
+        Live (N, dim) view of the normalized embeddings. Quantized stores return
+        the mapped matrix while it is current, else a FullRows view.
+        """
+        if self.quantization and not (self._pending_rows == 0 and len(self._matrix) == self._size
+                                      and np.array_equal(self._where[:self._size], np.arange(self._size))):
+            return FullRows(self)
+        return self._matrix[:self._size]
+
+    @property
+    def vectors(self):
+        """Legacy list-of-dicts view: [{'id', 'vector', 'text', 'metadata'}] (vectors normalized)."""
+        matrix = self.matrix
+        return [
+            {'id': self.ids[i], 'vector': matrix[i], 'text': self.texts[i], 'metadata': self.metadata[i]}
+            for i in range(self._size)
+        ]
+
+    def _full_rows(self, positions: np.ndarray) -> np.ndarray:
+        """float32 rows for logical positions (quantized stores): mapped matrix or pending file."""
+        physical = self._where[np.asarray(positions, dtype=np.int64)]
+        out = np.empty((len(physical), self.dim), dtype=np.float32)
+        mapped = physical < len(self._matrix)
+        if mapped.any():
+            out[mapped] = self._matrix[physical[mapped]]
+        if not mapped.all():
+            out[~mapped] = self._pending_view()[physical[~mapped] - len(self._matrix)]
+        return out
+
+    def _pending_view(self) -> np.ndarray:
+        if self._pending_map is None or len(self._pending_map) != self._pending_rows:
+            self._pending_map = np.memmap(self._pending, dtype=np.float32, mode="r",
+                                          shape=(self._pending_rows, self.dim))
+        return self._pending_map
+
+    def _append_pending(self, rows: np.ndarray) -> np.ndarray:
+        """Append full-precision rows to the pending file. Returns their physical row numbers."""
+        if self._pending is None:
+            self._pending = tempfile.TemporaryFile(prefix="vector_pending-")
+        self._pending.seek(self._pending_rows * self.dim * 4)
+        self._pending.write(np.ascontiguousarray(rows, dtype=np.float32).tobytes())
+        self._pending.flush()
+        start = len(self._matrix) + self._pending_rows
+        self._pending_rows += len(rows)
+        return np.arange(start, start + len(rows))
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0 # Zero vectors stay zero (score 0)
+        return vectors / norms
+
+    def _materialize(self):
+        """Copy a memory-mapped index into writable RAM (first mutation after load_index)."""
+        if self.quantization:
+            pass # Full-precision rows never come into RAM; writes go to the pending file
+        elif isinstance(self._matrix, np.memmap) or self._matrix.dtype != np.float32:
+            self._matrix = np.array(self._matrix[:self._size], dtype=np.float32)
+        if not isinstance(self.texts, list):
+            self.texts = list(self.texts)
+
+    def _reserve(self, extra: int):
+        needed = self._size + extra
+        if self.quantization:
+            if needed <= len(self._codes):
+                return
+            capacity = max(needed, 2 * len(self._codes), 64)
+            codes = np.zeros((capacity, self.dim), dtype=np.int8)
+            codes[:self._size] = self._codes[:self._size]
+            scales = np.ones(capacity, dtype=np.float32)
+            scales[:self._size] = self._scales[:self._size]
+            where = np.zeros(capacity, dtype=np.int64)
+            where[:self._size] = self._where[:self._size]
+            self._codes, self._scales, self._where = codes, scales, where
+            return
+        if needed <= self._matrix.shape[0]:
+            return
+        capacity = max(needed, 2 * self._matrix.shape[0], 64)
+        grown = np.zeros((capacity, self.dim), dtype=np.float32)
+        grown[:self._size] = self._matrix[:self._size]
+        self._matrix = grown
+
+    def _store(self, doc_ids, vectors, texts, metadatas):
+        """Upsert rows: existing IDs are overwritten in place, new ones appended."""
+        self._materialize()
+        rows = self._normalize(vectors)
+        if self._size == 0 and rows.shape[1] != self.dim:
+            self.dim = rows.shape[1]
+            self._matrix = np.zeros((0, self.dim), dtype=np.float32)
+            self._codes = np.zeros((0, self.dim), dtype=np.int8)
+            self._pending, self._pending_rows, self._pending_map = None, 0, None
+            if self.ann is not None:
+                self.ann = IVFIndex(self.dim, nprobe=self.nprobe)
+        self._reserve(len(doc_ids))
+        codes, scales = quantize_int8(rows) if self.quantization else (rows, rows)
+        physical = self._append_pending(rows) if self.quantization else rows
+        for doc_id, row, text, metadata, code, scale, at in zip(doc_ids, rows, texts, metadatas, codes, scales, physical):
+            pos = self._pos.get(doc_id)
+            if pos is None:
+                pos = self._size
+                self._pos[doc_id] = pos
+                self.ids.append(doc_id)
+                self.texts.append(text)
+                self.metadata.append(metadata or {})
+                self._size += 1
+            else:
+                self.texts[pos] = text
+                self.metadata[pos] = metadata or {}
+            if self.quantization:
+                self._codes[pos], self._scales[pos], self._where[pos] = code, scale, at
+            else:
+                self._matrix[pos] = row
+        if self.ann is not None:
+            last = {doc_id: i for i, doc_id in enumerate(doc_ids)} # Same last-wins rule as the rows above
+            self.ann.add(list(last), rows[list(last.values())])
 
     def add(self, doc_id: str, text: str, metadata: dict = None):
         """
@@ -23,19 +379,85 @@ class VectorStore:
         if not vector:
             return False
             
-        self.vectors.append({
-            'id': doc_id,
-            'vector': np.array(vector),
-            'text': text,
-            'metadata': metadata or {}
-        })
+        self._store([doc_id], [vector], [text], [metadata]) # Upsert: a re-added ID replaces the old vector
         return True
 
+    def add_many(self, docs, batch_size: int = None) -> int:
+        """
+        Batched add (upsert). docs: iterable of (doc_id, text, metadata).
+        Embeds `batch_size` texts per request. Returns number of documents stored.
+        """
+        batch_size = batch_size or self.batch_size
+        docs = list(docs)
+        added = 0
+        for start in range(0, len(docs), batch_size):
+            batch = docs[start:start + batch_size]
+            vectors = embed_texts(self.client, [text for _, text, _ in batch])
+            kept = [(doc, vec) for doc, vec in zip(batch, vectors) if vec]
+            if not kept:
+                continue
+            self._store(
+                [doc[0] for doc, _ in kept], [vec for _, vec in kept],
+                [doc[1] for doc, _ in kept], [doc[2] for doc, _ in kept]
+            )
+            added += len(kept)
+        return added
+
+    def add_concept_block(self, block: dict):
+        doc_id, text, metadata = concept_document(block)
+        return self.add(doc_id, text, metadata)
+
+    def add_concept_blocks(self, blocks, batch_size: int = None) -> int:
+        """Batched add_concept_block. Malformed blocks are skipped."""
+        docs = []
+        for block in blocks:
+            try:
+                docs.append(concept_document(block))
+            except Exception:
+                continue
+        return self.add_many(docs, batch_size)
+
+    def delete(self, doc_ids):
+        """Remove documents (last row moves into the freed slot)."""
+        self._materialize()
+        if self.ann is not None:
+            self.ann.remove(doc_ids)
+        for doc_id in doc_ids:
+            pos = self._pos.pop(doc_id, None)
+            if pos is None:
+                continue
+            last = self._size - 1
+            if pos != last:
+                if self.quantization:
+                    self._codes[pos], self._scales[pos] = self._codes[last], self._scales[last]
+                    self._where[pos] = self._where[last]
+                else:
+                    self._matrix[pos] = self._matrix[last]
+                self.ids[pos] = self.ids[last]
+                self.texts[pos] = self.texts[last]
+                self.metadata[pos] = self.metadata[last]
+                self._pos[self.ids[pos]] = pos
+            self.ids.pop()
+            self.texts.pop()
+            self.metadata.pop()
+            self._size -= 1
+
+    def count(self):
+        return self._size
+
+    def all_ids(self):
+        return list(self.ids)
+
+    def sample_metadata(self, limit: int = 64):
+        return [dict(m) for m in self.metadata[:limit]]
+
+    # --- Search ---
+
     def search(self, query: str, top_k: int = 3, threshold: float = 0.5):
         """
         Semantic Search using Cosine Similarity.
         """
-        if not self.vectors:
+        if not self._size:
             return []
 
         # 1. Embed Query
@@ -43,60 +465,185 @@ class VectorStore:
         if not query_vec:
             return []
         
-        q_v = np.array(query_vec)
-        q_norm = np.linalg.norm(q_v)
-        
+        return self.search_vectors(np.asarray([query_vec]), top_k, threshold)[0]
+
+    def search_many(self, queries, top_k: int = 3, threshold: float = 0.5):
+        """Batch search: one embedding request and one matrix-matrix product. One result list per query."""
+        queries = list(queries)
+        if not self._size or not queries:
+            return [[] for _ in queries]
+        vectors = embed_texts(self.client, queries)
+        valid = [i for i, v in enumerate(vectors) if v]
+        results = [[] for _ in queries]
+        if valid:
+            found = self.search_vectors(np.asarray([vectors[i] for i in valid]), top_k, threshold)
+            for i, hits in zip(valid, found):
+                results[i] = hits
+        return results
+
+    def search_vectors(self, query_vectors: np.ndarray, top_k: int = 3, threshold: float = 0.5):
+        """
+        Core scan. query_vectors: (Q, dim). Returns one ranked hit list per row.
+        Scores = Qn @ M.T; top-k by argpartition, cut by a vectorized threshold mask.
+        Queries are scanned in chunks so the (Q, N) score block stays ~64MB at 1M items.
+        """
+        queries = self._normalize(np.atleast_2d(query_vectors))
+        k = min(top_k, self._size)
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        if self.ann is not None:
+            results = []
+            for labels, scores in self.ann.search(queries, k):
+                keep = scores >= threshold
+                results.append([self._hit(self._pos[l], v) for l, v, ok in zip(labels, scores, keep) if ok])
+            return results
+
+        chunk = max(1, SCORE_BLOCK // self._size)
+        quantized = self.quantization and self._size > k * self.rerank
         results = []
-        
-        # 2. Brute-Force Cosine Similarity (Fast enough for <10k items)
-        for item in self.vectors:
-            doc_v = item['vector']
-            d_norm = np.linalg.norm(doc_v)
-            
-            if d_norm == 0 or q_norm == 0:
-                score = 0
+        for start in range(0, len(queries), chunk):
+            if quantized:
+                top, top_scores = self._rerank(queries[start:start + chunk], k)
             else:
-                score = np.dot(q_v, doc_v) / (q_norm * d_norm)
-                
-            if score >= threshold:
-                results.append((score, item))
-                
-        # 3. Sort
-        results.sort(key=lambda x: x[0], reverse=True)
-        
-        # 4. Format Output
-        final_results = []
-        for score, item in results[:top_k]:
-            final_results.append({
-                'score': float(score),
-                'id': item['id'],
-                'metadata': item['metadata'],
-                'snippet': item['text'][:100]
-            })
-            
-        return final_results
-
-    def save_index(self, path="data/vector_index.json"):
-        # We can't save numpy arrays directly to JSON without conversion
-        serializable = []
-        for item in self.vectors:
-            serializable.append({
-                'id': item['id'],
-                'vector': item['vector'].tolist(),
-                'text': item['text'],
-                'metadata': item['metadata']
-            })
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(serializable, f)
-
-    def load_index(self, path="data/vector_index.json"):
+                scores = self._scores(queries[start:start + chunk]) # (q, N)
+                if k < self._size:
+                    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                else:
+                    top = np.broadcast_to(np.arange(self._size), scores.shape)
+                top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            keep = top_scores >= threshold
+            for rows, vals, mask in zip(top, top_scores, keep):
+                results.append([self._hit(int(i), v) for i, v in zip(rows[mask], vals[mask])])
+        return results
+
+    def recall_at_k(self, query_vectors: np.ndarray = None, k: int = 10, sample: int = 100, seed: int = 0) -> float:
+        """
+        ANN quality report: fraction of the exact top-k the ivf backend returns
+        (1.0 for flat). Default queries are `sample` stored vectors.
+        """
+        if self.ann is None or not self._size:
+            return 1.0
+        if query_vectors is None:
+            rows = np.random.default_rng(seed).choice(self._size, min(sample, self._size), replace=False)
+            query_vectors = np.asarray(self.matrix[np.sort(rows)], dtype=np.float32)
+        return self.ann.recall_at_k(query_vectors, k)
+
+    def _rerank(self, queries: np.ndarray, k: int):
+        """Coarse top (k * rerank) on int8 codes, then exact top-k on full-precision rows. Returns (rows, scores)."""
+        coarse = np.empty((len(queries), self._size), dtype=np.float32)
+        for start in range(0, self._size, CODE_BLOCK):
+            block = self._codes[start:min(start + CODE_BLOCK, self._size)].astype(np.float32)
+            coarse[:, start:start + len(block)] = (queries @ block.T) * self._scales[start:start + len(block)]
+        pool = min(self._size, k * self.rerank)
+        cand = np.argpartition(-coarse, pool - 1, axis=1)[:, :pool]
+
+        # Exact scores: only the candidate rows are read (paged in) from the matrix
+        rows = np.unique(cand)
+        exact = queries @ self._full_rows(rows).T
+        exact = np.take_along_axis(exact, np.searchsorted(rows, cand), axis=1)
+        best = np.argpartition(-exact, k - 1, axis=1)[:, :k]
+        return np.take_along_axis(cand, best, axis=1), np.take_along_axis(exact, best, axis=1)
+
+    def _scores(self, queries: np.ndarray) -> np.ndarray:
+        matrix = self.matrix
+        if isinstance(matrix, np.ndarray) and matrix.dtype == np.float32 and not isinstance(matrix, np.memmap):
+            return queries @ matrix.T
+        # float16 / mmap / FullRows: cast (and page in) one row block at a time
+        scores = np.empty((len(queries), self._size), dtype=np.float32)
+        for start in range(0, self._size, ROW_BLOCK):
+            block = np.asarray(matrix[start:start + ROW_BLOCK], dtype=np.float32)
+            scores[:, start:start + len(block)] = queries @ block.T
+        return scores
+
+    def _hit(self, row: int, score) -> dict:
+        return {
+            'score': float(score),
+            'id': self.ids[row],
+            'metadata': self.metadata[row],
+            'snippet': self.texts[row][:100]
+        }
+
+    # --- Persistence ---
+
+    def save_index(self, path="data/vector_index", dtype: str = None):
+        """
+        Write the binary index (see index_paths). Defaults to float16 (scores within ~1e-3),
+        or float32 for quantized stores so the re-rank stays full precision.
+        """
+        dtype = dtype or ("float32" if self.quantization else "float16")
+        codes = self._codes[:self._size] if self.quantization else None
+        paths = write_index(path, self.ids, self.matrix, self.texts, self.metadata, dtype,
+                            codes, self._scales[:self._size] if self.quantization else None)
+        if self.ann is not None:
+            self.ann.save(paths["ann"])
+        if self.quantization and self._size:
+            # Fold the pending rows in: map the file just written, drop the append file
+            self._matrix = np.load(paths["matrix"], mmap_mode="r")
+            self._where[:self._size] = np.arange(self._size)
+            self._pending, self._pending_rows, self._pending_map = None, 0, None
+
+    def load_index(self, path="data/vector_index"):
+        """
+        Open the binary index memory-mapped (no parsing, pages load on first scan).
+        A legacy JSON index at the same base path is converted once.
+        """
+        paths = index_paths(path)
+        if not os.path.exists(paths["meta"]) and os.path.exists(paths["json"]):
+            count = convert_json_index(paths["json"], path)
+            print(colored(f"[Memory] Converted legacy JSON index ({count} vectors) to {paths['matrix']}.", "yellow"))
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.vectors = []
-                for item in data:
-                    item['vector'] = np.array(item['vector'])
-                    self.vectors.append(item)
-            print(colored(f"[Memory] Loaded {len(self.vectors)} vectors from disk.", "green"))
+            with open(paths["meta"], "r", encoding="utf-8") as f:
+                sidecar = json.load(f)
         except FileNotFoundError:
             print(colored("[Memory] No existing vector index found. Starting fresh.", "yellow"))
+            return
+        if sidecar.get("version") != INDEX_VERSION:
+            print(colored(f"[Memory] Unsupported vector index version {sidecar.get('version')}. Starting fresh.", "red"))
+            return
+
+        self.__init__(self.client, self.batch_size, self.quantization, self.rerank, self.backend, self.nprobe)
+        count = sidecar["count"]
+        if count:
+            self._matrix = np.load(paths["matrix"], mmap_mode="r")
+            self.dim = self._matrix.shape[1]
+            self.texts = MappedTexts(paths["text"], sidecar["text_offsets"])
+            if self.quantization:
+                self._load_codes(paths, sidecar)
+                self._where = np.arange(count, dtype=np.int64)
+            if self.ann is not None:
+                self._load_ann(paths, sidecar)
+        self.ids = sidecar["ids"]
+        self.metadata = sidecar["metadata"]
+        self._pos = {doc_id: i for i, doc_id in enumerate(self.ids)}
+        self._size = count
+        print(colored(f"[Memory] Loaded {self._size} vectors from disk.", "green"))
+
+    def _load_codes(self, paths: dict, sidecar: dict):
+        """Resident int8 codes: read from disk if saved, else quantized from the mapped matrix in blocks."""
+        count = sidecar["count"]
+        if sidecar.get("quantization") == self.quantization and os.path.exists(paths["codes"]):
+            codes, scales = np.load(paths["codes"]), np.load(paths["scales"])
+            if len(codes) == count and len(scales) == count:
+                self._codes, self._scales = codes, scales
+                return
+        self._codes = np.empty((count, self.dim), dtype=np.int8)
+        self._scales = np.empty(count, dtype=np.float32)
+        for start in range(0, count, ROW_BLOCK):
+            block = self._matrix[start:start + ROW_BLOCK]
+            self._codes[start:start + len(block)], self._scales[start:start + len(block)] = quantize_int8(block)
+
+    def _load_ann(self, paths: dict, sidecar: dict):
+        """Saved IVF index if it matches the sidecar's IDs, else rebuilt (trained) from the mapped matrix."""
+        try:
+            ann = IVFIndex.load(paths["ann"], nprobe=self.nprobe)
+            if len(ann) == sidecar["count"] and all(doc_id in ann for doc_id in sidecar["ids"]):
+                self.ann = ann
+                return
+        except (OSError, ValueError, KeyError):
+            pass
+        self.ann = IVFIndex(self.dim, nprobe=self.nprobe)
+        self.ann.build(sidecar["ids"], np.asarray(self._matrix, dtype=np.float32))
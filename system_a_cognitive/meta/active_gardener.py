@@ -5,6 +5,7 @@ import random
 from termcolor import colored
 from system_b_llm.interfaces.gemini_client import GeminiClient
 from system_a_cognitive.meta.deep_researcher import DeepResearchAgent
+from system_a_cognitive.memory.concept_corpus import get_concept_corpus
 from config import Config
 
 class ActiveGardener:
@@ -16,6 +17,7 @@ class ActiveGardener:
     """
     def __init__(self, concepts_dir="data/concepts"):
         self.concepts_dir = concepts_dir
+        self.corpus = get_concept_corpus(concepts_dir)
         self.researcher = DeepResearchAgent()
         self.client = GeminiClient(Config.LLM_API_KEY, Config.LLM_MODEL)
         
@@ -36,18 +38,16 @@ class ActiveGardener:
         """
         print(colored("  [Gardener] Rebuilding Registry from disk...", "magenta"))
         registry = {}
-        files = [f for f in os.listdir(self.concepts_dir) if f.endswith(".json")]
+        self.corpus.refresh() # Registry must reflect disk, including other writers
         
-        for fname in files:
+        for fname, data in self.corpus.items():
             try:
-                with open(os.path.join(self.concepts_dir, fname), 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    name = data.get("name", "").lower().replace(" ", "_")
-                    gid = data.get("id", {}).get("group")
-                    iid = data.get("id", {}).get("item")
-                    
-                    if name and gid and iid:
-                        registry[name] = {"group": gid, "item": iid}
+                name = data.get("name", "").lower().replace(" ", "_")
+                gid = data.get("id", {}).get("group")
+                iid = data.get("id", {}).get("item")
+                
+                if name and gid and iid:
+                    registry[name] = {"group": gid, "item": iid}
             except: continue
             
         reg_path = os.path.join(os.path.dirname(self.concepts_dir), "registry.json")
@@ -59,6 +59,7 @@ class ActiveGardener:
         """
         Scans for gaps. Randomly chooses between SPATIAL, PHYSICS, REGISTRY, and RELATIONS audits.
         """
+        self.corpus.refresh() # Every cycle sees concepts written by other processes (e.g. the API)
         audit_mode = random.choices(["SPATIAL", "PHYSICS", "REGISTRY", "RELATIONS"], weights=[30, 30, 15, 25], k=1)[0]
         
         if audit_mode == "REGISTRY":
@@ -72,19 +73,16 @@ class ActiveGardener:
         print(colored(f"  [Gardener] Running Audit Mode: {audit_mode}...", "cyan"))
         # ... logic continues ...
 
-        files = [f for f in os.listdir(self.concepts_dir) if f.endswith(".json")]
-        random.shuffle(files) # Randomize to avoid getting stuck
+        entries = list(self.corpus.items())
+        random.shuffle(entries) # Randomize to avoid getting stuck
         
         target_file = None
         target_data = None
         gap_type = None
         
         # 1. Find a candidate
-        for fname in files:
+        for fname, data in entries:
             try:
-                with open(os.path.join(self.concepts_dir, fname), 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
                 ctype = data.get("type", "UNKNOWN")
                 cid = data.get("id", {}).get("group", 99)
                 is_physical = (20 <= cid <= 39) or ctype in ["INANIMATE_OBJECT", "LIVING_SYSTEM", "BODY_PART", "MECHANICAL_PART"]
@@ -169,37 +167,34 @@ class ActiveGardener:
 
     def _write_patch(self, concept_name, facet_key, facet_data, merge=False):
         """Helper to write to disk. Logic centralized."""
-        for f in os.listdir(self.concepts_dir):
-            if f.endswith(".json"):
+        found = self.corpus.find_by_name(concept_name)
+        if found:
+            try:
+                fname = found[0]
+                d = self.corpus.get_for_update(fname) # Fresh copy; the cache is updated by save()
+                if "facets" not in d: d["facets"] = {}
+                
+                if merge and facet_key in d["facets"]:
+                    d["facets"][facet_key].update(facet_data)
+                else:
+                    d["facets"][facet_key] = facet_data
+                    
+                d["autocorrected"] = True
+                
+                # AUTO-ADD ID RELATIONS
                 try:
-                    path = os.path.join(self.concepts_dir, f)
-                    with open(path, 'r', encoding='utf-8') as jf:
-                        d = json.load(jf)
-                        if d.get("name") == concept_name:
-                            if "facets" not in d: d["facets"] = {}
-                            
-                            if merge and facet_key in d["facets"]:
-                                d["facets"][facet_key].update(facet_data)
-                            else:
-                                d["facets"][facet_key] = facet_data
-                                
-                            d["autocorrected"] = True
-                            
-                            # AUTO-ADD ID RELATIONS
-                            try:
-                                from system_a_cognitive.logic.relation_builder import get_builder
-                                builder = get_builder()
-                                relations_added = builder.auto_add_relations(d)
-                                if relations_added > 0:
-                                    print(colored(f"  [Gardener] Added {relations_added} ID-based relations", "cyan"))
-                            except Exception as e:
-                                print(colored(f"  [Gardener] RelationBuilder error: {e}", "yellow"))
-                            
-                            with open(path, 'w', encoding='utf-8') as wf:
-                                json.dump(d, wf, indent=2)
-                            print(colored(f"  [Gardener] SUCCESS: '{concept_name}' updated.", "green"))
-                            return
-                except: pass
+                    from system_a_cognitive.logic.relation_builder import get_builder
+                    builder = get_builder()
+                    relations_added = builder.auto_add_relations(d)
+                    if relations_added > 0:
+                        print(colored(f"  [Gardener] Added {relations_added} ID-based relations", "cyan"))
+                except Exception as e:
+                    print(colored(f"  [Gardener] RelationBuilder error: {e}", "yellow"))
+                
+                self.corpus.save(fname, d)
+                print(colored(f"  [Gardener] SUCCESS: '{concept_name}' updated.", "green"))
+                return
+            except: pass
         print(colored(f"  [Gardener] Error: Could not file file for '{concept_name}'", "red"))
 
     def _audit_relations(self):
@@ -214,17 +209,13 @@ class ActiveGardener:
         rb = RelationBuilder()
         pattern = r'\(\d+,\s*\d+\)'
         
-        files = [f for f in os.listdir(self.concepts_dir) if f.endswith('.json')]
-        random.shuffle(files)
+        entries = list(self.corpus.items())
+        random.shuffle(entries)
         
         enriched = 0
         
-        for fname in files[:50]:  # Limit to 50 per cycle
+        for fname, data in entries[:50]:  # Limit to 50 per cycle
             try:
-                path = os.path.join(self.concepts_dir, fname)
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
                 # Check if already has ID-based relations
                 has_id_rel = any(
                     re.search(pattern, str(c.get('object', '')))
@@ -232,10 +223,10 @@ class ActiveGardener:
                 )
                 
                 if not has_id_rel:
+                    data = self.corpus.get_for_update(fname)
                     added = rb.auto_add_relations(data)
                     if added > 0:
-                        with open(path, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, indent=2)
+                        self.corpus.save(fname, data)
                         print(colored(f"    + {data.get('name', fname)}: {added} relations", "green"))
                         enriched += 1
                         if enriched >= 5:  # Limit per run
@@ -1,7 +1,6 @@
-import os
-import json
 import re
 from termcolor import colored
+from system_a_cognitive.memory.concept_corpus import get_concept_corpus
 from system_b_llm.interfaces.gemini_client import GeminiClient
 from config import Config
 
@@ -15,7 +14,8 @@ class RelationAuditor:
         self.client = GeminiClient(Config.LLM_API_KEY, Config.LLM_MODEL)
 
     def audit(self, interactive=True):
-        files = [f for f in os.listdir(self.concepts_dir) if f.endswith(".json")]
+        corpus = get_concept_corpus(self.concepts_dir)
+        corpus.refresh() # Long-lived callers (gardener, API) must see files written since the last audit
         
         if interactive:
             print(colored("SYSTEM: Initiating Deep Relation Audit (Web-Grounded)...", "cyan"))
@@ -25,15 +25,7 @@ class RelationAuditor:
         structure_checks = []
         rel_pattern = re.compile(r"(.+?)\s+([A-Z_]+(?:_[A-Z]+)*)\s+(.+)")
         
-        for filename in files:
-            filepath = os.path.join(self.concepts_dir, filename)
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            except Exception as e:
-                print(f"Skipping corrupt file {filename}: {e}")
-                continue
-                
+        for filename, data in corpus.items():
             source_name = data.get('name', 'Unknown')
             ctype = data.get('type', 'UNKNOWN')
             cid_group = data.get('id', {}).get('group', 0)
@@ -75,6 +67,9 @@ class RelationAuditor:
                     subj, rel, obj = match.groups()
                     if subj.lower() == source_name.lower():
                         all_facts.append((filename, val))
+        
+        for filename, error in corpus.errors.items():
+            print(f"Skipping corrupt file {filename}: {error}")
                         
         if interactive:
             print(colored(f"Found {len(all_facts)} relations and {len(structure_checks)} structural issues to verify.\n", "cyan"))
@@ -173,15 +168,16 @@ class RelationAuditor:
 
     def apply_fixes(self, issues):
         print(colored("Applying fixes...", "cyan"))
+        corpus = get_concept_corpus(self.concepts_dir)
         for issue in issues:
-            filepath = os.path.join(self.concepts_dir, issue['file'])
             fact_to_remove = issue['fact']
             action = issue['action']
             new_fact = issue['correction']
             
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = corpus.get_for_update(issue['file'])
+                if data is None:
+                    raise ValueError(corpus.errors.get(issue['file'], "file not found"))
                 
                 modified = False
 
@@ -240,8 +236,7 @@ class RelationAuditor:
                         data['facets'] = original_facets
 
                 if modified:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2)
+                    corpus.save(issue['file'], data)
                     if action != "UPDATE_ID":
                         print(f"  [FIXED] {issue['file']} ({action})")
                 else:
@@ -1,7 +1,6 @@
-import os
-import json
 from termcolor import colored
 import re
+from system_a_cognitive.memory.concept_corpus import get_concept_corpus
 
 class KnowledgeConsolidator:
     """
@@ -25,17 +24,15 @@ class KnowledgeConsolidator:
     def consolidate(self):
         print(colored("SYSTEM: Running Knowledge Consolidation Cycle...", "cyan"))
         
-        # 1. Load All
-        files = [f for f in os.listdir(self.concepts_dir) if f.endswith(".json")]
+        # 1. Load All (shared corpus, parsed once per process)
+        corpus = get_concept_corpus(self.concepts_dir)
+        corpus.refresh() # Pick up files written by other processes since the last cycle
         concept_map = {} # name -> filepath
         data_map = {}    # filename -> json_data
         
-        for f in files:
-            path = os.path.join(self.concepts_dir, f)
-            with open(path, 'r', encoding='utf-8') as file:
-                d = json.load(file)
-                concept_map[d['name'].lower()] = f
-                data_map[f] = d
+        for f, d in corpus.items():
+            concept_map[d['name'].lower()] = f
+            data_map[f] = d
                 
         updates = {} # filename -> list of new facets
 
@@ -103,8 +100,9 @@ class KnowledgeConsolidator:
         
         count = 0
         for fname, new_facets in updates.items():
-            path = os.path.join(self.concepts_dir, fname)
-            original = data_map[fname]
+            original = corpus.get_for_update(fname) # Fresh copy: the file may have changed since the scan
+            if original is None:
+                continue
             
             # Append new facets
             # Handle schema (list vs dict) - defaulting to list for now as per V2
@@ -115,8 +113,7 @@ class KnowledgeConsolidator:
                 if "STRUCTURAL" not in original['facets']: original['facets']["STRUCTURAL"] = []
                 original['facets']["STRUCTURAL"].extend(new_facets)
                 
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(original, f, indent=2)
+            corpus.save(fname, original)
             
             print(f"  > Updated {original['name']} with {len(new_facets)} links (e.g., {new_facets[0]['value']})")
             count += len(new_facets)
@@ -1,3 +1,5 @@
+import asyncio
+import concurrent.futures
 import json
 from termcolor import colored
 from system_b_llm.interfaces.gemini_client import GeminiClient
@@ -14,9 +16,12 @@ class DeepResearchAgent(ResearchAgent):
     2. Recursively investigates gaps (Depth First Search).
     3. Critiques its own findings for completeness.
     """
-    def __init__(self):
+    def __init__(self, max_parallel_branches: int = 3):
         super().__init__()
         # We reuse self.client, self.ingestor from parent
+        # Sub-topics are explored concurrently; the shared LLM rate limiter
+        # bounds how many provider calls are actually in flight.
+        self.max_parallel_branches = max_parallel_branches
 
     def conduct_deep_research(self, topic: str, max_depth=2):
         print(colored(f"\n╔═══ DEEP RESEARCH SCIENTIST: '{topic}' ═══╗", "magenta", attrs=['bold']))
@@ -42,16 +47,29 @@ class DeepResearchAgent(ResearchAgent):
         else:
             investigation_queue = [topic] # Fallback
 
-        # Iterate through the initial plan
-        all_new_concepts = []
-        for sub_topic in investigation_queue:
-            concepts = self._investigate_node(sub_topic, current_depth=0, max_depth=max_depth)
-            all_new_concepts.extend(concepts)
+        # Explore every branch of the plan in parallel
+        all_new_concepts = _run_async(self._investigate_all(investigation_queue, max_depth))
             
         print(colored(f"\n╚═══ DEEP RESEARCH COMPLETE: '{topic}' ═══╝", "magenta", attrs=['bold']))
         return all_new_concepts
 
-    def _investigate_node(self, topic, current_depth, max_depth):
+    async def _investigate_all(self, topics, max_depth):
+        branch_slots = asyncio.Semaphore(max(1, self.max_parallel_branches))
+
+        async def branch(sub_topic):
+            async with branch_slots:
+                return await self._investigate_node(str(sub_topic), current_depth=0, max_depth=max_depth)
+
+        results = await asyncio.gather(*(branch(t) for t in topics), return_exceptions=True)
+        all_new_concepts = []
+        for sub_topic, concepts in zip(topics, results):
+            if isinstance(concepts, Exception):
+                print(colored(f"  [!] Branch '{sub_topic}' failed: {concepts}", "red"))
+                continue
+            all_new_concepts.extend(concepts)
+        return all_new_concepts
+
+    async def _investigate_node(self, topic, current_depth, max_depth):
         indent = "  " * (current_depth + 1)
         print(colored(f"{indent}> Investigating: '{topic}' (Depth {current_depth})", "yellow"))
         
@@ -59,14 +77,14 @@ class DeepResearchAgent(ResearchAgent):
         
         # 1. Search
         # We always attempt real search now via DuckDuckGo
-        results = self._search_real(topic)
+        results = await asyncio.to_thread(self._search_real, topic)
         if results is None: 
             print(colored(f"{indent}  [!] Real Search failed. Falling back to Simulation.", "magenta"))
-            results = self._search_simulated(topic)
+            results = await asyncio.to_thread(self._search_simulated, topic)
             
         # 2. Ingest Immediate Findings
         print(colored(f"{indent}  > Ingesting {len(results)} chars...", "cyan"))
-        new_names = self.ingestor.ingest_text(results, source_name=f"deep_research_d{current_depth}")
+        new_names = await self.ingestor.aingest_text(results, source_name=f"deep_research_d{current_depth}")
         created_concepts.extend(new_names)
         
         # 3. Stop Condition
@@ -74,14 +92,14 @@ class DeepResearchAgent(ResearchAgent):
             return created_concepts
 
         # 4. Critique & Expand (The Recursive Step)
-        critique = self._critique_completeness(topic, results)
+        critique = await self._critique_completeness(topic, results)
         
         if critique['status'] == 'INCOMPLETE':
             print(colored(f"{indent}  [!] CRITIQUE: Missing concept '{critique['missing_term']}'", "red"))
             print(colored(f"{indent}  --> Recursively researching '{critique['missing_term']}'...", "magenta"))
             
             # Recursive Call
-            sub_concepts = self._investigate_node(critique['missing_term'], current_depth + 1, max_depth)
+            sub_concepts = await self._investigate_node(critique['missing_term'], current_depth + 1, max_depth)
             created_concepts.extend(sub_concepts)
         else:
             print(colored(f"{indent}  [OK] Concept definition satisfies rigor.", "green"))
@@ -101,7 +119,7 @@ class DeepResearchAgent(ResearchAgent):
         except:
             return [f"Mechanism of {topic}", f"History of {topic}", f"Applications of {topic}"]
 
-    def _critique_completeness(self, topic, text_content):
+    async def _critique_completeness(self, topic, text_content):
         """
         Asks LLM: Did we define the core terms? Or did we find a new term that is undefined?
         """
@@ -125,7 +143,7 @@ class DeepResearchAgent(ResearchAgent):
             "missing_term": "Term to research" (or null)
         }}
         """
-        response = self.client.completion("You are a Critic. Output JSON.", prompt)
+        response = await self.client.acompletion("You are a Critic. Output JSON.", prompt)
         try:
             data = json.loads(response.strip().strip("`json").strip("`"))
             # Safety check
@@ -133,3 +151,13 @@ class DeepResearchAgent(ResearchAgent):
             return data
         except:
             return {"status": "COMPLETE", "missing_term": None}
+
+
+def _run_async(coro):
+    """asyncio.run, or on a helper thread when called from inside a running loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
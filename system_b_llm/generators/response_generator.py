@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 from ..interfaces.llm_provider import LLMProvider
 
 class ResponseGenerator:
@@ -11,7 +11,18 @@ class ResponseGenerator:
         """
         if not self.llm:
             return self._fallback_template_generate(contract)
+        return self.llm.completion(*self._prompts(contract, query_context))
 
+    def generate_stream(self, contract: Any, query_context: Dict) -> Iterator[str]:
+        """generate() as chunks, token by token when the provider streams."""
+        if not self.llm:
+            yield self._fallback_template_generate(contract)
+        elif hasattr(self.llm, "stream_completion"):
+            yield from self.llm.stream_completion(*self._prompts(contract, query_context))
+        else:
+            yield self.llm.completion(*self._prompts(contract, query_context))
+
+    def _prompts(self, contract: Any, query_context: Dict):
         system_prompt = f"""You are the Voice of the World-Model Cognitive System (WMCS).
 You are a Neuro-Symbolic AI that thinks in Concept Blocks.
 Your knowledge comes EXCLUSIVELY from the provided Memory Contract.
@@ -30,7 +41,7 @@ IMPORTANT: If 'MUST SAY' is empty, you must reply: "I do not have enough informa
 IMPORTANT: If the valid info contains conflicting claims or specific sources, you MUST cite them (Author, Date) in your response.
 """
         user_prompt = f"Original Query: {query_context.get('raw_query')}"
-        return self.llm.completion(system_prompt, user_prompt)
+        return system_prompt, user_prompt
 
     def _fallback_template_generate(self, contract: Any) -> str:
         # Fallback template logic
@@ -17,6 +17,7 @@ class GeminiClient(LLMProvider):
         # New SDK Client Initialization
         self.client = genai.Client(api_key=api_key)
         self.model_name = model
+        self.embedding_model = "text-embedding-004" # embed_content / _embed_batch (cache key too)
 
     def completion(self, system_prompt: str, user_prompt: str) -> str:
         try:
@@ -30,6 +31,17 @@ class GeminiClient(LLMProvider):
         except Exception as e:
             return f"Error connecting to Gemini: {str(e)}"
 
+    def _stream_completion(self, system_prompt: str, user_prompt: str):
+        """Chunks from generate_content_stream, same prompt layout as completion()."""
+        full_prompt = f"{system_prompt}\n\nUser Query: {user_prompt}"
+
+        for chunk in self.client.models.generate_content_stream(
+            model=self.model_name,
+            contents=full_prompt
+        ):
+            if chunk.text:
+                yield chunk.text
+
     def completion_with_search(self, system_prompt: str, user_prompt: str) -> str:
         """
         Uses Google Search Grounding to verify facts using the new SDK.
@@ -78,11 +90,11 @@ class GeminiClient(LLMProvider):
 
     def embed_content(self, text: str) -> list[float]:
         """
-        Generates vector embeddings for the given text using 'text-embedding-004'.
+        Generates vector embeddings for the given text using self.embedding_model ('text-embedding-004').
         """
         try:
             response = self.client.models.embed_content(
-                model="text-embedding-004",
+                model=self.embedding_model,
                 contents=text
             )
             return response.embeddings[0].values
@@ -90,6 +102,18 @@ class GeminiClient(LLMProvider):
             print(f"Embedding Failed: {e}")
             return []
 
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """One embedding request for a whole batch of texts."""
+        try:
+            response = self.client.models.embed_content(
+                model=self.embedding_model,
+                contents=texts
+            )
+            return [e.values for e in response.embeddings]
+        except Exception as e:
+            print(f"Batch Embedding Failed: {e}")
+            return [[] for _ in texts]
+
     def analyze_image(self, prompt: str, image_path: str) -> str:
         """
         Multimodal analysis using Gemini 1.5 Flash/Pro.
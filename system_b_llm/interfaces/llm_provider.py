@@ -1,7 +1,120 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional
+import asyncio
+import functools
+import threading
+
+from .rate_limiter import get_rate_limiter
+from .response_cache import ResponseCache, get_response_cache
+
+
+class LLMStreamError(RuntimeError):
+    """A streamed completion failed; `partial` holds what was already yielded (not an answer)."""
+
+    def __init__(self, message: str, partial: str = ""):
+        super().__init__(message)
+        self.partial = partial
+
+
+def _text_ok(result) -> bool:
+    # Clients report failures as "Error ..." strings; never cache those
+    return isinstance(result, str) and bool(result) and not result.startswith("Error")
+
+# Provider methods served from the response cache, with "is this worth caching" checks
+_CACHED_METHODS = {
+    "completion": _text_ok,
+    "completion_with_search": _text_ok,
+    "json_completion": lambda r: isinstance(r, dict) and "error" not in r,
+    "embed_content": lambda r: bool(r),
+}
+# ... cached only when the caller passes use_cache=True (web-grounded answers go stale)
+_OPT_IN_METHODS = {"completion_with_search"}
+
+_call_state = threading.local()  # Nesting depth: json_completion -> completion is cached and rate-limited once
+
+
+def _with_cache(name: str, fn, cacheable):
+    @functools.wraps(fn)
+    def wrapper(self, *args, bypass_cache: bool = False, use_cache: bool = None, **kwargs):
+        depth = getattr(_call_state, "depth", 0)
+        if depth:
+            return fn(self, *args, **kwargs)  # Outer call already holds the cache check and a rate slot
+
+        if use_cache is None:
+            use_cache = name not in _OPT_IN_METHODS
+        cache = self.response_cache if use_cache else None
+        if cache is not None:
+            model = self.embedding_model_id if name == "embed_content" else self.model_id
+            key = cache.make_key(type(self).__name__, model, name, self.cache_params(), args, kwargs)
+            if bypass_cache:
+                cache.bypasses += 1
+            else:
+                found, value = cache.lookup(key)
+                if found:
+                    return value
+
+        _call_state.depth = depth + 1
+        try:
+            with get_rate_limiter().slot():
+                result = fn(self, *args, **kwargs)
+        finally:
+            _call_state.depth = depth
+        if cache is not None and cacheable(result):
+            cache.put(key, result, name)  # A bypassed call still refreshes the entry
+        return result
+    return wrapper
+
 
 class LLMProvider(ABC):
+    """
+    Base interface for LLM clients.
+    Subclass implementations of completion / json_completion / embed_content
+    are transparently served from the shared on-disk ResponseCache (keyed on
+    model_id, or embedding_model_id for embeddings). Pass bypass_cache=True to
+    force a fresh call, or set `client.response_cache = None` to disable
+    caching for one client. completion_with_search (live web results) is
+    cached only for callers that pass use_cache=True.
+    Calls that reach the network take a slot from the shared RateLimiter.
+
+    acompletion / ajson_completion / aembed are the async forms: they run the
+    (cached, rate-limited) sync call on a worker thread, so callers can
+    asyncio.gather() many requests while the limiter bounds what is in flight.
+
+    stream_completion yields the completion as it is generated when the
+    provider implements _stream_completion (one chunk otherwise). A stream
+    that fails raises LLMStreamError instead of yielding error text, so the
+    chunks already sent are never mistaken for a complete answer.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, cacheable in _CACHED_METHODS.items():
+            if name in cls.__dict__:
+                setattr(cls, name, _with_cache(name, cls.__dict__[name], cacheable))
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        if "_response_cache" not in self.__dict__:
+            self._response_cache = get_response_cache()
+        return self._response_cache
+
+    @response_cache.setter
+    def response_cache(self, cache: Optional[ResponseCache]):
+        self._response_cache = cache
+
+    @property
+    def model_id(self) -> str:
+        return getattr(self, "model_name", None) or getattr(self, "model", None) or ""
+
+    @property
+    def embedding_model_id(self) -> str:
+        """Model that embed_content / embed_batch use (defaults to model_id)."""
+        return getattr(self, "embedding_model", None) or self.model_id
+
+    def cache_params(self) -> Dict[str, Any]:
+        """Generation settings that change the output (part of the cache key)."""
+        return {}
+
     @abstractmethod
     def completion(self, system_prompt: str, user_prompt: str) -> str:
         """Returns raw text response"""
@@ -11,3 +124,91 @@ class LLMProvider(ABC):
     def json_completion(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
         """Returns parsed JSON response"""
         pass
+
+    # --- Batched embeddings ---
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embeddings for several texts ([] for failures), in input order.
+        Cached texts are served per text; the rest go out in one _embed_batch
+        call (one rate-limiter slot) when the provider has a batch endpoint.
+        """
+        if type(self)._embed_batch is LLMProvider._embed_batch:
+            return [self.embed_content(t) for t in texts]
+
+        results = [None] * len(texts)
+        cache = self.response_cache
+        keys = {}
+        for i, text in enumerate(texts):
+            if cache is not None:
+                keys[i] = cache.make_key(type(self).__name__, self.embedding_model_id, "embed_content",
+                                         self.cache_params(), (text,), {})
+                found, value = cache.lookup(keys[i])
+                if found:
+                    results[i] = value
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            with get_rate_limiter().slot():
+                vectors = self._embed_batch([texts[i] for i in missing])
+            for i, vec in zip(missing, vectors):
+                results[i] = vec or []
+                if cache is not None and vec:
+                    cache.put(keys[i], list(vec), "embed_content")
+        return [r if r is not None else [] for r in results]
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Provider batch endpoint. Default: none (embed_batch falls back to per-text calls)."""
+        raise NotImplementedError
+
+    # --- Streaming ---
+
+    def stream_completion(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """
+        completion() as a chunk iterator. Shares completion()'s cache entry: a
+        hit (or a provider without _stream_completion) yields the whole text
+        once; a streamed answer is cached when complete. Raises LLMStreamError
+        if the provider stream fails, even after some chunks were yielded.
+        """
+        if type(self)._stream_completion is LLMProvider._stream_completion:
+            yield self.completion(system_prompt, user_prompt)
+            return
+
+        cache = self.response_cache
+        if cache is not None:
+            key = cache.make_key(type(self).__name__, self.model_id, "completion", self.cache_params(),
+                                 (system_prompt, user_prompt), {})
+            found, value = cache.lookup(key)
+            if found:
+                yield value
+                return
+
+        chunks = []
+        try:
+            with get_rate_limiter().slot():
+                for chunk in self._stream_completion(system_prompt, user_prompt):
+                    if chunk:
+                        chunks.append(chunk)
+                        yield chunk
+        except Exception as e:
+            raise LLMStreamError(f"Error streaming from {type(self).__name__}: {e}", "".join(chunks)) from e
+        text = "".join(chunks)
+        if cache is not None and _text_ok(text):
+            cache.put(key, text, "completion")
+
+    def _stream_completion(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """Provider streaming endpoint; raise on failure. Default: none (stream_completion yields completion())."""
+        raise NotImplementedError
+
+    # --- Async interface ---
+
+    async def acompletion(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        return await asyncio.to_thread(self.completion, system_prompt, user_prompt, **kwargs)
+
+    async def ajson_completion(self, system_prompt: str, user_prompt: str, **kwargs) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.json_completion, system_prompt, user_prompt, **kwargs)
+
+    async def aembed(self, text: str, **kwargs) -> List[float]:
+        embed = getattr(self, "embed_content", None)
+        if embed is None:
+            raise NotImplementedError(f"{type(self).__name__} does not provide embeddings")
+        return await asyncio.to_thread(embed, text, **kwargs)
@@ -9,13 +9,19 @@ except ImportError:
 from .llm_provider import LLMProvider
 
 class OpenAIClient(LLMProvider):
+    temperature = 0.3
+
     def __init__(self, base_url: str, api_key: str, model: str):
         if OpenAI is None:
             raise ImportError("The 'openai' library is required. Run `pip install openai`.")
         
         self.client = OpenAI(base_url=base_url, api_key=api_key)
+        self.base_url = base_url
         self.model = model
 
+    def cache_params(self) -> Dict[str, Any]:
+        return {"base_url": self.base_url, "temperature": self.temperature}
+
     def completion(self, system_prompt: str, user_prompt: str) -> str:
         try:
             response = self.client.chat.completions.create(
@@ -24,7 +30,7 @@ class OpenAIClient(LLMProvider):
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=0.3
+                temperature=self.temperature
             )
             return response.choices[0].message.content
         except Exception as e:
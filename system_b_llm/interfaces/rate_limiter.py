@@ -0,0 +1,117 @@
+"""
+LLM Rate Limiter (WMCS v1.0)
+Shared token bucket + concurrency bound for outbound LLM calls.
+
+Every real (non-cached) provider call takes one slot: it waits for a token
+(requests-per-minute budget, with a burst allowance) and for one of the
+bounded concurrency permits. Works for plain threads and for async callers
+that offload provider calls with asyncio.to_thread.
+
+Settings (config.Config, each overridable from the environment):
+    LLM_RPM               requests per minute (default 120, 0 = unlimited)
+    LLM_BURST             bucket size (default 10)
+    LLM_MAX_CONCURRENCY   simultaneous in-flight calls (default 4)
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from config import Config
+
+
+class TokenBucket:
+    def __init__(self, rate_per_sec: float, capacity: float):
+        self.rate = rate_per_sec
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def try_acquire(self) -> float:
+        """Take a token if available. Returns 0.0 on success, else seconds to wait."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate
+
+    def acquire(self):
+        """Block until a token is available."""
+        if self.rate <= 0:
+            return
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+class RateLimiter:
+    def __init__(self, requests_per_minute: float = 120, burst: int = 10, max_concurrency: int = 4):
+        self.bucket = TokenBucket(requests_per_minute / 60.0, burst) if requests_per_minute > 0 else None
+        self.max_concurrency = max_concurrency
+        self._permits = threading.BoundedSemaphore(max_concurrency) if max_concurrency > 0 else None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.calls = 0
+        self.wait_time = 0.0
+
+    @contextmanager
+    def slot(self):
+        """Hold one rate-limited, concurrency-bounded call slot."""
+        start = time.monotonic()
+        if self._permits:
+            self._permits.acquire()
+        try:
+            if self.bucket:
+                self.bucket.acquire()
+            with self._lock:
+                self.in_flight += 1
+                self.calls += 1
+                self.wait_time += time.monotonic() - start
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+        finally:
+            if self._permits:
+                self._permits.release()
+
+    def get_stats(self):
+        return {
+            "calls": self.calls,
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            "total_wait_s": round(self.wait_time, 3)
+        }
+
+
+# Singleton
+_limiter = None
+_limiter_lock = threading.Lock()
+
+def _forget_after_fork():
+    # Fresh locks/bucket in a forked worker (configured from its own Config)
+    global _limiter, _limiter_lock
+    _limiter, _limiter_lock = None, threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_after_fork)
+
+def get_rate_limiter() -> RateLimiter:
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter(
+                requests_per_minute=Config.LLM_RPM,
+                burst=Config.LLM_BURST,
+                max_concurrency=Config.LLM_MAX_CONCURRENCY
+            )
+        return _limiter
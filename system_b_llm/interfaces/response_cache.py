@@ -0,0 +1,169 @@
+"""
+LLM Response Cache (WMCS v1.0)
+Content-addressed, on-disk (SQLite) cache for LLM provider calls.
+
+Key = sha256 of (provider, model, method, params, system prompt, user prompt).
+Entries expire after a TTL and the least recently used ones are evicted when
+the cache grows past its size budget.
+
+Settings (config.Config, each overridable from the environment):
+    LLM_CACHE_ENABLED      shared cache on/off (LLM_CACHE=0 disables it)
+    LLM_CACHE_PATH         database file (default data/llm_cache.sqlite)
+    LLM_CACHE_TTL          seconds an entry stays valid (default 7 days)
+    LLM_CACHE_MAX_MB       size budget before LRU eviction (default 256)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from config import Config
+
+
+class ResponseCache:
+    def __init__(self, path: str = "data/llm_cache.sqlite", ttl: float = 7 * 24 * 3600,
+                 max_bytes: int = 256 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, method TEXT, value TEXT,"
+            " created REAL, accessed REAL, size INTEGER)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses(accessed)")
+        self._db.commit()
+        self._bytes = self._total_bytes()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Stable content hash of the call description."""
+        blob = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _total_bytes(self) -> int:
+        row = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return int(row[0])
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """(found, value). Expired entries count as misses and are dropped."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+            if self.ttl and now - row[1] > self.ttl:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                self.misses += 1
+                return False, None
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self.hits += 1
+        return True, json.loads(row[0])
+
+    def put(self, key: str, value: Any, method: str = ""):
+        data = json.dumps(value, ensure_ascii=False)
+        size = len(data.encode("utf-8")) + len(key)
+        now = time.time()
+        with self._lock:
+            old = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, method, value, created, accessed, size) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, method, data, now, now, size)
+            )
+            self._bytes += size - (old[0] if old else 0)
+            self.stores += 1
+            if self.max_bytes and self._bytes > self.max_bytes:
+                self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        """Drop expired entries, then least recently used ones down to 90% of the budget."""
+        if self.ttl:
+            cur = self._db.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl,))
+            self.evictions += cur.rowcount
+        self._bytes = self._total_bytes()  # Other processes may share the file
+
+        target = int(self.max_bytes * 0.9)
+        if self._bytes <= target:
+            return
+        freed = 0
+        doomed = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed ASC"):
+            doomed.append((key,))
+            freed += size
+            if self._bytes - freed <= target:
+                break
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self._bytes -= freed
+        self.evictions += len(doomed)
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+# Singleton
+_cache = None
+_cache_lock = threading.Lock()
+
+def _forget_after_fork():
+    # The SQLite connection must not be shared with a forked worker; it reopens its own
+    global _cache, _cache_lock
+    _cache, _cache_lock = None, threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_after_fork)
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Shared cache configured from Config (None if disabled or unusable)."""
+    global _cache
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = ResponseCache(
+                    path=Config.LLM_CACHE_PATH,
+                    ttl=Config.LLM_CACHE_TTL,
+                    max_bytes=int(Config.LLM_CACHE_MAX_MB * 1024 * 1024)
+                )
+            except (sqlite3.Error, OSError, ValueError) as e:
+                print(f"[ResponseCache] Disabled: {e}")
+                _cache = False
+        return _cache or None
@@ -0,0 +1,136 @@
+"""Test the Aho-Corasick matcher, the shared concept-mention detector and the indexed EpistemicGate lookup"""
+import os
+import json
+import tempfile
+
+from system_a_cognitive.logic.aho_corasick import AhoCorasick
+from system_a_cognitive.logic.concept_mentions import ConceptMentionDetector, get_mention_detector
+from system_a_cognitive.logic.identity import IdentityManager
+from system_a_cognitive.logic.relation_builder import RelationBuilder
+
+
+def test_matcher():
+    print("=== TEST 1: Multi-pattern matching ===")
+    ac = AhoCorasick(["he", "she", "his", "hers"])
+    found = sorted(ac.finditer("ushers"))
+    assert found == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+    ac.add("us")  # Added after a search: picked up on the next one
+    assert ac.findall("ushers") == ["us", "she", "he", "hers"]
+    assert not ac.add("us") and len(ac) == 5
+    print("✅ Overlapping matches and late adds")
+
+
+def test_word_boundary():
+    print("\n=== TEST 2: Word boundaries ===")
+    ac = AhoCorasick(["sun", "solar wind"], word_boundary=True)
+    assert ac.findall("sunday sun") == ["sun"]
+    assert [m[0] for m in ac.finditer("sunday sun")] == [7]
+    assert ac.findall("the solar wind.") == ["solar wind"]
+    assert ac.findall("solar windy") == []
+    print("✅ Embedded matches rejected")
+
+
+def test_gate_index():
+    print("\n=== TEST 3: EpistemicGate inverted index ===")
+    from system_a_cognitive.epistemic_gate import EpistemicGate
+    gate = EpistemicGate()
+
+    assert gate.verify_claim("Zzqx blorps")["reason"] == "No recognized concepts mentioned"
+    name, claims = next((n, c) for n, c in gate._known_claims.items() if c)
+    claim = sorted(claims)[0]
+    if name not in claim:
+        claim = f"{name} {claim}"
+    result = gate.verify_claim(claim)
+    assert result["verified"] and result["confidence"] == 0.9
+    print(f"✅ Known claim verified via index ({len(gate._postings)} tokens indexed)")
+
+
+def test_mention_detector():
+    print("\n=== TEST 4: Concept mentions, aliases and minting ===")
+    det = ConceptMentionDetector(["black_hole", "sun", "ox"])
+    assert det.find("A Black Hole ate the Sun on sunday") == ["black_hole", "sun"]
+    assert det.find("the ox") == []  # Below min_length
+    assert det.find_known("black hole near sun", {"black hole"}) == ["black hole"]
+    assert det.find("sun and black_hole", exclude={"sun"}) == ["black_hole"]
+
+    with tempfile.TemporaryDirectory() as d:
+        registry = os.path.join(d, "registry.json")
+        with open(registry, 'w') as f:
+            json.dump({"earth": {"group": 20, "item": 1}}, f)
+        im = IdentityManager(registry)
+        rb = RelationBuilder(im)
+        assert rb.find_mentioned_concepts("earth and moon") == ["earth"]
+
+        im.mint_id("Moon", 20)
+        assert rb.find_mentioned_concepts("earth and moon") == ["earth", "moon"]
+        assert rb.get_id_str("moon") == "(20, 2)"
+        for i in range(100):
+            im.mint_id(f"Comet {i}", 25)
+        shared = get_mention_detector(registry)
+        assert shared is rb.mentions and shared.merges >= 1
+        assert rb.find_mentioned_concepts("comet 99 passed comet_7") == ["comet 99", "comet 7"]
+    print("✅ Minted names detected without a full rebuild")
+
+
+def test_gate_graph_names():
+    print("\n=== TEST 5: EpistemicGate recognizes graph-only and short concepts ===")
+    import system_a_cognitive.logic.graph_engine as graph_engine
+    from system_a_cognitive.epistemic_gate import EpistemicGate
+
+    with tempfile.TemporaryDirectory() as d:
+        concepts = os.path.join(d, "concepts")
+        os.makedirs(concepts)
+        for fname, name, definition in [("io.json", "io", "a moon of jupiter"),
+                                        ("glimmerite.json", "glimmerite", "a crystal that glows in the dark")]:
+            with open(os.path.join(concepts, fname), 'w') as f:
+                json.dump({"CORE": {"name": name, "definition": definition}}, f)
+
+        previous = graph_engine._engine
+        graph_engine._engine = graph_engine.GraphEngine(concepts)  # Neither name is in any registry
+        try:
+            gate = EpistemicGate()
+        finally:
+            graph_engine._engine = previous
+
+        assert gate.verify_claim("Io is a moon of Jupiter")["source"] == "io"
+        assert gate.verify_claim("Glimmerite is a crystal that glows in the dark")["verified"]
+        unknown = gate.verify_claim("Glimmerite is made of cheese")
+        assert unknown["reason"] != "No recognized concepts mentioned" and unknown["confidence"] < 0.9
+        assert gate.verify_claim("The ratio of ions")["reason"] == "No recognized concepts mentioned"
+    print("✅ Claims about unregistered and 2-letter concepts are still checked")
+
+
+def test_loop_graph_names():
+    print("\n=== TEST 6: CognitiveLoop retrieves graph-only and short concepts ===")
+    import system_a_cognitive.logic.graph_engine as graph_engine
+    from system_a_cognitive.cognitive_loop import CognitiveLoop
+
+    with tempfile.TemporaryDirectory() as d:
+        concepts = os.path.join(d, "concepts")
+        os.makedirs(concepts)
+        for name in ["io", "glimmerite"]:
+            with open(os.path.join(concepts, f"{name}.json"), 'w') as f:
+                json.dump({"CORE": {"name": name, "definition": "unregistered"}}, f)
+
+        previous = graph_engine._engine
+        graph_engine._engine = graph_engine.GraphEngine(concepts)
+        try:
+            loop = CognitiveLoop(auto_research=False)
+        finally:
+            graph_engine._engine = previous
+
+        assert sorted(loop._retrieve("Is glimmerite found on Io?", {})) == ["glimmerite", "io"]
+        assert loop._retrieve_for_gap("What orbits io?", {}) == ["io"]
+        assert loop._retrieve("The ratio of ions", {}) == []
+    print("✅ Same graph-backed names as the EpistemicGate")
+
+
+if __name__ == "__main__":
+    test_matcher()
+    test_word_boundary()
+    test_gate_index()
+    test_mention_detector()
+    test_gate_graph_names()
+    test_loop_graph_names()
+    print("\n=== ALL TESTS PASSED ===")
@@ -0,0 +1,113 @@
+"""Test the versioned answer cache and single-flight query coalescing"""
+import os
+import time
+import tempfile
+import threading
+
+from system_a_cognitive.memory.answer_cache import AnswerCache, SingleFlight, normalize_query
+from system_a_cognitive.memory.corpus_version import CorpusVersion, get_corpus_version
+from system_a_cognitive.memory.concept_corpus import ConceptCorpus
+
+
+def test_cache_and_version():
+    print("=== TEST 1: Normalization, LRU and corpus version bumps ===")
+    assert normalize_query("  What is   a ZORB?? ") == "what is a zorb"
+    cache = AnswerCache(max_entries=2)
+    for q in "abc":
+        cache.put((1, q, True), {"text": q})
+    assert cache.get((1, "a", True)) is None and cache.get((1, "c", True))["text"] == "c"
+    assert cache.get_stats()["hit_rate"] == 0.5
+
+    with tempfile.TemporaryDirectory() as root:
+        d = os.path.join(root, "concepts")
+        os.makedirs(d)
+        version = get_corpus_version(d)
+        assert version.current() == 0
+        corpus = ConceptCorpus(d)
+        corpus.save("zorb.json", {"name": "Zorb"})  # Gardener/auditor path
+        corpus.update("grue.json", {"name": "Grue"})  # Ingestor path
+        assert version.current() == 2 and CorpusVersion(version.path).current() == 2
+        with open(version.path, "wb"):
+            pass  # Caught mid-bump
+        assert version.current() is None
+    print("✅ Every corpus write bumps the shared version")
+
+
+def test_single_flight():
+    print("\n=== TEST 2: Identical concurrent calls run once ===")
+    flight = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"text": "answer"}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("q", slow))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1 and len(results) == 8 and flight.coalesced == 7 and flight.in_flight() == 0
+
+    def boom():
+        raise ValueError("LLM down")
+    try:
+        flight.do("q", boom)
+        assert False
+    except ValueError:
+        pass
+    print("✅ 8 requests, 1 pipeline run")
+
+
+def test_kernel_answers():
+    print("\n=== TEST 3: Kernel.answer_query hits until the corpus changes ===")
+    from test_query_stages import _kernel
+    with tempfile.TemporaryDirectory() as root:
+        kernel = _kernel()
+        kernel.corpus_version = CorpusVersion(os.path.join(root, "corpus_version"))
+        zorb = {"name": "Zorb", "id": {"group": 9, "item": 1}, "definition": "A floating pink orb.", "claims": []}
+        kernel.get_block = lambda key: dict(zorb)
+        kernel.block_exists = lambda key: key == "zorb"
+        kernel.lexical_index.search = lambda text, top_k=3, require_name=False: [("zorb.json", 1.0)]
+
+        first = kernel.answer_query("What is a Zorb?", allow_research=False)
+        start = time.perf_counter()
+        second = kernel.answer_query("what is a zorb", allow_research=False)
+        hit_us = (time.perf_counter() - start) * 1e6
+        assert second["cached"] and second["text"] == first["text"] and len(kernel.llm_client.prompts) == 1
+
+        kernel.corpus_version.bump()  # Something was learned
+        assert "cached" not in kernel.answer_query("What is a Zorb?", allow_research=False)
+        assert len(kernel.llm_client.prompts) == 2
+        print(f"✅ Hit served in {hit_us:.0f} µs, recomputed after a corpus write")
+
+
+def test_degraded_answers():
+    print("\n=== TEST 4: Inconclusive or failed answers are never cached ===")
+    from test_query_stages import _kernel
+    zorb = {"name": "Zorb", "id": {"group": 9, "item": 1}, "definition": "A floating pink orb.", "claims": []}
+    with tempfile.TemporaryDirectory() as root:
+        for trace, why in [("| 4. Conclusion: Unclear.\n| 5. CONFIDENCE_SCORE: 10", "CANNOT_CONCLUDE"),
+                           ("Error connecting to LLM: 503 Service Unavailable", "LLM error")]:
+            kernel = _kernel()
+            kernel.corpus_version = CorpusVersion(os.path.join(root, why))
+            kernel.llm_client.completion = lambda system_prompt, prompt, trace=trace: trace
+            kernel.get_block = lambda key: dict(zorb)
+            kernel.block_exists = lambda key: key == "zorb"
+            kernel.lexical_index.search = lambda text, top_k=3, require_name=False: [("zorb.json", 1.0)]
+
+            first = kernel.answer_query("What is a Zorb?", allow_research=False)
+            second = kernel.answer_query("What is a Zorb?", allow_research=False)
+            assert "cached" not in second and kernel.answer_cache.get_stats()["entries"] == 0, why
+            assert first["grade"] == "CANNOT_CONCLUDE" or first["degraded"]
+    print("✅ CANNOT_CONCLUDE and LLM-error answers recomputed on every ask")
+
+
+if __name__ == "__main__":
+    test_cache_and_version()
+    test_single_flight()
+    test_kernel_answers()
+    test_degraded_answers()
+    print("\n=== ALL TESTS PASSED ===")
@@ -0,0 +1,96 @@
+"""Test async provider calls, the shared rate limiter and parallel deep research"""
+import asyncio
+import time
+import threading
+
+from system_b_llm.interfaces.llm_provider import LLMProvider
+from system_b_llm.interfaces.rate_limiter import RateLimiter, TokenBucket
+import system_b_llm.interfaces.rate_limiter as rate_limiter
+
+
+class SlowProvider(LLMProvider):
+    """Offline provider: each call sleeps, tracking peak concurrency."""
+
+    def __init__(self, delay=0.1):
+        self.model_name = "slow"
+        self.delay = delay
+        self.response_cache = None
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def completion(self, system_prompt, user_prompt):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return f"answer to {user_prompt}"
+
+    def json_completion(self, system_prompt, user_prompt):
+        return {"text": self.completion(system_prompt, user_prompt)}
+
+
+def test_token_bucket():
+    print("=== TEST 1: Token bucket ===")
+    bucket = TokenBucket(rate_per_sec=20, capacity=2)
+    start = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+    assert 0.08 <= elapsed < 0.5, elapsed  # 2 burst + 2 refills at 20/s
+    print(f"✅ 4 tokens in {elapsed:.2f}s")
+
+
+def test_bounded_concurrency():
+    print("\n=== TEST 2: Async calls with bounded concurrency ===")
+    old = rate_limiter._limiter
+    rate_limiter._limiter = RateLimiter(requests_per_minute=0, max_concurrency=3)
+    try:
+        llm = SlowProvider(delay=0.1)
+
+        async def run():
+            return await asyncio.gather(*(llm.acompletion("sys", f"q{i}") for i in range(6)))
+
+        start = time.monotonic()
+        answers = asyncio.run(run())
+        elapsed = time.monotonic() - start
+        assert answers == [f"answer to q{i}" for i in range(6)]
+        assert llm.peak == 3
+        assert elapsed < 0.45, elapsed  # Two waves of 3, not 6 serial calls
+        assert asyncio.run(llm.ajson_completion("s", "x")) == {"text": "answer to x"}
+        print(f"✅ 6 calls in {elapsed:.2f}s, peak concurrency {llm.peak}")
+    finally:
+        rate_limiter._limiter = old
+
+
+def test_parallel_research():
+    print("\n=== TEST 3: Deep research branches run in parallel ===")
+    from system_a_cognitive.meta.deep_researcher import DeepResearchAgent
+
+    class FakeIngestor:
+        async def aingest_text(self, content, source_name="interactive"):
+            await asyncio.sleep(0.1)
+            return [content.split()[-1]]
+
+    agent = DeepResearchAgent.__new__(DeepResearchAgent)
+    agent.client = SlowProvider(delay=0.1)
+    agent.ingestor = FakeIngestor()
+    agent.max_parallel_branches = 3
+    agent._formulate_hypothesis = lambda topic: ["alpha", "beta", "gamma"]
+    agent._search_real = lambda topic: f"notes on {topic}"
+
+    start = time.monotonic()
+    learned = agent.conduct_deep_research("engines", max_depth=0)
+    elapsed = time.monotonic() - start
+    assert learned == ["alpha", "beta", "gamma"]
+    assert elapsed < 0.25, elapsed  # ~ one branch, not three
+    print(f"✅ 3 branches in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    test_token_bucket()
+    test_bounded_concurrency()
+    test_parallel_research()
+    print("\n=== ALL TESTS PASSED ===")
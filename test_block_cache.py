@@ -0,0 +1,67 @@
+"""Test the Kernel's bounded LRU block cache"""
+import os
+import json
+import tempfile
+
+from system_a_cognitive.memory.block_cache import BlockCache, block_nbytes
+from system_a_cognitive.memory.concept_corpus import ConceptCorpus
+
+
+def test_lru_bounds():
+    print("=== TEST 1: Count and byte bounds, LRU order ===")
+    cache = BlockCache(max_items=3, max_bytes=None)
+    for key in "abcd":
+        cache[key] = {"name": key}
+    assert cache.keys() == ["b", "c", "d"] and cache.evictions == 1
+
+    assert cache.get("b")["name"] == "b"  # b becomes most recent
+    cache.put("e", {"name": "e"})
+    assert "c" not in cache and "b" in cache
+    assert cache.get("zzz") is None
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["items"]) == (1, 1, 2, 3)
+
+    sized = BlockCache(max_items=None, max_bytes=250)
+    for i in range(5):
+        sized.put(f"k{i}", {"i": i}, nbytes=100)
+    assert len(sized) == 2 and sized.bytes == 200 and sized.keys() == ["k3", "k4"]
+    assert block_nbytes({"a": 1}) == len('{"a":1}')
+    print(f"✅ {stats}")
+
+
+def test_pinning():
+    print("\n=== TEST 2: Pinned keys are never evicted ===")
+    cache = BlockCache(max_items=2, max_bytes=None)
+    cache.pin("sun")
+    cache["sun"] = {"name": "Sun"}
+    for i in range(10):
+        cache[f"x{i}"] = {"i": i}
+    assert "sun" in cache and len(cache) == 2
+    cache.unpin("sun")
+    cache["y"] = {}
+    assert "sun" not in cache
+    del cache["y"]
+    assert len(cache) == 1 and cache.get_stats()["pinned"] == 0
+    print("✅ Pin survives 10 inserts into a 2-entry cache")
+
+
+def test_uncached_read():
+    print("\n=== TEST 3: Corpus read() does not grow the shared cache ===")
+    with tempfile.TemporaryDirectory() as d:
+        for i in range(5):
+            with open(os.path.join(d, f"c{i}.json"), 'w') as f:
+                json.dump({"name": f"C{i}"}, f)
+        corpus = ConceptCorpus(d)
+        assert [corpus.read(f"c{i}.json")["name"] for i in range(5)] == [f"C{i}" for i in range(5)]
+        assert corpus.get_stats()["cached"] == 0
+        cached = corpus.get("c1.json")
+        assert corpus.read("c1.json") is cached  # Served from the cache once present
+        assert corpus.read("missing.json") is None
+    print("✅ Lazy reads leave memory to the bounded cache")
+
+
+if __name__ == "__main__":
+    test_lru_bounds()
+    test_pinning()
+    test_uncached_read()
+    print("\n=== ALL TESTS PASSED ===")
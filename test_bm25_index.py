@@ -0,0 +1,109 @@
+"""Test the lexical (BM25) concept index and rank fusion"""
+import os
+import json
+import time
+import tempfile
+
+from system_a_cognitive.memory.bm25_index import BM25Index, reciprocal_rank_fusion, tokenize
+from system_a_cognitive.memory.concept_corpus import concept_filename, get_concept_corpus
+
+
+def _write(d, fname, block):
+    with open(os.path.join(d, fname), 'w') as f:
+        json.dump(block, f)
+
+
+def _corpus(d):
+    _write(d, "zorkmid.json", {"CORE": {"name": "Zorkmid", "definition": "A currency unit of the Great Underground Empire."}})
+    _write(d, "currency.json", {"name": "Currency", "aliases": ["Money"],
+                                "claims": [{"predicate": "USED_FOR", "object": "trade"}]})
+    _write(d, "gold_coin.json", {"CORE": {"name": "Gold Coin", "definition": "Currency made of gold."}})
+    _write(d, "quantum_mechanics.json", {"CORE": {"name": "Quantum Mechanics", "definition": "Physics of small scales."}})
+
+
+def test_search():
+    print("=== TEST 1: BM25 ranking and name-match entry points ===")
+    with tempfile.TemporaryDirectory() as root:
+        d = os.path.join(root, "concepts")
+        os.makedirs(d)
+        _corpus(d)
+        index = BM25Index(d, os.path.join(root, "bm25_index.json"))
+        assert index.build() == 4
+        assert get_concept_corpus(d).get_stats()["cached"] == 0  # Cold build keeps no blocks resident
+
+        assert tokenize("What is a Zorkmid?") == ["zorkmid"]
+        assert index.search("What is a Zorkmid?")[0][0] == "zorkmid.json"
+        ranked = [f for f, _ in index.search("currency")]
+        assert ranked[0] == "currency.json" and set(ranked) == {"currency.json", "gold_coin.json", "zorkmid.json"}
+
+        # Entry points: the whole name (or an alias) must be in the query
+        assert [f for f, _ in index.search("where does money come from", require_name=True)] == ["currency.json"]
+        assert index.search("quantum flurbonator", require_name=True) == []
+        assert [f for f, _ in index.search("quantum mechanics basics", require_name=True)] == ["quantum_mechanics.json"]
+
+        # Names without any indexable term fall back to a word-for-word match
+        _write(d, "the_who.json", {"name": "The Who", "definition": "A rock band."})
+        index.add("the_who.json", {"name": "The Who", "definition": "A rock band."})
+        assert [f for f, _ in index.search("Who are The Who?", require_name=True)] == ["the_who.json"]
+        assert index.search("who is the drummer", require_name=True) == []
+        print("✅ Exact names found, partial word overlap is not an entry point")
+
+
+def test_incremental():
+    print("\n=== TEST 2: Incremental build and hot add ===")
+    with tempfile.TemporaryDirectory() as root:
+        d = os.path.join(root, "concepts")
+        os.makedirs(d)
+        _corpus(d)
+        path = os.path.join(root, "bm25_index.json")
+        BM25Index(d, path).build()
+
+        time.sleep(0.01)
+        _write(d, "gold_coin.json", {"name": "Silver Coin"})
+        os.remove(os.path.join(d, "quantum_mechanics.json"))
+        index = BM25Index(d, path)
+        assert index.build() == 1  # Only the edited file is re-tokenized
+        assert len(index) == 3 and index.search("quantum") == []
+        assert index.search("silver coin", require_name=True)[0][0] == "gold_coin.json"
+
+        _write(d, "grue.json", {"name": "Grue"})
+        index.add("grue.json", {"name": "Grue"})
+        assert index.search("is a grue dangerous?")[0][0] == "grue.json"
+        index.remove("grue.json")
+        assert index.search("grue") == [] and "grue" not in index.postings
+        print("✅ Sidecar reused, edits and deletions picked up")
+
+
+def test_fusion():
+    print("\n=== TEST 3: Reciprocal rank fusion ===")
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]], k=60)
+    assert [k for k, _ in fused][:1] == ["c"]  # In both lists
+    assert [k for k, _ in reciprocal_rank_fusion([["a"], []], top_k=1)] == ["a"]
+    print("✅ Keys ranked by summed 1/(k + rank)")
+
+
+def test_hybrid_keys():
+    print("\n=== TEST 4: Vector and BM25 hits share one key ===")
+    from main import WMCS_Kernel
+
+    class Ids:
+        def resolve(self, cid):
+            return {"7,1": "ac-dc_converter.json"}.get(cid)
+
+    kernel = WMCS_Kernel()
+    kernel.id_index = Ids()
+    lexical = concept_filename("AC/DC Converter")[:-len(".json")]
+    assert lexical == "ac-dc_converter"
+    assert kernel._hit_key({"id": {"group": 7, "item": 1}, "metadata": {"name": "AC/DC Converter"}}) == lexical
+    assert kernel._hit_key({"id": "9,9", "metadata": {"name": "AC/DC Converter"}}) == lexical  # Unindexed: by name
+    fused = reciprocal_rank_fusion([[lexical], [lexical]])
+    assert len(fused) == 1
+    print("✅ Names with unsafe filename characters fuse across both rankings")
+
+
+if __name__ == "__main__":
+    test_search()
+    test_incremental()
+    test_fusion()
+    test_hybrid_keys()
+    print("\n=== ALL TESTS PASSED ===")
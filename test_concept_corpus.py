@@ -0,0 +1,106 @@
+"""Test the shared ConceptCorpus (single-pass concept loader)"""
+import os
+import json
+import tempfile
+
+from system_a_cognitive.memory.concept_corpus import ConceptCorpus, get_concept_corpus
+
+
+def _write(d, fname, data):
+    with open(os.path.join(d, fname), 'w', encoding='utf-8') as f:
+        if isinstance(data, str):
+            f.write(data)
+        else:
+            json.dump(data, f)
+
+
+def test_single_parse():
+    print("=== TEST 1: Each file parsed once ===")
+    with tempfile.TemporaryDirectory() as d:
+        _write(d, "cat.json", {"name": "Cat", "id": {"group": 21, "item": 1}})
+        _write(d, "dog.json", {"name": "Dog", "id": {"group": 21, "item": 2}})
+        _write(d, "broken.json", "{not json")
+        _write(d, "notes.txt", "ignored")
+
+        corpus = ConceptCorpus(d)
+        assert corpus.get("cat.json")["name"] == "Cat"
+        assert corpus.parse_count == 1
+
+        names = sorted(b["name"] for b in corpus.blocks())
+        assert names == ["Cat", "Dog"]
+        assert "broken.json" in corpus.errors
+        assert corpus.parse_count == 2  # cat was already cached
+
+        list(corpus.items())
+        assert corpus.parse_count == 2
+        print(f"✅ Stats: {corpus.get_stats()}")
+
+
+def test_writes_and_refresh():
+    print("\n=== TEST 2: Write-through and refresh ===")
+    with tempfile.TemporaryDirectory() as d:
+        _write(d, "cat.json", {"name": "Cat"})
+        corpus = ConceptCorpus(d)
+        corpus.load()
+
+        block = corpus.get_for_update("cat.json")
+        block["type"] = "LIVING_SYSTEM"
+        corpus.save("cat.json", block)
+        with open(os.path.join(d, "cat.json"), encoding='utf-8') as f:
+            assert json.load(f)["type"] == "LIVING_SYSTEM"
+
+        _write(d, "fish.json", {"name": "Fish"})
+        os.remove(os.path.join(d, "cat.json"))
+        assert corpus.refresh() == 1
+        assert corpus.find_by_name("Fish")[0] == "fish.json"
+        assert corpus.get("cat.json") is None
+        print("✅ Save, refresh and deletion tracked")
+
+
+def test_read_modify_write():
+    print("\n=== TEST 3: Read-modify-write uses a fresh private copy ===")
+    with tempfile.TemporaryDirectory() as d:
+        _write(d, "cat.json", {"name": "Cat", "claims": []})
+        corpus = ConceptCorpus(d)
+        cached = corpus.get("cat.json")
+
+        # Another process adds a claim behind this corpus's back
+        _write(d, "cat.json", {"name": "Cat", "claims": ["purrs"]})
+        os.utime(os.path.join(d, "cat.json"), (0, os.path.getmtime(os.path.join(d, "cat.json")) + 5))
+        block = corpus.get_for_update("cat.json")
+        assert block["claims"] == ["purrs"]  # Not the stale cached copy
+
+        block["claims"].append("meows")
+        assert corpus.get("cat.json")["claims"] == ["purrs"]  # Cache untouched until save
+        assert cached["claims"] == []
+
+        block["bad"] = object()  # Not serializable: the write fails
+        try:
+            corpus.save("cat.json", block)
+            assert False, "save should fail"
+        except TypeError:
+            pass
+        with open(os.path.join(d, "cat.json"), encoding='utf-8') as f:
+            assert json.load(f)["claims"] == ["purrs"]  # Disk unchanged, no partial file
+        assert sorted(os.listdir(d)) == ["cat.json"]
+        assert corpus.get("cat.json")["claims"] == ["purrs"] and "bad" not in corpus.get("cat.json")
+
+        del block["bad"]
+        corpus.save("cat.json", block)
+        assert corpus.get("cat.json")["claims"] == ["purrs", "meows"]
+        print("✅ Other writers' edits kept; failed writes leave cache and disk alone")
+
+
+def test_registry():
+    print("\n=== TEST 4: One corpus per directory ===")
+    with tempfile.TemporaryDirectory() as d:
+        assert get_concept_corpus(d) is get_concept_corpus(os.path.join(d, "."))
+        print("✅ Shared instance")
+
+
+if __name__ == "__main__":
+    test_single_parse()
+    test_writes_and_refresh()
+    test_read_modify_write()
+    test_registry()
+    print("\n=== ALL TESTS PASSED ===")
@@ -0,0 +1,46 @@
+"""Test the token-budgeted logic-engine context packer"""
+import json
+
+from system_a_cognitive.logic.context_packer import ContextPacker, estimate_tokens
+
+
+def _claim(predicate, obj, conf=1.0):
+    return {"predicate": predicate, "object": obj, "epistemic": {"confidence": conf}}
+
+
+def _merged_block(n_claims):
+    """A concept that has been merged many times: duplicate and off-topic claims."""
+    claims = [_claim("COLOR", "pink")] * 5 + [_claim("FLOATS_IN", "air", 0.9), _claim("FLOATS_IN", "Air ", 0.6)]
+    claims += [_claim("TRIVIA", f"unrelated fact number {i} about paperwork") for i in range(n_claims)]
+    return {"name": "Zorb", "id": {"group": 9, "item": 1}, "definition": "A floating pink orb.",
+            "claims": claims, "facets": {"habitat": "Skylands"}, "_computed_confidence": 0.9}
+
+
+def test_dedupe_and_rank():
+    print("=== TEST 1: Duplicates collapse, relevant claims first ===")
+    packed = ContextPacker(max_tokens=10_000).pack([_merged_block(3)], "What color is a Zorb?")
+    lines = packed["blocks"][0].split("\n")
+    assert lines[0] == "Concept: Zorb (ID: 9,1, Conf: 0.90) - A floating pink orb."
+    assert lines[1] == " - COLOR: pink"
+    assert sum("FLOATS_IN" in l for l in lines) == 1 and " - FLOATS_IN: air" in lines  # Best confidence kept
+    assert packed["kept"] == 6 and packed["dropped"] == 0  # 1 color, 1 floats, 3 trivia, 1 facet
+    print(f"✅ {len(lines) - 1} lines from 11 raw items")
+
+
+def test_budget():
+    print("\n=== TEST 2: Budget bounds the prompt, headers first ===")
+    blocks = [_merged_block(500), {"CORE": {"name": "Skylands", "id": {"group": 9, "item": 2},
+                                            "definition": "Floating islands."}, "_computed_confidence": 0.5}]
+    raw = estimate_tokens(json.dumps(blocks))
+    packed = ContextPacker(max_tokens=200).pack(blocks, "Does a Zorb float in air?")
+    text = "\n".join(packed["blocks"])
+    assert packed["tokens"] <= 200 and estimate_tokens(text) <= 200
+    assert packed["concepts"] == 2 and "Concept: Skylands (ID: 9,2, Conf: 0.50)" in packed["blocks"][1]
+    assert "FLOATS_IN: air" in packed["blocks"][0] and packed["dropped"] > 400
+    print(f"✅ ~{raw} raw tokens packed into {packed['tokens']}")
+
+
+if __name__ == "__main__":
+    test_dedupe_and_rank()
+    test_budget()
+    print("\n=== ALL TESTS PASSED ===")
@@ -0,0 +1,99 @@
+"""Test the shared query-embedding LRU"""
+import threading
+import time
+
+from system_a_cognitive.memory.embedding_cache import EmbeddingCache
+
+
+class CountingEF:
+    """Stand-in embedding function: records every forward pass."""
+
+    def __init__(self, model_name="mini"):
+        self.model_name = model_name
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), float(sum(map(ord, t)) % 97)] for t in texts]
+
+
+def test_shared_lru():
+    print("=== TEST 1: One forward pass per distinct text ===")
+    cache = EmbeddingCache(max_entries=3)
+    ef = CountingEF()
+
+    # Concept search and strategy recall for the same user text
+    first = cache.embed_one(ef, "why do magnets attract")
+    second = cache.embed_one(ef, "why do magnets attract")
+    assert first == second and len(ef.calls) == 1
+
+    # Batch: only the misses are embedded, in one call, duplicates once
+    out = cache.embed(ef, ["a", "why do magnets attract", "bb", "a"])
+    assert ef.calls[-1] == ["a", "bb"] and len(ef.calls) == 2
+    assert out[0] == out[3] and out[1] == first
+    print(f"✅ {cache.get_stats()}")
+
+
+def test_bounds_and_models():
+    print("\n=== TEST 2: Bounded, keyed by model ===")
+    cache = EmbeddingCache(max_entries=2)
+    ef = CountingEF()
+    cache.embed(ef, ["x", "y"])
+    cache.embed_one(ef, "x")  # Refresh x: y is now least recent
+    cache.embed_one(ef, "z")  # Evicts y
+    assert cache.get_stats()["entries"] == 2
+    calls = len(ef.calls)
+    cache.embed_one(ef, "x")
+    assert len(ef.calls) == calls
+    cache.embed_one(ef, "y")
+    assert len(ef.calls) == calls + 1
+
+    other = CountingEF(model_name="large")
+    cache.embed_one(other, "y")  # Same text, different model: not shared
+    assert len(other.calls) == 1
+    print("✅ LRU eviction and per-model keys")
+
+
+def test_concurrent_same_text():
+    print("\n=== TEST 3: Concurrent misses for one text share a forward pass ===")
+    cache = EmbeddingCache()
+
+    class SlowEF(CountingEF):
+        def __call__(self, texts):
+            time.sleep(0.2)
+            return super().__call__(texts)
+
+    ef = SlowEF()
+    results = []
+    # Concept search and strategy recall embed the same cold query in parallel
+    threads = [threading.Thread(target=lambda: results.append(cache.embed_one(ef, "why is the sky blue")))
+               for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(ef.calls) == 1 and len(results) == 4 and all(r == results[0] for r in results)
+    assert cache.get_stats()["coalesced"] == 3
+
+    class FlakyEF(CountingEF):
+        def __call__(self, texts):
+            if not self.calls:
+                self.calls.append(None)
+                raise RuntimeError("model not loaded")
+            return super().__call__(texts)
+
+    flaky = FlakyEF()
+    try:
+        cache.embed_one(flaky, "x")
+        assert False, "embedding error must propagate"
+    except RuntimeError:
+        pass
+    assert cache.embed_one(flaky, "x")  # Nothing left in flight after a failure
+    print(f"✅ 4 threads, 1 forward pass: {cache.get_stats()}")
+
+
+if __name__ == "__main__":
+    test_shared_lru()
+    test_bounds_and_models()
+    test_concurrent_same_text()
+    print("\n=== ALL TESTS PASSED ===")
@@ -0,0 +1,145 @@
+"""Test the compiled (CSR + mmap) GraphEngine snapshot"""
+import os
+import json
+import time
+import tempfile
+
+from system_a_cognitive.logic.graph_engine import GraphEngine
+from system_a_cognitive.logic.graph_snapshot import CompiledGraph
+
+
+def _concept(d, name, requires=(), produces=(), relational=()):
+    data = {
+        "CORE": {"name": name},
+        "CAUSATION": {"requires": list(requires), "produces": list(produces)},
+        "CONNECTIONS": {"relational": [{"relation": r, "target": t} for r, t in relational]}
+    }
+    with open(os.path.join(d, f"{name.lower()}.json"), 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def test_compile_and_mmap_reload():
+    print("=== TEST 1: Compile, save, mmap reload ===")
+    with tempfile.TemporaryDirectory() as root:
+        d = os.path.join(root, "concepts")
+        os.makedirs(d)
+        _concept(d, "Sun", produces=["Light", "Heat"])
+        _concept(d, "Light", produces=["Photosynthesis"], relational=[("related_to", "Sun")])
+        _concept(d, "Plant", requires=["Light", "Water"])
+
+        g = GraphEngine(d)
+        assert os.path.exists(os.path.join(root, "concepts_graph", "meta.json"))
+        assert g.get_implications("sun", depth=2) == ["light", "heat", "photosynthesis"]
+        assert g.get_dependencies("Plant") == ["light", "water"]
+        back = g.walk("light", direction="backward", depth=1)
+        assert sorted(r["name"] for r in back) == ["plant", "sun"]
+        assert [p["name"] for p in g.find_path("sun", "photosynthesis")] == ["sun", "light", "photosynthesis"]
+        assert g.get_concept("Plant")["CORE"]["name"] == "Plant"
+
+        reloaded = GraphEngine(d)
+        assert reloaded.walk("sun", depth=2) == g.walk("sun", depth=2)
+        assert isinstance(reloaded._graph.fwd_indices, __import__("numpy").memmap)
+        print(f"✅ Stats: {reloaded.get_stats()}")
+
+
+def test_stale_snapshot_rebuilt():
+    print("\n=== TEST 2: Snapshot invalidated on concept change ===")
+    with tempfile.TemporaryDirectory() as root:
+        d = os.path.join(root, "concepts")
+        os.makedirs(d)
+        _concept(d, "Fire", produces=["Heat"])
+        GraphEngine(d)
+
+        time.sleep(0.01)
+        _concept(d, "Fire", produces=["Heat", "Smoke"])
+        g = GraphEngine(d)
+        assert g.get_implications("fire", depth=1) == ["heat", "smoke"]
+        print("✅ Rebuilt after edit")
+
+
+def test_empty_graph():
+    print("\n=== TEST 3: Empty graph ===")
+    g = CompiledGraph.compile([], {})
+    assert g.num_nodes == 0 and g.num_edges == 0
+    assert g.node_id("nothing") == -1
+    print("✅ Empty graph handled")
+
+
+def test_path_search():
+    print("\n=== TEST 4: Bidirectional path search ===")
+    with tempfile.TemporaryDirectory() as root:
+        d = os.path.join(root, "concepts")
+        os.makedirs(d)
+        _concept(d, "Sun", produces=["Light", "Heat"])
+        _concept(d, "Light", produces=["Photosynthesis"])
+        _concept(d, "Heat", produces=["Photosynthesis"], relational=[("warms", "Ocean")])
+        _concept(d, "Plant", requires=["Light"])
+        g = GraphEngine(d)
+
+        # Forward only: no edge leaves photosynthesis
+        assert g.find_path("photosynthesis", "sun") is None
+        back = g.find_path("photosynthesis", "sun", direction="backward")
+        assert [p["name"] for p in back] == ["photosynthesis", "light", "sun"]
+        assert all(p.get("reversed") for p in back[1:])
+
+        # Mixed directions: plant -requires-> light <-produces- sun
+        both = g.find_path("plant", "sun", direction="both")
+        assert [p["name"] for p in both] == ["plant", "light", "sun"]
+        assert "reversed" not in both[1] and both[2]["reversed"]
+
+        # Relation filter
+        assert g.find_path("sun", "ocean", relation_type="produces") is None
+        via = g.find_path("sun", "ocean", relation_type=["produces", "warms"])
+        assert [p["relation"] for p in via] == ["start", "produces", "warms"]
+        assert g.find_path("sun", "photosynthesis", max_depth=1) is None
+
+        paths = g.k_shortest_paths("sun", "photosynthesis", k=5)
+        assert [[p["name"] for p in path] for path in paths] == [
+            ["sun", "light", "photosynthesis"], ["sun", "heat", "photosynthesis"]]
+        print("✅ Directions, relation filter and k-shortest paths")
+
+
+def test_resave_keeps_mapped_readers():
+    print("\n=== TEST 5: Re-saving never rewrites files a reader has mmapped ===")
+    with tempfile.TemporaryDirectory() as root:
+        snap = os.path.join(root, "concepts_graph")
+        CompiledGraph.compile([("a", "produces", "b")], {"a": "a.json"}, "v1").save(snap)
+        reader = CompiledGraph.load(snap)
+        before = list(reader.fwd_indices), reader.name(0), reader.name(1)
+
+        edges = [(f"n{i}", "produces", f"n{i + 1}") for i in range(500)]
+        CompiledGraph.compile(edges, {"n0": "n0.json"}, "v2").save(snap)
+        assert (list(reader.fwd_indices), reader.name(0), reader.name(1)) == before  # Old inode untouched
+        assert CompiledGraph.load(snap).fingerprint == "v2" and CompiledGraph.load(snap).num_edges == 500
+        assert os.listdir(root) == ["concepts_graph"]  # No temp or retired dirs left behind
+    print("✅ Snapshot swapped as a whole directory")
+
+
+def test_missing_concept_files():
+    print("\n=== TEST 6: Concepts deleted or corrupted after the snapshot are skipped ===")
+    from system_a_cognitive.memory.concept_corpus import get_concept_corpus
+    with tempfile.TemporaryDirectory() as root:
+        d = os.path.join(root, "concepts")
+        os.makedirs(d)
+        for name in ["Sun", "Moon", "Star"]:
+            _concept(d, name)
+        g = GraphEngine(d)
+        os.remove(os.path.join(d, "moon.json"))
+        with open(os.path.join(d, "star.json"), "w") as f:
+            f.write("{not json")
+        get_concept_corpus(d).invalidate_stale()  # As seen by a process that had not parsed them
+
+        assert [name for name, _ in g._concept_cache.items()] == ["sun"]
+        assert [c["CORE"]["name"] for c in g._concept_cache.values()] == ["Sun"]
+        assert list(g._concept_cache) == ["sun"] and g._concept_cache.get("moon") is None
+    print("✅ items()/values() skip unreadable concepts instead of raising KeyError")
+
+
+if __name__ == "__main__":
+    test_compile_and_mmap_reload()
+    test_stale_snapshot_rebuilt()
+    test_empty_graph()
+    test_path_search()
+    test_resave_keeps_mapped_readers()
+    test_missing_concept_files()
+    print("\n=== ALL TESTS PASSED ===")
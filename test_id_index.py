@@ -0,0 +1,60 @@
+"""Test the persistent 'G,I' -> file index used by the Navigator"""
+import os
+import json
+import tempfile
+
+from system_a_cognitive.memory.id_index import ConceptIdIndex
+from system_a_cognitive.memory.concept_corpus import get_concept_corpus
+
+
+def _write(d, fname, data):
+    with open(os.path.join(d, fname), 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def test_build_and_reuse():
+    print("=== TEST 1: Build, persist, reuse ===")
+    with tempfile.TemporaryDirectory() as d:
+        concepts = os.path.join(d, "concepts")
+        os.makedirs(concepts)
+        _write(concepts, "cat.json", {"name": "Cat", "id": {"group": 21, "item": 61}})
+        _write(concepts, "paw.json", {"name": "Cat Paw", "id": {"group": 23, "item": 51}})
+        _write(concepts, "no_id.json", {"name": "Orphan"})
+        sidecar = os.path.join(d, "id_index.json")
+
+        index = ConceptIdIndex(concepts, sidecar)
+        assert index.build() == 3
+        assert index.resolve("21,61") == "cat.json"
+        assert index.name_of("23,51") == "Cat Paw"
+        assert "99,1" not in index
+        assert len(index) == 2
+        assert get_concept_corpus(concepts).get_stats()["cached"] == 0  # Cold build keeps no blocks resident
+
+        # Second start: nothing re-read
+        again = ConceptIdIndex(concepts, sidecar)
+        assert again.build() == 0
+        assert again.resolve("21,61") == "cat.json"
+        print("✅ Sidecar reused without parsing")
+
+
+def test_incremental_add():
+    print("\n=== TEST 2: Incremental add ===")
+    with tempfile.TemporaryDirectory() as d:
+        index = ConceptIdIndex(d, os.path.join(d, "id_index.json"))
+        index.build()
+        block = {"name": "Zorb", "id": {"group": 50, "item": 7}}
+        _write(d, "zorb.json", block)
+        index.add("zorb.json", block)
+        assert index.resolve("50,7") == "zorb.json"
+
+        block["id"]["item"] = 8
+        index.add("zorb.json", block)
+        assert index.resolve("50,7") is None
+        assert index.resolve("50,8") == "zorb.json"
+        print("✅ Learned concepts resolvable immediately")
+
+
+if __name__ == "__main__":
+    test_build_and_reuse()
+    test_incremental_add()
+    print("\n=== ALL TESTS PASSED ===")
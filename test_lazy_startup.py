@@ -0,0 +1,44 @@
+"""Test lazy Kernel subsystems and the startup profile"""
+from server.startup_profile import StartupProfile
+from main import WMCS_Kernel, lazy_subsystem
+
+
+def test_lazy_kernel():
+    print("=== TEST 1: Kernel construction defers heavy subsystems ===")
+    kernel = WMCS_Kernel()
+    for name in WMCS_Kernel.LAZY_SUBSYSTEMS:
+        assert name not in kernel.__dict__, name
+
+    kernel.llm_client = None  # Assignment overrides the factory (offline)
+    assert kernel.parser is kernel.parser and kernel.parser.llm is None
+    assert "generator" not in kernel.__dict__
+    print("✅ Built on first access, once")
+
+
+def test_descriptor_and_profile():
+    print("\n=== TEST 2: lazy_subsystem timing ===")
+    calls = []
+
+    class Box:
+        @lazy_subsystem
+        def heavy(self):
+            calls.append(1)
+            return object()
+
+    box = Box()
+    assert box.heavy is box.heavy and len(calls) == 1
+    assert Box().heavy is not box.heavy and len(calls) == 2
+
+    profile = StartupProfile()
+    with profile.measure("import", "thing"):
+        pass
+    profile.mark("ready")
+    assert [r["phase"] for r in profile.get_stats()] == ["import", "mark"]
+    profile.report(force=True)
+    print("✅ Per-instance cache, steps recorded")
+
+
+if __name__ == "__main__":
+    test_lazy_kernel()
+    test_descriptor_and_profile()
+    print("\n=== ALL TESTS PASSED ===")
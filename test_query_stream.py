@@ -0,0 +1,140 @@
+"""Test streamed completions, Kernel stage events and the /query/stream SSE endpoint"""
+import os
+import json
+import asyncio
+import tempfile
+
+from system_b_llm.interfaces.llm_provider import LLMProvider, LLMStreamError
+from system_b_llm.interfaces.response_cache import ResponseCache
+from test_query_stages import _kernel
+
+
+class StreamingProvider(LLMProvider):
+    """Offline provider that streams its answer word by word."""
+
+    def __init__(self):
+        self.model_name = "stream"
+        self.response_cache = None
+        self.streams = 0
+
+    def completion(self, system_prompt, user_prompt):
+        return "".join(self._stream_completion(system_prompt, user_prompt))
+
+    def _stream_completion(self, system_prompt, user_prompt):
+        self.streams += 1
+        for word in "Zorbs float. | 5. CONFIDENCE_SCORE: 90".split(" "):
+            yield word + " "
+
+    def json_completion(self, system_prompt, user_prompt):
+        return {}
+
+
+def test_stream_completion():
+    print("=== TEST 1: stream_completion chunks and shares the completion cache ===")
+    with tempfile.TemporaryDirectory() as d:
+        llm = StreamingProvider()
+        llm.response_cache = ResponseCache(os.path.join(d, "cache.sqlite"))
+        chunks = list(llm.stream_completion("sys", "q"))
+        assert len(chunks) == 6 and "".join(chunks).startswith("Zorbs float.")
+        assert llm.completion("sys", "q") == "".join(chunks) and llm.streams == 1  # Cached by the stream
+        assert list(llm.stream_completion("sys", "q")) == ["".join(chunks)]      # Hit: one chunk
+        assert llm.streams == 1
+    print(f"✅ {len(chunks)} chunks, then served from cache")
+
+
+def _streaming_kernel():
+    kernel = _kernel()
+    kernel.llm_client = StreamingProvider()
+    from system_b_llm.generators.response_generator import ResponseGenerator
+    kernel.generator = ResponseGenerator(kernel.llm_client)
+    return kernel
+
+
+ZORB = {"name": "Zorb", "id": {"group": 9, "item": 1}, "definition": "A floating pink orb.", "claims": []}
+
+
+def test_kernel_events():
+    print("\n=== TEST 2: process_query emits stage events in order ===")
+    kernel = _streaming_kernel()
+    events = []
+    result = kernel.process_query("What is a Zorb?", allow_research=False, injected_blocks=[dict(ZORB)],
+                                  on_event=lambda event, data: events.append((event, data)))
+    names = [e for e, _ in events]
+    assert names.index("entry_points") < names.index("reasoning_token") < names.index("grade") < names.index("answer_token")
+    answer = "".join(d["text"] for e, d in events if e == "answer_token")
+    assert answer == result["text"] and names.count("answer_token") == 6
+    assert not kernel.streaming  # Sink removed after the query
+
+    kernel.process_query("What is a Zorb?", allow_research=False, injected_blocks=[dict(ZORB)])
+    assert len(events) == len(names)  # No callback, no events
+    print(f"✅ {len(events)} events: {sorted(set(names))}")
+
+
+def test_sse_endpoint():
+    print("\n=== TEST 3: /query/stream SSE framing ===")
+    import server.api as api
+    api.kernel = _streaming_kernel()
+
+    async def collect():
+        response = api.stream_query("What is a Zorb?", allow_research=False)
+        return [chunk if isinstance(chunk, str) else chunk.decode() async for chunk in response.body_iterator]
+
+    api.kernel.block_exists = lambda key: key == "zorb"
+    api.kernel.get_block = lambda key: dict(ZORB)
+    api.kernel.lexical_index.search = lambda text, top_k=3, require_name=False: [("zorb.json", 1.0)]
+    frames = asyncio.run(collect())
+    events = [f.split("\n")[0][len("event: "):] for f in frames]
+    assert events[0] == "start" and events[-1] == "done"
+    done = json.loads(frames[-1].split("\n")[1][len("data: "):])
+    assert done["text"].startswith("Zorbs float.") and done["visited_nodes"] == ["9,1"]
+    assert "answer_token" in events and "grade" in events
+    print(f"✅ {len(frames)} SSE frames, ending in 'done'")
+
+
+class BrokenStreamProvider(StreamingProvider):
+    """Streams the first words of its answer, then the connection drops."""
+
+    def _stream_completion(self, system_prompt, user_prompt):
+        yield "Zorbs "
+        yield "are "
+        raise ConnectionError("stream reset")
+
+
+def test_stream_failure():
+    print("\n=== TEST 4: A broken stream ends in an error event, not a glued answer ===")
+    llm = BrokenStreamProvider()
+    chunks = []
+    try:
+        for chunk in llm.stream_completion("sys", "q"):
+            chunks.append(chunk)
+        assert False, "stream failure must raise"
+    except LLMStreamError as e:
+        assert e.partial == "Zorbs are " and "stream reset" in str(e)
+    assert chunks == ["Zorbs ", "are "]  # No error text appended to the answer
+
+    import server.api as api
+    api.kernel = _streaming_kernel()
+    api.kernel.llm_client = api.kernel.generator.llm = BrokenStreamProvider()
+    api.kernel.block_exists = lambda key: key == "zorb"
+    api.kernel.get_block = lambda key: dict(ZORB)
+    api.kernel.lexical_index.search = lambda text, top_k=3, require_name=False: [("zorb.json", 1.0)]
+
+    async def collect():
+        response = api.stream_query("What is a Zorb?", allow_research=False)
+        return [chunk if isinstance(chunk, str) else chunk.decode() async for chunk in response.body_iterator]
+
+    frames = asyncio.run(collect())
+    events = [f.split("\n")[0][len("event: "):] for f in frames]
+    assert events[-1] == "error" and "done" not in events
+    error = json.loads(frames[-1].split("\n")[1][len("data: "):])
+    assert error["partial"] and "stream reset" in error["detail"]
+    assert api.kernel.answer_cache.get_stats()["entries"] == 0  # Nothing cached
+    print(f"✅ Partial tokens voided by a terminal 'error': {error['detail']}")
+
+
+if __name__ == "__main__":
+    test_stream_completion()
+    test_kernel_events()
+    test_sse_endpoint()
+    test_stream_failure()
+    print("\n=== ALL TESTS PASSED ===")
@@ -0,0 +1,126 @@
+"""Test the on-disk LLM response cache wrapped around LLMProvider"""
+import os
+import time
+import tempfile
+
+from system_b_llm.interfaces.llm_provider import LLMProvider
+from system_b_llm.interfaces.response_cache import ResponseCache
+
+
+class CountingProvider(LLMProvider):
+    """Offline provider that counts how often it is really called."""
+
+    def __init__(self, model="fake-1"):
+        self.model_name = model
+        self.calls = 0
+
+    def completion(self, system_prompt, user_prompt):
+        self.calls += 1
+        if user_prompt == "fail":
+            return "Error connecting to Fake: boom"
+        return f"{system_prompt}|{user_prompt}|{self.calls}"
+
+    def json_completion(self, system_prompt, user_prompt):
+        return {"text": self.completion(system_prompt + " JSON", user_prompt)}
+
+    def embed_content(self, text):
+        self.calls += 1
+        return [float(len(text)), 1.0]
+
+
+def test_hits_and_bypass():
+    print("=== TEST 1: Hits, misses, bypass ===")
+    with tempfile.TemporaryDirectory() as d:
+        llm = CountingProvider()
+        llm.response_cache = ResponseCache(os.path.join(d, "cache.sqlite"))
+
+        first = llm.completion("sys", "hello")
+        assert llm.completion("sys", "hello") == first and llm.calls == 1
+        assert llm.completion("sys", "other") != first and llm.calls == 2
+
+        fresh = llm.completion("sys", "hello", bypass_cache=True)
+        assert fresh != first and llm.calls == 3
+        assert llm.completion("sys", "hello") == fresh  # Bypass refreshed the entry
+
+        # JSON and embeddings; nested completion not stored separately
+        assert llm.json_completion("s", "u") == llm.json_completion("s", "u")
+        assert llm.embed_content("abc") == [3.0, 1.0] and llm.embed_content("abc") == [3.0, 1.0]
+        assert llm.calls == 5
+
+        # Errors are not cached; other models do not share entries
+        llm.completion("sys", "fail")
+        llm.completion("sys", "fail")
+        assert llm.calls == 7
+        other = CountingProvider("fake-2")
+        other.response_cache = llm.response_cache
+        other.completion("sys", "hello")
+        assert other.calls == 1
+
+        stats = llm.response_cache.get_stats()
+        assert stats["hits"] == 4 and stats["bypasses"] == 1
+        print(f"✅ Stats: {stats}")
+
+
+def test_ttl_and_lru():
+    print("\n=== TEST 2: TTL and LRU eviction ===")
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "cache.sqlite")
+        cache = ResponseCache(path, ttl=0.05)
+        cache.put("k", "v")
+        assert cache.lookup("k") == (True, "v")
+        time.sleep(0.1)
+        assert cache.lookup("k") == (False, None)
+
+        cache = ResponseCache(path, ttl=0, max_bytes=1000)
+        for i in range(5):
+            cache.put(f"key{i}", "x" * 150)
+            time.sleep(0.01)
+        cache.lookup("key0")  # Touch: key0 becomes most recently used
+        for i in range(5, 8):
+            cache.put(f"key{i}", "x" * 150)
+        assert cache.lookup("key0")[0]
+        assert not cache.lookup("key1")[0]
+        assert cache.get_stats()["bytes"] <= 1000 and cache.evictions > 0
+
+        reopened = ResponseCache(path, ttl=0)
+        assert reopened.lookup("key7") == (True, "x" * 150)
+        print("✅ Expired and least recently used entries dropped; cache persists")
+
+
+class SearchingProvider(CountingProvider):
+    """Web-grounded completions and a fixed embedding model, like GeminiClient."""
+
+    def __init__(self, model="fake-1"):
+        super().__init__(model)
+        self.embedding_model = "embed-1"
+
+    def completion_with_search(self, system_prompt, user_prompt):
+        self.calls += 1
+        return f"search|{user_prompt}|{self.calls}"
+
+
+def test_search_and_embedding_keys():
+    print("\n=== TEST 3: Live search is opt-in; embeddings keyed on the embedding model ===")
+    with tempfile.TemporaryDirectory() as d:
+        cache = ResponseCache(os.path.join(d, "cache.sqlite"))
+        llm = SearchingProvider()
+        llm.response_cache = cache
+        first = llm.completion_with_search("sys", "news about zorbs")
+        assert llm.completion_with_search("sys", "news about zorbs") != first  # Always fetched fresh
+        assert cache.get_stats()["entries"] == 0
+        pinned = llm.completion_with_search("sys", "zorb history", use_cache=True)
+        assert llm.completion_with_search("sys", "zorb history", use_cache=True) == pinned
+
+        other = SearchingProvider(model="fake-2")  # Different chat model, same embedding model
+        other.response_cache = cache
+        llm.embed_content("abc")
+        other.embed_content("abc")
+        assert other.calls == 0 and other.embed_batch(["abc"]) == [[3.0, 1.0]] and other.calls == 0
+    print("✅ Search results not replayed; embeddings shared across chat models")
+
+
+if __name__ == "__main__":
+    test_hits_and_bypass()
+    test_ttl_and_lru()
+    test_search_and_embedding_keys()
+    print("\n=== ALL TESTS PASSED ===")
@@ -0,0 +1,261 @@
+"""Test VectorStore batching, search and persistence"""
+import os
+import json
+import time
+import tempfile
+
+import numpy as np
+
+from system_a_cognitive.memory.vector_store import VectorStore, concept_document
+from system_a_cognitive.memory.index_sync import sync_vector_index
+
+
+class FakeEmbedder:
+    """Deterministic offline embeddings; counts embedding requests."""
+
+    def __init__(self, dim=16):
+        self.dim = dim
+        self.requests = 0
+
+    def _vec(self, text):
+        rng = np.random.default_rng(abs(hash(text)) % (2 ** 32))
+        return rng.standard_normal(self.dim).tolist()
+
+    def embed_content(self, text):
+        self.requests += 1
+        return self._vec(text)
+
+    def embed_batch(self, texts):
+        self.requests += 1
+        return [self._vec(t) for t in texts]
+
+
+def _blocks(n):
+    return [{"name": f"Concept {i}", "id": {"group": 20, "item": i},
+             "claims": [{"predicate": "IS_A", "object": f"thing {i % 7}"}]} for i in range(n)]
+
+
+def test_batched_add():
+    print("=== TEST 1: Batched add ===")
+    client = FakeEmbedder()
+    store = VectorStore(client, batch_size=32)
+    assert store.add_concept_blocks(_blocks(100)) == 100
+    assert client.requests == 4  # ceil(100 / 32) requests, not 100
+    assert len(store.vectors) == 100
+
+    doc_id, text, meta = concept_document(_blocks(1)[0])
+    assert doc_id == "20,0" and text.startswith("Concept: Concept 0.") and meta["group"] == 20
+    assert meta["_STATUS"] == "ACTIVE" and meta["type"] == "UNKNOWN"
+    nested = {"CORE": {"id": {"group": 31, "item": 7}, "name": "Lever", "type": "simple machine"},
+              "_STATUS": "HYPOTHETICAL"}
+    nested_id, nested_text, meta = concept_document(nested)
+    assert nested_id == "31,7" and nested_text.startswith("Concept: Lever.")
+    assert meta == {"name": "Lever", "group": 31, "item": 7, "type": "simple machine", "_STATUS": "HYPOTHETICAL"}
+
+    hits = store.search(text, top_k=1, threshold=0.9)
+    assert hits[0]["id"] == "20,0" and hits[0]["score"] > 0.99
+    print("✅ 100 documents in 4 embedding requests")
+
+
+def test_incremental_sync():
+    print("\n=== TEST 2: Manifest-based incremental sync ===")
+    with tempfile.TemporaryDirectory() as root:
+        d = os.path.join(root, "concepts")
+        os.makedirs(d)
+        for block in _blocks(5):
+            with open(os.path.join(d, f"c{block['id']['item']}.json"), 'w') as f:
+                json.dump(block, f)
+        manifest = os.path.join(root, "chroma_db.manifest.json")
+        client = FakeEmbedder()
+        store = VectorStore(client)
+
+        stats = sync_vector_index(store, d, manifest)
+        assert stats["added"] == 5 and store.count() == 5
+
+        stats = sync_vector_index(store, d, manifest)
+        assert stats["unchanged"] == 5 and not (stats["added"] or stats["updated"])
+        requests = client.requests
+
+        # Edit one, touch one, delete one, add one
+        time.sleep(0.01)
+        edited = dict(_blocks(2)[1], name="Renamed")
+        with open(os.path.join(d, "c1.json"), 'w') as f:
+            json.dump(edited, f)
+        os.utime(os.path.join(d, "c2.json"))
+        os.remove(os.path.join(d, "c3.json"))
+        with open(os.path.join(d, "c9.json"), 'w') as f:
+            json.dump(dict(_blocks(10)[9]), f)
+
+        stats = sync_vector_index(store, d, manifest)
+        assert (stats["added"], stats["updated"], stats["removed"], stats["unchanged"]) == (1, 1, 1, 3)
+        assert client.requests == requests + 1  # One batch for the two re-embedded files
+        ids = sorted(item["id"] for item in store.vectors)
+        assert ids == ["20,0", "20,1", "20,2", "20,4", "20,9"]
+        assert [i["metadata"]["name"] for i in store.vectors if i["id"] == "20,1"] == ["Renamed"]
+        print(f"✅ Only changed files re-embedded: {stats}")
+
+
+def test_sync_schema_upgrade():
+    print("\n=== TEST 2b: Old manifest / pre-manifest index are re-embedded ===")
+    with tempfile.TemporaryDirectory() as root:
+        d = os.path.join(root, "concepts")
+        os.makedirs(d)
+        for block in _blocks(3):
+            with open(os.path.join(d, f"c{block['id']['item']}.json"), 'w') as f:
+                json.dump(block, f)
+        manifest = os.path.join(root, "chroma_db.manifest.json")
+
+        # Pre-series index: name/group metadata only, a stray "0,0" document, no manifest
+        legacy = VectorStore(FakeEmbedder())
+        legacy.add_many([(f"20,{i}", f"old {i}", {"name": f"Concept {i}", "group": 20}) for i in range(3)]
+                        + [("0,0", "old nested", {"name": "Lever", "group": 0})])
+        stats = sync_vector_index(legacy, d, manifest)
+        assert not stats["adopted"] and stats["added"] == 3 and stats["removed"] == 1
+        assert sorted(legacy.all_ids()) == ["20,0", "20,1", "20,2"]
+        assert all(m["_STATUS"] == "ACTIVE" and "type" in m for m in legacy.metadata)
+
+        # Manifest written by an older MANIFEST_VERSION: full re-embed, even with matching mtimes
+        with open(manifest) as f:
+            data = json.load(f)
+        with open(manifest, 'w') as f:
+            json.dump(dict(data, version=1), f)
+        for i in range(3):
+            legacy.metadata[i] = {"name": f"Concept {i}", "group": 20}
+        stats = sync_vector_index(legacy, d, manifest)
+        assert not stats["adopted"] and stats["added"] == 3 and stats["unchanged"] == 0
+        assert all("item" in m for m in legacy.metadata)
+
+        # No manifest, current schema: adopted without embedding
+        os.remove(manifest)
+        client = FakeEmbedder()
+        current = VectorStore(client)
+        current.add_concept_blocks(_blocks(3))
+        requests = client.requests
+        stats = sync_vector_index(current, d, manifest)
+        assert stats["adopted"] and client.requests == requests
+    print("✅ Outdated manifests and legacy metadata force a re-embed; current indexes are adopted")
+
+
+def test_matrix_search():
+    print("\n=== TEST 3: Matrix search / batch queries ===")
+    client = FakeEmbedder()
+    store = VectorStore(client)
+    docs = [(f"d{i}", f"text {i}", {"i": i}) for i in range(500)]
+    store.add_many(docs)
+    store.delete(["d3", "d7"])
+    assert store.count() == 498 and store.matrix.shape == (498, 16)
+    assert np.allclose(np.linalg.norm(store.matrix, axis=1), 1.0, atol=1e-5)
+
+    queries = ["text 1", "text 42", "unrelated"]
+    batched = store.search_many(queries, top_k=5, threshold=-1.0)
+    for query, hits in zip(queries, batched):
+        # Brute force reference
+        q = np.asarray(client._vec(query))
+        ref = sorted(((float(np.dot(q, np.asarray(client._vec(t))) /
+                        (np.linalg.norm(q) * np.linalg.norm(client._vec(t)))), d) for d, t, _ in docs
+                      if d not in ("d3", "d7")), reverse=True)[:5]
+        assert [h["id"] for h in hits] == [d for _, d in ref]
+        single = store.search(query, top_k=5, threshold=-1.0)
+        assert [h["id"] for h in single] == [h["id"] for h in hits]
+        assert np.allclose([h["score"] for h in single], [s for s, _ in ref], atol=1e-5)
+    assert batched[0][0]["id"] == "d1" and batched[0][0]["score"] > 0.99
+
+    # Threshold is applied after top-k: only the exact match survives
+    assert [h["id"] for h in store.search("text 42", top_k=5, threshold=0.9)] == ["d42"]
+    assert store.search_many([]) == []
+    print("✅ Batch search matches brute-force cosine ranking")
+
+
+def test_binary_index():
+    print("\n=== TEST 4: Memory-mapped binary index ===")
+    from system_a_cognitive.memory.vector_store import convert_json_index, index_paths
+    client = FakeEmbedder()
+    store = VectorStore(client)
+    store.add_many((f"d{i}", f"text {i} é", {"name": f"N{i}"}) for i in range(50))
+    with tempfile.TemporaryDirectory() as root:
+        legacy = os.path.join(root, "vector_index.json")
+        with open(legacy, "w", encoding="utf-8") as f:
+            json.dump([{"id": item["id"], "vector": (item["vector"] * 3).tolist(), "text": item["text"],
+                        "metadata": item["metadata"]} for item in store.vectors], f)
+
+        # Legacy JSON is converted once on load
+        loaded = VectorStore(client)
+        loaded.load_index(os.path.join(root, "vector_index"))
+        paths = index_paths(legacy)
+        assert all(os.path.exists(paths[k]) for k in ("matrix", "text", "meta"))
+        assert isinstance(loaded.matrix, np.memmap) and loaded.matrix.dtype == np.float16
+        assert loaded.count() == 50 and loaded.texts[7] == "text 7 é"
+        hits = loaded.search("text 7 é", top_k=2, threshold=0.0)
+        assert hits[0]["id"] == "d7" and abs(hits[0]["score"] - 1.0) < 1e-2
+        assert hits[0]["metadata"] == {"name": "N7"}
+
+        # First write copies into RAM; the mapped files are untouched until save
+        loaded.add("d50", "text 50")
+        loaded.delete(["d0"])
+        assert not isinstance(loaded.matrix, np.memmap) and loaded.count() == 50
+        loaded.save_index(legacy, dtype="float32")
+        again = VectorStore(client)
+        again.load_index(legacy)
+        assert sorted(again.ids) == sorted(loaded.ids) and again.matrix.dtype == np.float32
+        assert again.search("text 50", top_k=1)[0]["id"] == "d50"
+        assert convert_json_index(legacy, os.path.join(root, "copy")) == 50
+    print("✅ JSON converted, memmap load, copy-on-write, save/load round trip")
+
+
+def test_quantized_search():
+    print("\n=== TEST 5: int8 quantized scan + exact re-rank ===")
+    client = FakeEmbedder(dim=32)
+    exact, quantized = VectorStore(client), VectorStore(client, quantization="int8", rerank=4)
+    docs = [(f"d{i}", f"text {i}", {"i": i}) for i in range(400)]
+    exact.add_many(docs)
+    quantized.add_many(docs)
+    quantized.delete(["d5"])
+    exact.delete(["d5"])
+    assert quantized._codes.dtype == np.int8
+    assert len(quantized._matrix) == 0 and quantized._pending_rows == 400  # No float32 rows in RAM
+
+    queries = [f"text {i}" for i in range(0, 400, 37)] + ["something else"]
+    for want, got in zip(exact.search_many(queries, top_k=5, threshold=-1.0),
+                         quantized.search_many(queries, top_k=5, threshold=-1.0)):
+        assert [h["id"] for h in got] == [h["id"] for h in want]
+        # Re-ranked scores are exact, not quantized
+        assert np.allclose([h["score"] for h in got], [h["score"] for h in want], atol=1e-5)
+
+    with tempfile.TemporaryDirectory() as root:
+        base = os.path.join(root, "vector_index")
+        quantized.save_index(base)
+        loaded = VectorStore(client, quantization="int8")
+        loaded.load_index(base)
+        assert loaded.matrix.dtype == np.float32 and isinstance(loaded.matrix, np.memmap)
+        assert np.array_equal(loaded._codes, quantized._codes[:quantized.count()])
+        assert loaded.search("text 74", top_k=1)[0]["id"] == "d74"
+
+        # Writes after load go to the append file; the mapped matrix is never copied into RAM
+        mapped = loaded._matrix
+        loaded.add_many([("d74", "text 400", {}), ("d900", "text 900", {})])
+        exact.add_many([("d74", "text 400", {}), ("d900", "text 900", {})])
+        assert loaded._matrix is mapped and loaded._pending_rows == 2
+        for want, got in zip(exact.search_many(queries + ["text 400"], top_k=5, threshold=-1.0),
+                             loaded.search_many(queries + ["text 400"], top_k=5, threshold=-1.0)):
+            assert [h["id"] for h in got] == [h["id"] for h in want]
+        assert np.allclose(np.asarray(loaded.matrix), exact.matrix[[exact._pos[i] for i in loaded.ids]], atol=1e-6)
+        loaded.save_index(base)  # Folds the pending rows into the matrix
+        assert loaded._pending is None and isinstance(loaded.matrix, np.memmap) and len(loaded.matrix) == 400
+        assert loaded.search("text 900", top_k=1)[0]["id"] == "d900"
+
+        # Codes are rebuilt from the matrix when the index was saved unquantized
+        exact.save_index(base)
+        rebuilt = VectorStore(client, quantization="int8")
+        rebuilt.load_index(base)
+        assert len(rebuilt._codes) == 400 and rebuilt.search("text 73", top_k=1)[0]["id"] == "d73"
+    print("✅ Quantized search returns the exact top-k and scores")
+
+
+if __name__ == "__main__":
+    test_batched_add()
+    test_incremental_sync()
+    test_sync_schema_upgrade()
+    test_matrix_search()
+    test_binary_index()
+    test_quantized_search()
+    print("\n=== ALL TESTS PASSED ===")
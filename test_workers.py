@@ -0,0 +1,159 @@
+"""Test the multi-worker writer RPC and snapshot publishing"""
+import os
+import json
+import tempfile
+import threading
+
+from server.workers import WriterService, SnapshotFollower, RemoteVectorStore, RemoteStrategyStore
+
+
+class FakeKernel:
+    def __init__(self):
+        self.taught = []
+        self.refreshes = 0
+
+    def process_query(self, text):
+        self.taught.append(text)
+        return {"text": f"I have learned 1 new concept(s): {text[len('/teach '):]}.", "visited_nodes": []}
+
+    def _trigger_reflex(self, text):
+        raise RuntimeError("no network")
+
+    def refresh_snapshot(self):
+        self.refreshes += 1
+
+
+def test_writer_across_fork():
+    print("=== TEST 1: Forked worker writes through the parent ===")
+    writer_kernel = FakeKernel()
+    writer = WriterService(writer_kernel)
+    client = writer.client()
+    read_pipe, write_pipe = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:  # Worker: its own kernel, follows the shared version
+        try:
+            worker_kernel = FakeKernel()
+            follower = SnapshotFollower(worker_kernel, writer.version)
+            ok = "floating pink orb" in client.call("teach", "A Zorb is a floating pink orb.")["text"]
+            try:
+                client.call("research", "zorb")
+                ok = False
+            except RuntimeError as e:
+                ok = ok and "no network" in str(e)
+            ok = ok and follower.sync() and not follower.sync() and worker_kernel.refreshes == 1
+            os.write(write_pipe, b"1" if ok else b"0")
+        except Exception:
+            os.write(write_pipe, b"0")
+        finally:
+            os._exit(0)
+
+    writer.start()  # Listening only after the fork, like serve()
+    os.waitpid(pid, 0)
+    assert os.read(read_pipe, 1) == b"1"
+    assert writer_kernel.taught == ["/teach A Zorb is a floating pink orb."]
+    assert writer.version.value == 1 and writer.writes == 1  # The failed research published nothing
+    writer.close()
+    print("✅ Teach applied by the writer, version published, error propagated")
+
+
+def test_follower_threads():
+    print("\n=== TEST 2: Concurrent requests refresh once per version ===")
+    kernel = FakeKernel()
+    writer = WriterService(kernel)
+    follower = SnapshotFollower(kernel, writer.version)
+    writer.version.value = 3
+    threads = [threading.Thread(target=follower.sync) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert kernel.refreshes == 1 and follower.seen == 3
+    print("✅ One refresh for 8 racing requests")
+
+
+def test_preload_before_fork():
+    print("\n=== TEST 3: Pre-fork load and read-only snapshot refresh ===")
+    from main import WMCS_Kernel
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        os.makedirs(os.path.join(root, "data", "concepts"))
+        with open(os.path.join(root, "data", "concepts", "zorb.json"), "w") as f:
+            json.dump({"name": "Zorb", "id": {"group": 9, "item": 1}, "definition": "A floating pink orb."}, f)
+        os.chdir(root)
+        try:
+            kernel = WMCS_Kernel()
+            threads = threading.active_count()
+            kernel.load_data(vectors=False)
+            assert "vector_store" not in kernel.__dict__ and threading.active_count() == threads
+            assert kernel.get_block_by_id("9,1")["name"] == "Zorb"
+
+            # The writer adds a concept; the worker refreshes
+            with open(os.path.join("data", "concepts", "blip.json"), "w") as f:
+                json.dump({"name": "Blip", "id": {"group": 9, "item": 2}, "definition": "A tiny sound."}, f)
+            os.remove(os.path.join("data", "id_index.json"))
+            os.remove(os.path.join("data", "bm25_index.json"))
+            old_ids, old_lexical = kernel.id_index, kernel.lexical_index
+            kernel.refresh_snapshot()
+            assert kernel.id_index is not old_ids and kernel.lexical_index is not old_lexical  # Swapped, not cleared
+            assert len(old_ids) == 1 and len(old_lexical) == 1
+            assert kernel.get_block_by_id("9,2")["name"] == "Blip"
+            assert kernel.lexical_index.search("tiny sound")[0][0] == "blip.json"
+            assert not os.path.exists(os.path.join("data", "id_index.json"))  # Workers never write sidecars
+            assert not os.path.exists(os.path.join("data", "bm25_index.json"))
+            assert "zorb" in kernel.block_cache  # Unchanged concept stays cached
+
+            # The writer edits Zorb; the worker follows through its SnapshotFollower
+            writer = WriterService(FakeKernel())
+            kernel.snapshot_follower = SnapshotFollower(kernel, writer.version)
+            with open(os.path.join("data", "concepts", "zorb.json"), "w") as f:
+                json.dump({"name": "Zorb", "id": {"group": 9, "item": 1}, "definition": "A sinking grey orb."}, f)
+            os.utime(os.path.join("data", "concepts", "zorb.json"), (1, 1))
+            kernel.get_block("blip")
+            writer.version.value += 1
+            kernel._follow_writer()
+            assert kernel.snapshot_follower.seen == 1 and not kernel.snapshot_follower.sync()  # No second rescan
+            assert "zorb" not in kernel.block_cache and "blip" in kernel.block_cache  # Only the edited block evicted
+            assert kernel.get_block("zorb")["definition"] == "A sinking grey orb."
+        finally:
+            os.chdir(cwd)
+    print("✅ Vectors left to the writer; indexes swapped in, only stale blocks evicted, sidecars untouched")
+
+
+class FakeVectors:
+    def search_many(self, queries, top_k=3, threshold=0.0, **filters):
+        return [[{"id": "9,1", "score": 0.9, "metadata": {"name": q, **filters}}] for q in queries]
+
+    def count(self):
+        return 1
+
+
+class FakeStrategies:
+    def recall_strategies(self, context_query, top_k=3):
+        return [f"Check the definition first ({top_k})."]
+
+
+def test_remote_vector_reads():
+    print("\n=== TEST 4: Worker vector reads run on the writer's store ===")
+    kernel = FakeKernel()
+    kernel.vector_store, kernel.strategy_store = FakeVectors(), FakeStrategies()
+    writer = WriterService(kernel)
+    writer.start()
+    try:
+        vectors, strategies = RemoteVectorStore(writer.client()), RemoteStrategyStore(writer.client())
+        hit = vectors.search("Zorb", top_k=3, threshold=0.45, types=["OBJECT"])[0]
+        assert hit["id"] == "9,1" and hit["metadata"] == {"name": "Zorb", "types": ["OBJECT"]}
+        assert vectors.count() == 1
+        assert strategies.recall_strategies("what is a zorb", top_k=2) == ["Check the definition first (2)."]
+        assert writer.version.value == 0 and writer.writes == 0  # Reads publish nothing
+    finally:
+        writer.close()
+    print("✅ Search and strategy recall answered by the single Chroma owner")
+
+
+if __name__ == "__main__":
+    test_writer_across_fork()
+    test_follower_threads()
+    test_preload_before_fork()
+    test_remote_vector_reads()
+    print("\n=== ALL TESTS PASSED ===")
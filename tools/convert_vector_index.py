@@ -0,0 +1,23 @@
+import os
+import sys
+import argparse
+from termcolor import colored
+
+sys.path.append(os.getcwd())
+from system_a_cognitive.memory.vector_store import convert_json_index, index_paths
+
+def convert(json_path, dtype):
+    print(colored(f"Converting {json_path} -> binary index ({dtype})...", "cyan"))
+    count = convert_json_index(json_path, dtype=dtype)
+    paths = index_paths(json_path)
+    before = os.path.getsize(json_path)
+    after = sum(os.path.getsize(paths[k]) for k in ("matrix", "text", "meta"))
+    print(colored(f"Wrote {count} vectors: {before / 1024:.0f} KB -> {after / 1024:.0f} KB ({before / max(after, 1):.1f}x smaller).", "green"))
+    print(f"  {paths['matrix']}\n  {paths['text']}\n  {paths['meta']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="One-shot converter: JSON vector index -> memory-mapped binary index")
+    parser.add_argument("json_path", nargs="?", default="data/vector_index.json")
+    parser.add_argument("--dtype", choices=["float16", "float32"], default="float16")
+    args = parser.parse_args()
+    convert(args.json_path, args.dtype)
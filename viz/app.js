@@ -45,7 +45,18 @@ async function initGraph() {
 
 // --- TELEMETRY LOOP ---
 function startPolling() {
-    setInterval(pollLogs, 1500); // 1.5s for logs
+    // Logs are pushed over SSE; fall back to polling if the stream is unavailable
+    if (window.EventSource) {
+        const logs = new EventSource(`${API_URL}/logs/stream?since=${lastLogTime}`);
+        logs.addEventListener('log', (e) => {
+            const entry = JSON.parse(e.data);
+            if (entry.timestamp <= lastLogTime) return; // Backlog replayed after a reconnect
+            logToTerminal(entry.message, entry.color, entry.time_str);
+            lastLogTime = entry.timestamp;
+        });
+    } else {
+        setInterval(pollLogs, 1500); // 1.5s for logs
+    }
     setInterval(pollStatus, 3000); // 3s for stats
 }
 
@@ -104,7 +115,61 @@ function logToTerminal(msg, color = 'white', timeStr = null) {
 }
 
 // --- CHAT LOGIC ---
-async function sendQuery() {
+function sendQuery() {
+    if (!window.EventSource) return sendQueryBlocking();
+    if (isBusy) return;
+
+    const input = document.getElementById('query-input');
+    const text = input.value.trim();
+    if (!text) return;
+
+    addChatMessage(text, 'user');
+    input.value = '';
+    setBusy(true);
+
+    // Answer bubble filled token by token; a research reflex restarts it
+    const answer = addChatMessage('…', 'ai');
+    let streamed = '';
+    const source = new EventSource(`${API_URL}/query/stream?text=${encodeURIComponent(text)}`);
+    const finish = () => { source.close(); setBusy(false); };
+
+    source.addEventListener('entry_points', (e) => {
+        const names = JSON.parse(e.data).names;
+        logToTerminal(`[STREAM] Entry points: ${names.join(', ') || 'none'}`, 'green');
+    });
+    source.addEventListener('hop', (e) => {
+        const hop = JSON.parse(e.data);
+        logToTerminal(`[STREAM] ${hop.source} -> ${hop.target} (${hop.confidence})`, 'cyan');
+    });
+    source.addEventListener('grade', (e) => {
+        logToTerminal(`[STREAM] Grade: ${JSON.parse(e.data).grade}`, 'magenta');
+    });
+    source.addEventListener('reflex', () => {
+        streamed = '';
+        answer.innerText = 'Researching…';
+    });
+    source.addEventListener('answer_token', (e) => {
+        streamed += JSON.parse(e.data).text;
+        answer.innerText = streamed;
+    });
+    source.addEventListener('done', (e) => {
+        const data = JSON.parse(e.data);
+        answer.innerText = data.text || "Received empty response.";
+        if (data.visited_nodes && Graph) {
+            highlightNodes(data.visited_nodes);
+        }
+        finish();
+    });
+    source.addEventListener('error', (e) => {
+        // Server-sent 'error' carries a detail; a dropped connection does not
+        const detail = e.data ? JSON.parse(e.data).detail : 'Stream interrupted';
+        answer.innerText = `Error: ${detail}`;
+        logToTerminal(`[API ERROR] ${detail}`, 'red');
+        finish();
+    });
+}
+
+async function sendQueryBlocking() {
     if (isBusy) return;
 
     const input = document.getElementById('query-input');
@@ -151,6 +216,7 @@ function addChatMessage(text, role) {
     div.innerText = text;
     hist.appendChild(div);
     hist.scrollTop = hist.scrollHeight;
+    return div;
 }
 
 function setBusy(busy) {